@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class AccountsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'accounts'
+
+    def ready(self):
+        # 사용자 캐시 무효화 시그널 수신자 등록 (관리자 사이트/관리 명령어의 변경도 반영)
+        from . import cache  # noqa: F401
@@ -0,0 +1,137 @@
+"""읽기 API 의 async 버전 (ASGI 프로필)
+
+settings.ASYNC_VIEWS 가 True 이면 urls.py 가 views.py 의 같은 이름 뷰 대신
+이 모듈의 뷰를 연결합니다. 쿼리는 Django async ORM 으로 실행하므로 느린
+쿼리를 기다리는 동안에도 워커가 다른 요청을 처리할 수 있습니다.
+응답 형식과 쿼리 수는 동기 뷰와 같습니다.
+
+조회 조건/정렬/ETag/커서 처리와 응답 생성은 views.py 의 함수를 같이 쓰고,
+여기서는 쿼리 실행만 async 로 합니다.
+
+Django 4.2 의 csrf_exempt / require_http_methods 는 코루틴 함수를 감싸지
+못하므로(감싼 함수가 동기 함수가 됨) 같은 동작을 하는 _csrf_exempt /
+_require_get 을 씁니다. 데코레이터 구성은 views.py 의 같은 뷰와 같습니다.
+"""
+import logging
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, HttpResponseNotAllowed
+
+from . import cache, ledger, views
+from .query_budget import query_budget
+from .serialization import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _csrf_exempt(view_func):
+    """async 뷰용 csrf_exempt (CsrfViewMiddleware 가 보는 속성만 설정)"""
+    view_func.csrf_exempt = True
+    return view_func
+
+
+def _require_get(view_func):
+    """async 뷰용 require_http_methods(["GET"])"""
+    @wraps(view_func)
+    async def inner(request, *args, **kwargs):
+        if request.method != 'GET':
+            return HttpResponseNotAllowed(['GET'])
+        return await view_func(request, *args, **kwargs)
+
+    return inner
+
+
+def _load_user(request):
+    # request.user 는 처음 접근할 때 세션/사용자를 동기 ORM 으로 조회함
+    request.user.is_authenticated
+    return request.user
+
+
+async def _aget_user(request):
+    """인증 사용자를 스레드에서 읽어옵니다. (Django 4.2 에는 request.auser() 가 없음)"""
+    return await sync_to_async(_load_user)(request)
+
+
+@_csrf_exempt
+@_require_get
+# 세션 1 + 사용자 캐시 채우기 1, 비밀번호가 바뀐 세션은 flush(조회 1 + 삭제 1)
+@query_budget(4)
+async def auth_status(request):
+    """로그인 상태 확인 (세션의 사용자 정보)"""
+    return JsonResponse(views._auth_status_response(await _aget_user(request)))
+
+
+@_csrf_exempt
+@_require_get
+@query_budget(4)
+async def category_list(request):
+    """카테고리 목록 조회"""
+    try:
+        user = await _aget_user(request)
+        if not user.is_authenticated:
+            return JsonResponse({
+                'status': 'error',
+                'message': '로그인이 필요합니다.'
+            }, status=401)
+
+        payload = await cache.aget_category_payload()
+        return views._category_list_response(request, payload)
+
+    except Exception:
+        logger.exception('category_list 처리 중 오류')
+        return JsonResponse({
+            'status': 'error',
+            'message': '서버 오류가 발생했습니다.'
+        }, status=500)
+
+
+@_csrf_exempt
+@query_budget(4)
+async def transaction_list(request):
+    """거래 내역 목록 조회 (조회 조건/정렬은 views.transaction_list 와 동일)"""
+    if request.method == 'GET':
+        user = await _aget_user(request)
+        if not user.is_authenticated:
+            return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
+
+        try:
+            version = await ledger.acurrent_version(user.id)
+            query = views._transaction_list_query(request, user.id, version)
+            if isinstance(query, HttpResponse):
+                return query
+
+            etag, transactions, page = query
+            rows = [row async for row in transactions]
+            return views._transaction_list_response(rows, version, etag, page)
+
+        except Exception as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+
+
+@_csrf_exempt
+@query_budget(4)
+async def transaction_summary(request):
+    """월별/카테고리별 수입·지출 합계 조회 (일별 집계 테이블에서 GROUP BY)"""
+    if request.method == 'GET':
+        user = await _aget_user(request)
+        if not user.is_authenticated:
+            return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
+
+        try:
+            querysets = views._summary_querysets(request, user)
+            if isinstance(querysets, HttpResponse):
+                return querysets
+
+            monthly, by_category = querysets
+            return JsonResponse(views._summary_response(
+                [row async for row in monthly],
+                [row async for row in by_category]
+            ))
+
+        except Exception as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
@@ -0,0 +1,179 @@
+"""성능 측정용 공용 도구 (데이터 시딩, 실행 계획 분석)
+
+benchmark 계열 관리 명령어에서 함께 사용합니다.
+"""
+import json
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+
+from .models import User, Category, Transaction
+from . import rollup
+
+# 벤치마크용으로 만든 데이터 식별 접두사
+BENCH_PREFIX = 'bench_'
+
+
+def require_postgresql():
+    """PostgreSQL 전용 기능 사용 전 DB 엔진을 확인합니다."""
+    if connection.vendor != 'postgresql':
+        raise RuntimeError('PostgreSQL 데이터베이스에서만 실행할 수 있습니다.')
+
+
+def seed_ledger(users=100, transactions_per_user=10000, categories=20, password=None, stdout=None):
+    """벤치마크 사용자/카테고리/거래 내역을 생성합니다.
+
+    거래 내역은 generate_series 를 이용한 INSERT ... SELECT 로 사용자당
+    쿼리 한 번에 넣으므로 수백만 건도 몇 분 안에 생성됩니다.
+    password 를 주면 모든 벤치마크 사용자가 그 비밀번호로 로그인할 수 있고,
+    없으면 로그인할 수 없는 비밀번호로 만듭니다.
+
+    반환값: 생성된 벤치마크 사용자 id 목록
+    """
+    require_postgresql()
+    started = time.perf_counter()
+    password = make_password(password)
+
+    existing = User.objects.filter(username__startswith=BENCH_PREFIX).count()
+    User.objects.bulk_create([
+        User(
+            username=f'{BENCH_PREFIX}user{i}',
+            email=f'{BENCH_PREFIX}user{i}@example.com',
+            password=password
+        )
+        for i in range(existing, users)
+    ], batch_size=1000)
+    user_ids = list(
+        User.objects.filter(username__startswith=BENCH_PREFIX)
+        .order_by('id').values_list('id', flat=True)[:users]
+    )
+    # 이전 시딩으로 만든 사용자도 같은 비밀번호를 쓰도록
+    User.objects.filter(id__in=user_ids).update(password=password)
+
+    owner_id = user_ids[0]
+    category_types = [choice[0] for choice in Category.TYPE_CHOICES]
+    existing = Category.objects.filter(name__startswith=BENCH_PREFIX).count()
+    Category.objects.bulk_create([
+        Category(
+            type=category_types[i % len(category_types)],
+            name=f'{BENCH_PREFIX}category{i}',
+            created_by_id=owner_id
+        )
+        for i in range(existing, categories)
+    ])
+    category_ids = list(
+        Category.objects.filter(name__startswith=BENCH_PREFIX)
+        .order_by('id').values_list('id', flat=True)[:categories]
+    )
+
+    sql = f"""
+        INSERT INTO {Transaction._meta.db_table}
+            (user_id, category_id, transaction_type, amount, description,
+             transaction_date, memo, version, created_at, updated_at)
+        SELECT
+            %s,
+            (%s::bigint[])[1 + (g %% %s)],
+            CASE WHEN g %% 4 = 0 THEN 'income' ELSE 'expense' END,
+            ((g * 7919) %% 1000000) / 100.0,
+            'bench transaction ' || g,
+            CURRENT_DATE - (g %% 1825),
+            NULL,
+            0,
+            now() - (g || ' seconds')::interval,
+            now()
+        FROM generate_series(1, %s) AS g
+    """
+    with connection.cursor() as cursor:
+        for index, user_id in enumerate(user_ids, start=1):
+            cursor.execute(sql, [user_id, category_ids, len(category_ids), transactions_per_user])
+            if stdout and index % 100 == 0:
+                stdout.write(f'  {index}/{len(user_ids)} 사용자 시딩 완료')
+        cursor.execute(f'ANALYZE {Transaction._meta.db_table}')
+    # 원시 INSERT 는 일별 집계를 갱신하지 않으므로 다시 계산
+    for user_id in user_ids:
+        rollup.rebuild(user_id)
+
+    if stdout:
+        total = len(user_ids) * transactions_per_user
+        stdout.write(f'거래 내역 {total}건 생성 ({time.perf_counter() - started:.1f}초)')
+    return user_ids
+
+
+def cleanup_ledger():
+    """seed_ledger 로 만든 데이터를 모두 삭제합니다."""
+    require_postgresql()
+    user_ids = list(User.objects.filter(username__startswith=BENCH_PREFIX).values_list('id', flat=True))
+    with connection.cursor() as cursor:
+        # ORM delete 는 수백만 건을 메모리로 읽어오므로 직접 삭제
+        cursor.execute(
+            f'DELETE FROM {Transaction._meta.db_table} WHERE user_id = ANY(%s)', [user_ids]
+        )
+    Category.objects.filter(name__startswith=BENCH_PREFIX).delete()
+    User.objects.filter(id__in=user_ids).delete()
+
+
+def explain(queryset, analyze=True):
+    """queryset 의 PostgreSQL 실행 계획(JSON)을 반환합니다."""
+    require_postgresql()
+    sql, params = queryset.query.sql_with_params()
+    options = 'ANALYZE, BUFFERS, FORMAT JSON' if analyze else 'FORMAT JSON'
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN ({options}) {sql}', params)
+        result = cursor.fetchone()[0]
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]
+
+
+def plan_nodes(plan):
+    """실행 계획 트리의 모든 노드를 순회합니다."""
+    node = plan.get('Plan', plan)
+    yield node
+    for child in node.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+def partition_names(table):
+    """파티션 테이블이면 (파티션 이름 집합, {파티션 인덱스명: 부모 인덱스명}), 아니면 빈 값"""
+    require_postgresql()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, parent.relname, parent.relkind
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+               OR pg_inherits.inhparent IN (SELECT indexrelid FROM pg_index WHERE indrelid = to_regclass(%s))
+            """,
+            [table, table]
+        )
+        rows = cursor.fetchall()
+    partitions = {child for child, _, kind in rows if kind == 'p'}
+    indexes = {child: parent for child, parent, kind in rows if kind == 'I'}
+    return partitions, indexes
+
+
+def scan_summary(plan, table):
+    """table 을 읽는 스캔 노드들의 (노드 유형, 인덱스명) 목록을 반환합니다.
+
+    파티션 테이블이면 각 파티션의 스캔을 모으고 인덱스명은 부모 인덱스명으로
+    바꿔 중복을 없앱니다. 페이지를 하나도 읽지 않은 파티션(빈 미래/DEFAULT
+    파티션)의 스캔은 제외합니다.
+    """
+    partitions, indexes = partition_names(table)
+    scans = []
+    for node in plan_nodes(plan):
+        relation = node.get('Relation Name')
+        index = node.get('Index Name')
+        if relation in partitions and not (node.get('Shared Hit Blocks', 1) or node.get('Shared Read Blocks')):
+            continue
+        if relation == table or relation in partitions or (
+            node['Node Type'] == 'Bitmap Index Scan'
+            and (index in indexes or (index or '').startswith(('idx_' + table, table)))
+        ):
+            scan = (node['Node Type'], indexes.get(index, index))
+            if scan not in scans:
+                scans.append(scan)
+    return scans
@@ -0,0 +1,177 @@
+"""조회 결과 캐시
+
+카테고리 목록은 모든 사용자에게 같으므로 직렬화된 응답 본문을 통째로
+캐시하고, 카테고리를 바꾸는 뷰(category_create/update/delete, user_delete)
+에서 무효화합니다. 무효화는 그 요청을 처리한 프로세스의 캐시에만 적용될 수
+있으므로(locmem) 유지 시간은 CATEGORY_CACHE_TIMEOUT 으로 제한합니다.
+캐시 항목에는 만들기 시작할 때 읽은 세대(CATEGORY_GENERATION_KEY)를 함께
+저장하고, 무효화는 세대를 즉시 한 번, 커밋 후 한 번 더 올립니다. 쓰기 도중
+이전 목록을 읽은 요청이 무효화 뒤에 캐시를 채워도 세대가 달라 다음 조회에서
+다시 만들므로, 유지 시간이 없는(None) 캐시에도 이전 목록이 남지 않습니다.
+
+세션 인증용 사용자 정보(CachedAuthenticationMiddleware)도 사용자별로
+캐시하고, User 의 post_save/post_delete 시그널에서 무효화합니다. 뷰뿐 아니라
+관리자 사이트, changepassword 명령어 등 모델을 저장하는 모든 경로가 포함됩니다.
+
+무효화 직후 복제 지연으로 이전 값이 다시 캐시되지 않도록 캐시를 채울 때는
+복제본이 아닌 기본 DB 에서 읽습니다(replicas.primary).
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction as db_transaction
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Category, User
+from . import serialization
+from .replicas import primary
+
+CACHE_ALIAS = 'default'
+CATEGORY_LIST_KEY = 'category_list:v2'
+CATEGORY_CHANGED_AT_KEY = 'category_list:changed_at'
+CATEGORY_GENERATION_KEY = 'category_list:generation'
+AUTH_USER_KEY = 'auth_user:v1:{}'
+# 캐시에 담는 사용자 필드 (뷰의 로그인/admin 확인에 쓰는 값, 나머지는 접근할 때 조회)
+# Model.from_db 가 모델 필드 순서의 값을 기대하므로 모델 정의 순서로 정렬
+AUTH_USER_FIELDS = [
+    field.attname for field in User._meta.concrete_fields
+    if field.attname in {'id', 'username', 'email', 'is_active', 'is_staff', 'is_superuser', 'is_admin'}
+]
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def build_category_list():
+    """category_list 응답의 카테고리 목록을 만듭니다."""
+    categories = Category.objects.order_by('type', 'name').values_list(
+        *serialization.CATEGORY_VALUES
+    )
+    return serialization.serialize_categories(categories)
+
+
+def get_category_payload():
+    """캐시된 카테고리 목록 응답을 반환합니다. 없으면 만들어 캐시합니다.
+
+    반환값: {'body': JSON bytes, 'etag': ETag, 'last_modified': epoch 초, 'generation': 세대}
+    """
+    cached = _cache().get_many([CATEGORY_LIST_KEY, CATEGORY_GENERATION_KEY, CATEGORY_CHANGED_AT_KEY])
+    generation = cached.get(CATEGORY_GENERATION_KEY, 0)
+    payload = cached.get(CATEGORY_LIST_KEY)
+    if payload is not None and payload.get('generation') == generation:
+        return payload
+
+    # 세대는 DB 를 읽기 전에 읽음 (읽는 사이 무효화되면 다음 조회에서 다시 만듦)
+    with primary():
+        updated_at = Category.objects.aggregate(updated_at=Max('updated_at'))['updated_at']
+        category_list = build_category_list()
+    payload = _build_payload(category_list, updated_at, cached.get(CATEGORY_CHANGED_AT_KEY, 0), generation)
+    _cache().set(CATEGORY_LIST_KEY, payload, timeout=settings.CATEGORY_CACHE_TIMEOUT)
+    return payload
+
+
+async def aget_category_payload():
+    """get_category_payload 의 async 버전 (async ORM / 캐시 API 사용)"""
+    cached = await _cache().aget_many([CATEGORY_LIST_KEY, CATEGORY_GENERATION_KEY, CATEGORY_CHANGED_AT_KEY])
+    generation = cached.get(CATEGORY_GENERATION_KEY, 0)
+    payload = cached.get(CATEGORY_LIST_KEY)
+    if payload is not None and payload.get('generation') == generation:
+        return payload
+
+    with primary():
+        updated_at = (await Category.objects.aaggregate(updated_at=Max('updated_at')))['updated_at']
+        categories = Category.objects.order_by('type', 'name').values_list(
+            *serialization.CATEGORY_VALUES
+        )
+        category_list = serialization.serialize_categories([row async for row in categories])
+    payload = _build_payload(category_list, updated_at, cached.get(CATEGORY_CHANGED_AT_KEY, 0), generation)
+    await _cache().aset(CATEGORY_LIST_KEY, payload, timeout=settings.CATEGORY_CACHE_TIMEOUT)
+    return payload
+
+
+def _build_payload(category_list, updated_at, changed_at, generation):
+    body = serialization.dumps({
+        'status': 'success',
+        'categories': category_list,
+        'total_count': len(category_list)
+    })
+
+    # 삭제는 updated_at 최댓값을 바꾸지 않으므로 마지막 변경 시각도 함께 반영
+    last_modified = int(changed_at)
+    if updated_at:
+        last_modified = max(last_modified, int(updated_at.timestamp()))
+
+    return {
+        'body': body,
+        'etag': '"%s"' % hashlib.md5(body).hexdigest(),
+        'last_modified': last_modified,
+        'generation': generation,
+    }
+
+
+def invalidate_categories():
+    """카테고리가 바뀐 뒤 호출합니다."""
+    _cache().set(CATEGORY_CHANGED_AT_KEY, int(time.time()), timeout=None)
+    _bump_category_generation()
+    # 커밋 전에 다른 요청이 이전 목록을 새 세대로 캐시했을 수 있으므로 커밋 후 한 번 더 올림
+    db_transaction.on_commit(_bump_category_generation)
+
+
+def _bump_category_generation():
+    cache = _cache()
+    cache.add(CATEGORY_GENERATION_KEY, 0, timeout=None)
+    try:
+        cache.incr(CATEGORY_GENERATION_KEY)
+    except ValueError:
+        # add 와 incr 사이에 키가 밀려난 경우
+        cache.set(CATEGORY_GENERATION_KEY, 1, timeout=None)
+    cache.delete(CATEGORY_LIST_KEY)
+
+
+def get_auth_user(user_id):
+    """세션 인증용 (사용자, 세션 인증 해시)를 반환합니다. 사용자가 없으면 None
+
+    캐시에는 AUTH_USER_FIELDS 값과 비밀번호로 만든 세션 인증 해시만 저장하고,
+    비밀번호 해시 자체는 저장하지 않습니다. 반환하는 사용자 인스턴스의 다른
+    필드는 지연 로딩(deferred)됩니다.
+    """
+    key = AUTH_USER_KEY.format(user_id)
+    record = _cache().get(key)
+    if record is None:
+        with primary():
+            user = User.objects.filter(pk=user_id).only(*AUTH_USER_FIELDS, 'password').first()
+        if user is None:
+            return None
+        session_hash = user.get_session_auth_hash()
+        record = ([getattr(user, field) for field in AUTH_USER_FIELDS], session_hash)
+        _cache().set(key, record, timeout=settings.AUTH_USER_CACHE_TIMEOUT)
+        return user, session_hash
+
+    values, session_hash = record
+    return User.from_db(DEFAULT_DB_ALIAS, AUTH_USER_FIELDS, values), session_hash
+
+
+def invalidate_user(user_id):
+    """사용자 정보/비밀번호가 바뀌거나 삭제된 뒤 호출합니다."""
+    key = AUTH_USER_KEY.format(user_id)
+    _cache().delete(key)
+    # 커밋 전에 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 커밋 후 한 번 더 삭제
+    db_transaction.on_commit(lambda: _cache().delete(key))
+
+
+@receiver(post_save, sender=User)
+def _invalidate_saved_user(sender, instance, update_fields=None, **kwargs):
+    # 로그인 시각(last_login) 갱신처럼 캐시에 없는 필드만 저장한 경우는 제외
+    if update_fields is not None and not set(update_fields) & {*AUTH_USER_FIELDS, 'password'}:
+        return
+    invalidate_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def _invalidate_deleted_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
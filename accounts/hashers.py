@@ -0,0 +1,169 @@
+"""비밀번호 해시 설정과 해시 작업 풀
+
+settings.PASSWORD_HASHER 로 새 비밀번호에 쓸 알고리즘을 고릅니다.
+- pbkdf2: Django 기본값 (PASSWORD_PBKDF2_ITERATIONS)
+- scrypt: 메모리 하드 함수, 같은 보안 수준에서 PBKDF2 보다 빠름 (표준 라이브러리 hashlib.scrypt)
+- argon2: 메모리 하드 함수 (pip install argon2-cffi 필요)
+다른 알고리즘/파라미터로 저장된 비밀번호도 검증되며, 다음 로그인 때
+현재 설정으로 다시 해시됩니다.
+
+해시 계산은 요청 스레드가 아니라 프로세스당 PASSWORD_HASH_WORKERS 개의
+작업 스레드에서 실행되어, 로그인이 몰려도 해시에 쓰는 CPU 가 워커 수로
+제한됩니다. (hashlib 과 argon2-cffi 는 계산 중 GIL 을 놓으므로 스레드로
+충분합니다.) 작업 풀과 대기열(PASSWORD_HASH_QUEUE)이 모두 차 있으면
+PASSWORD_HASH_QUEUE_TIMEOUT 초 동안 기다린 뒤 HashingBusy 를 발생시키고,
+뷰는 503 으로 응답합니다.
+
+사용자 일괄 등록처럼 한 번에 많은 비밀번호를 해시할 때는 hash_passwords 를
+씁니다. 웹 요청에서는 위 작업 풀을 거쳐 한 건씩 계산하고, provision_users
+관리 명령어에서만 여러 프로세스에 나눠 계산합니다.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+class HashingBusy(Exception):
+    """해시 작업 대기열이 가득 참"""
+
+
+# 작업 스레드 안에서 다시 해시를 요청하면(verify -> encode) 바로 실행
+_local = threading.local()
+
+
+def _call(fn, args, kwargs):
+    _local.in_pool = True
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _local.in_pool = False
+
+
+class HashingPool:
+    """동시에 workers 개까지 해시를 계산하고, queue_size 개까지 대기시키는 작업 풀"""
+
+    def __init__(self, workers, queue_size, timeout):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pid = None
+        self._executor = None
+        self._slots = None
+
+    def _ensure_started(self):
+        # gunicorn --preload 처럼 fork 된 자식 프로세스에는 부모의 작업 스레드가 없으므로 새로 만듦
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='password-hash')
+                    self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+                    self._pid = pid
+
+    def run(self, fn, *args, **kwargs):
+        if self.workers <= 0 or getattr(_local, 'in_pool', False):
+            return fn(*args, **kwargs)
+        self._ensure_started()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise HashingBusy
+        try:
+            return self._executor.submit(_call, fn, args, kwargs).result()
+        finally:
+            self._slots.release()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HashingPool(
+                    settings.PASSWORD_HASH_WORKERS,
+                    settings.PASSWORD_HASH_QUEUE,
+                    settings.PASSWORD_HASH_QUEUE_TIMEOUT
+                )
+    return _pool
+
+
+@receiver(setting_changed)
+def _reset_pool(*, setting, **kwargs):
+    global _pool
+    if setting.startswith('PASSWORD_HASH_'):
+        _pool = None
+
+
+class PooledHasherMixin:
+    """해시 계산(encode/verify/harden_runtime)을 작업 풀에서 실행합니다."""
+
+    def encode(self, *args, **kwargs):
+        return get_pool().run(super().encode, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return get_pool().run(super().verify, password, encoded)
+
+    def harden_runtime(self, password, encoded):
+        return get_pool().run(super().harden_runtime, password, encoded)
+
+
+# 파라미터는 설정에서 읽음 (바뀐 파라미터로 저장된 비밀번호는 must_update 로 다시 해시됨)
+class PBKDF2PasswordHasher(PooledHasherMixin, hashers.PBKDF2PasswordHasher):
+    iterations = property(lambda self: settings.PASSWORD_PBKDF2_ITERATIONS)
+
+
+class ScryptPasswordHasher(PooledHasherMixin, hashers.ScryptPasswordHasher):
+    work_factor = property(lambda self: settings.PASSWORD_SCRYPT_WORK_FACTOR)
+    block_size = property(lambda self: settings.PASSWORD_SCRYPT_BLOCK_SIZE)
+    parallelism = property(lambda self: settings.PASSWORD_SCRYPT_PARALLELISM)
+
+
+class Argon2PasswordHasher(PooledHasherMixin, hashers.Argon2PasswordHasher):
+    time_cost = property(lambda self: settings.PASSWORD_ARGON2_TIME_COST)
+    memory_cost = property(lambda self: settings.PASSWORD_ARGON2_MEMORY_COST)
+    parallelism = property(lambda self: settings.PASSWORD_ARGON2_PARALLELISM)
+
+
+def _init_process():
+    # spawn 으로 시작한 자식 프로세스는 DJANGO_SETTINGS_MODULE 환경 변수로 설정을 다시 읽음
+    django.setup()
+
+
+def _hash_chunk(passwords):
+    # 자식 프로세스 자체가 작업자이므로 해시 작업 풀을 거치지 않음
+    _local.in_pool = True
+    return [hashers.make_password(password) for password in passwords]
+
+
+def hash_passwords(passwords, processes=1, chunk_size=100):
+    """비밀번호 목록을 해시합니다. (입력 순서 유지)
+
+    None 또는 빈 문자열은 로그인할 수 없는 비밀번호가 됩니다.
+    processes 가 1 이면 현재 프로세스에서 해시 작업 풀(get_pool)을 거쳐 한 건씩
+    계산하므로, 작업 풀과 대기열이 차 있으면 HashingBusy 가 발생합니다.
+    2 이상이면 그 수만큼 자식 프로세스에 나눠 계산합니다 (관리 명령어 전용).
+    웹 워커처럼 스레드가 있는 프로세스를 fork 하지 않도록 자식 프로세스는 spawn
+    으로 시작하므로, override_settings 로 바꾼 설정은 자식 프로세스에 적용되지 않습니다.
+    """
+    passwords = [password or None for password in passwords]
+    chunks = [passwords[i:i + chunk_size] for i in range(0, len(passwords), chunk_size)]
+    if processes <= 1 or len(chunks) <= 1:
+        return [hashers.make_password(password) for password in passwords]
+
+    hashed = []
+    with ProcessPoolExecutor(
+        min(processes, len(chunks)), mp_context=multiprocessing.get_context('spawn'), initializer=_init_process
+    ) as executor:
+        for result in executor.map(_hash_chunk, chunks):
+            hashed.extend(result)
+    return hashed
@@ -0,0 +1,144 @@
+"""거래 내역 일괄 가져오기 (JSON 배열 / CSV)"""
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+
+from .models import Category, Transaction
+from . import ledger, rollup
+
+REQUIRED_FIELDS = ['category_id', 'transaction_type', 'amount', 'description', 'transaction_date']
+DEFAULT_BATCH_SIZE = 1000
+MAX_AMOUNT = Decimal('9999999999.99')
+
+# 값('income') 또는 표시명('수입') 모두 허용
+TRANSACTION_TYPES = {}
+for _value, _label in Transaction.TRANSACTION_TYPE_CHOICES:
+    TRANSACTION_TYPES[_value] = _value
+    TRANSACTION_TYPES[_label] = _value
+
+
+class ImportFormatError(ValueError):
+    """요청 본문을 거래 내역 목록으로 해석할 수 없음"""
+
+
+def read_rows(request):
+    """요청에서 거래 내역 행(dict) 목록을 읽습니다.
+
+    - multipart 의 file 필드 또는 text/csv 본문: CSV (첫 줄은 헤더)
+    - 그 외: JSON 배열 또는 {"transactions": [...]}
+    """
+    upload = request.FILES.get('file')
+    if upload is not None:
+        return read_csv(upload.read())
+    if request.content_type == 'text/csv':
+        return read_csv(request.body)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        raise ImportFormatError('잘못된 JSON 형식입니다.')
+    if isinstance(data, dict):
+        data = data.get('transactions')
+    if not isinstance(data, list):
+        raise ImportFormatError('거래 내역 배열이 필요합니다.')
+    return data
+
+
+def read_csv(raw, required_fields=REQUIRED_FIELDS):
+    try:
+        text = raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise ImportFormatError('CSV 파일은 UTF-8 인코딩이어야 합니다.')
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [field for field in required_fields if field not in (reader.fieldnames or [])]
+    if missing:
+        raise ImportFormatError(f'CSV 헤더에 {", ".join(missing)} 컬럼이 없습니다.')
+    return list(reader)
+
+
+def build_transactions(user, rows):
+    """행 목록을 검증해 (Transaction 객체 목록, 오류 목록)을 반환합니다.
+
+    카테고리 존재 여부는 전체 행에 대해 쿼리 한 번으로 확인합니다.
+    오류 항목은 {'row': 1부터 시작하는 행 번호, 'message': ...} 입니다.
+    """
+    raw_ids = set()
+    for row in rows:
+        if isinstance(row, dict):
+            try:
+                raw_ids.add(int(row.get('category_id')))
+            except (TypeError, ValueError):
+                pass
+    known_ids = set(Category.objects.filter(id__in=raw_ids).values_list('id', flat=True))
+
+    objects = []
+    errors = []
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({'row': number, 'message': '잘못된 행 형식입니다.'})
+            continue
+
+        missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+        if missing:
+            errors.append({'row': number, 'message': f'{", ".join(missing)}는 필수 항목입니다.'})
+            continue
+
+        try:
+            category_id = int(row['category_id'])
+        except (TypeError, ValueError):
+            category_id = None
+        if category_id not in known_ids:
+            errors.append({'row': number, 'message': '존재하지 않는 카테고리입니다.'})
+            continue
+
+        transaction_type = TRANSACTION_TYPES.get(str(row['transaction_type']).strip())
+        if transaction_type is None:
+            errors.append({'row': number, 'message': '유효하지 않은 거래 유형입니다.'})
+            continue
+
+        try:
+            amount = Decimal(str(row['amount']).replace(',', '').strip())
+        except InvalidOperation:
+            amount = None
+        if amount is None or not amount.is_finite() or amount <= 0 or amount > MAX_AMOUNT:
+            errors.append({'row': number, 'message': '유효하지 않은 금액입니다.'})
+            continue
+
+        try:
+            transaction_date = date.fromisoformat(str(row['transaction_date']).strip())
+        except ValueError:
+            errors.append({'row': number, 'message': '날짜는 YYYY-MM-DD 형식이어야 합니다.'})
+            continue
+
+        description = str(row['description'])
+        if len(description) > 200:
+            errors.append({'row': number, 'message': '설명은 200자 이하여야 합니다.'})
+            continue
+
+        objects.append(Transaction(
+            user=user,
+            category_id=category_id,
+            transaction_type=transaction_type,
+            amount=amount.quantize(Decimal('0.01')),
+            description=description,
+            transaction_date=transaction_date,
+            memo=row.get('memo') or ''
+        ))
+    return objects, errors
+
+
+def import_transactions(objects, batch_size=None):
+    """검증된 거래 내역을 한 DB 트랜잭션 안에서 배치 단위로 저장합니다."""
+    batch_size = batch_size or getattr(settings, 'TRANSACTION_IMPORT_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+    with db_transaction.atomic():
+        versions = {user_id: ledger.bump_version(user_id) for user_id in sorted({obj.user_id for obj in objects})}
+        for obj in objects:
+            obj.version = versions[obj.user_id]
+        Transaction.objects.bulk_create(objects, batch_size=batch_size)
+        rollup.add_transactions(objects)
+    return len(objects)
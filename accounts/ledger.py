@@ -0,0 +1,72 @@
+"""사용자별 거래 내역 버전
+
+거래 내역 목록 응답이 바뀔 수 있는 모든 쓰기 경로에서 버전을 올리고,
+- transaction_list 는 이 값으로 ETag 를 만들어 변경이 없으면 304 를,
+- transaction_sync 는 since 버전 이후 바뀐 행과 삭제된 id 만 반환합니다.
+
+bump_version 은 사용자 행을 잠그므로 같은 사용자의 쓰기는 버전 순서대로
+커밋됩니다. 호출하는 쪽은 반드시 같은 DB 트랜잭션 안에서 변경을 기록해야
+합니다.
+"""
+import hashlib
+
+from django.db import transaction as db_transaction
+from django.db.models import F
+
+from .models import Transaction, TransactionTombstone, User
+
+
+def bump_version(user_id):
+    """사용자의 거래 내역 버전을 올리고 새 버전을 반환합니다."""
+    with db_transaction.atomic():
+        version = (
+            User.objects.select_for_update()
+            .filter(pk=user_id)
+            .values_list('ledger_version', flat=True)
+            .first()
+        )
+        User.objects.filter(pk=user_id).update(ledger_version=F('ledger_version') + 1)
+    return (version or 0) + 1
+
+
+def record_deletes(user_id, transaction_ids, version):
+    """삭제된 거래 내역 id 를 남깁니다."""
+    TransactionTombstone.objects.bulk_create([
+        TransactionTombstone(user_id=user_id, transaction_id=transaction_id, version=version)
+        for transaction_id in transaction_ids
+    ], batch_size=1000)
+
+
+def bump_versions_for_category(category_id, deleting=False):
+    """카테고리 수정/삭제로 목록이 바뀌는 모든 사용자의 버전을 올립니다.
+
+    수정이면 해당 거래 내역에 새 버전을 기록해 동기화 대상에 포함시키고,
+    삭제(CASCADE 로 거래 내역도 삭제)면 삭제 기록을 남깁니다.
+    """
+    transactions = Transaction.objects.filter(category_id=category_id)
+    # 잠금 순서를 일정하게 해 교착 상태를 피함
+    user_ids = transactions.order_by('user_id').values_list('user_id', flat=True).distinct()
+    with db_transaction.atomic():
+        for user_id in list(user_ids):
+            version = bump_version(user_id)
+            owned = transactions.filter(user_id=user_id)
+            if deleting:
+                record_deletes(user_id, owned.values_list('id', flat=True), version)
+            else:
+                owned.update(version=version)
+
+
+def current_version(user_id):
+    """인증 시 읽은 사용자 객체가 아니라 DB 의 최신 버전을 읽습니다."""
+    return User.objects.filter(pk=user_id).values_list('ledger_version', flat=True).first() or 0
+
+
+async def acurrent_version(user_id):
+    """current_version 의 async 버전"""
+    return await User.objects.filter(pk=user_id).values_list('ledger_version', flat=True).afirst() or 0
+
+
+def list_etag(user_id, version, query_string=''):
+    """버전과 조회 조건(limit/cursor 등)을 합친 ETag"""
+    query_hash = hashlib.md5(query_string.encode('utf-8')).hexdigest()[:12]
+    return f'"{user_id}-{version}-{query_hash}"'
@@ -0,0 +1,126 @@
+"""HTTP 부하 테스트 도구
+
+실행 중인 서버(runserver / gunicorn / uvicorn)에 동시 클라이언트로 요청을
+보내 처리량과 응답 시간 분포를 잽니다. 클라이언트마다 스레드 하나와
+keep-alive 연결 하나를 사용하며 표준 라이브러리만 씁니다.
+"""
+import http.client
+import json
+import math
+import threading
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+
+
+class LoadTestError(RuntimeError):
+    """로그인 실패 등 부하 테스트를 진행할 수 없음"""
+
+
+def _connect(base_url, timeout):
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    return connection_class(parts.hostname, parts.port, timeout=timeout), parts.path.rstrip('/')
+
+
+def login(base_url, username, password, timeout=10):
+    """login API 로 로그인해 이후 요청에 쓸 Cookie 헤더 값을 반환합니다."""
+    connection, prefix = _connect(base_url, timeout)
+    try:
+        connection.request(
+            'POST', f'{prefix}/api/auth/login/',
+            body=json.dumps({'username': username, 'password': password}),
+            headers={'Content-Type': 'application/json'}
+        )
+        response = connection.getresponse()
+        body = response.read()
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise LoadTestError(f'로그인 실패 ({response.status}): {body[:200]!r}')
+    cookie = SimpleCookie()
+    for header in response.msg.get_all('Set-Cookie') or []:
+        cookie.load(header)
+    return '; '.join(f'{key}={morsel.value}' for key, morsel in cookie.items())
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """응답 시간(초) 목록을 처리량/백분위수(ms) 요약으로 바꿉니다."""
+    latencies = sorted(latencies)
+    total = len(latencies) + errors
+    return {
+        'requests': total,
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def run_load(base_url, paths, concurrency, total_requests, headers=None, timeout=30):
+    """paths 를 돌아가며 total_requests 번 요청하고 summarize 결과를 반환합니다.
+
+    concurrency 개의 클라이언트가 동시에 요청하며, 2xx/304 가 아닌 응답과
+    연결 오류는 errors 로 셉니다.
+    """
+    headers = dict(headers or {})
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    issued = [0]
+
+    def next_index():
+        with lock:
+            if issued[0] >= total_requests:
+                return None
+            issued[0] += 1
+            return issued[0] - 1
+
+    def client():
+        connection, prefix = _connect(base_url, timeout)
+        local_latencies = []
+        local_errors = 0
+        try:
+            while True:
+                index = next_index()
+                if index is None:
+                    break
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', prefix + paths[index % len(paths)], headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                    ok = 200 <= response.status < 300 or response.status == 304
+                except (OSError, http.client.HTTPException):
+                    ok = False
+                    connection.close()
+                    connection, prefix = _connect(base_url, timeout)
+                if ok:
+                    local_latencies.append(time.perf_counter() - started)
+                else:
+                    local_errors += 1
+        finally:
+            connection.close()
+            with lock:
+                latencies.extend(local_latencies)
+                errors[0] += local_errors
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, errors[0], time.perf_counter() - started)
@@ -0,0 +1,85 @@
+"""JSON 구조화 로그와 백그라운드 출력 핸들러
+
+settings.LOGGING 에서 사용합니다.
+- JsonFormatter: 레코드 하나를 JSON 한 줄로 출력 (extra= 로 넘긴 필드 포함)
+- BackgroundHandler: 요청 스레드는 큐에 레코드를 넣기만 하고, 포맷과
+  stdout/stderr 쓰기는 QueueListener 스레드가 처리합니다.
+
+로그 호출은 logger.debug('... %s', value) 처럼 인자를 따로 넘겨 레벨이
+꺼져 있을 때 문자열을 만들지 않게 하고, 값 자체를 만드는 비용이 큰 경우
+logger.isEnabledFor(logging.DEBUG) 로 감쌉니다.
+"""
+import copy
+import json
+import logging
+import os
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# LogRecord 기본 속성 (이외의 속성은 extra 로 넘긴 값으로 보고 출력)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """{"time", "level", "logger", "message", ...extra, "exc_info"} 형식의 JSON 한 줄"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        if record.stack_info:
+            entry['stack_info'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BackgroundHandler(QueueHandler):
+    """큐에 넣은 레코드를 백그라운드 스레드에서 스트림으로 출력하는 핸들러
+
+    dictConfig 에서 지정한 formatter 는 실제 출력 핸들러에 적용되어 리스너
+    스레드에서 실행됩니다. 프로세스 종료 시 logging.shutdown 이 close() 를
+    호출해 큐에 남은 레코드를 모두 출력합니다.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.target = logging.StreamHandler(stream)
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+        # gunicorn --preload 처럼 설정 후 fork 하면 자식 프로세스에는 리스너 스레드가 없음
+        os.register_at_fork(after_in_child=self._restart_listener)
+
+    def _restart_listener(self):
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # 인자와 예외는 호출 시점의 값으로 고정하고 JSON 변환은 리스너 스레드에 맡김
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def close(self):
+        if self.listener._thread is not None:
+            self.listener.stop()
+        self.target.close()
+        super().close()
+
@@ -0,0 +1,292 @@
+import json
+import platform
+import subprocess
+import threading
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import override_settings
+
+from accounts.benchmark import BENCH_PREFIX, cleanup_ledger, seed_ledger
+from accounts.loadtest import summarize
+from accounts.models import Category, User
+from accounts.query_budget import count_queries
+
+PREFIX = '/api/auth/'
+BENCH_PASSWORD = 'bench-password-1!'
+REGISTER_PREFIX = f'{BENCH_PREFIX}reg_'
+BULK_DELETE_SIZE = 10
+# 비밀번호 해시가 대부분을 차지하는 시나리오는 반복 횟수를 이 비율로 줄임
+ITERATION_WEIGHTS = {'auth': 0.1}
+
+
+class Recorder:
+    """작업별 (응답 시간, 쿼리 수, 성공 여부)를 모읍니다. 클라이언트 스레드마다 하나씩 씁니다."""
+
+    def __init__(self, client):
+        self.client = client
+        self.samples = {}
+
+    def request(self, name, method, path, data=None):
+        body = json.dumps(data) if data is not None else ''
+        # 스레드마다 DB 연결이 따로 있으므로 이 요청의 쿼리만 셈
+        with count_queries() as counter:
+            started = time.perf_counter()
+            try:
+                response = self.client.generic(method, PREFIX + path, body, content_type='application/json')
+            except Exception:
+                response = None
+            latency = time.perf_counter() - started
+
+        payload = {}
+        if response is not None and response.get('Content-Type', '').startswith('application/json'):
+            payload = json.loads(response.content or b'{}')
+        ok = response is not None and response.status_code < 400 and payload.get('status') != 'error'
+        self.samples.setdefault(name, []).append((latency, counter.count, ok))
+        return payload
+
+
+class Context:
+    """시나리오가 공유하는 읽기 전용 정보"""
+
+    def __init__(self, category_ids, login_username):
+        self.category_ids = category_ids
+        self.login_username = login_username
+
+    def transaction_body(self, index=0):
+        return {
+            'category_id': self.category_ids[index % len(self.category_ids)],
+            'transaction_type': 'expense',
+            'amount': '12345.00',
+            'description': f'{BENCH_PREFIX}api',
+            'transaction_date': date.today().isoformat(),
+            'memo': ''
+        }
+
+
+def scenario_auth(recorder, context):
+    username = f'{REGISTER_PREFIX}{uuid.uuid4().hex[:12]}'
+    recorder.request('register', 'POST', 'register/', {
+        'username': username, 'email': f'{username}@example.com', 'password': BENCH_PASSWORD
+    })
+    recorder.request('login', 'POST', 'login/', {
+        'username': context.login_username, 'password': BENCH_PASSWORD
+    })
+
+
+def scenario_categories(recorder, context):
+    name = f'{BENCH_PREFIX}cat_{uuid.uuid4().hex[:12]}'
+    created = recorder.request('category_create', 'POST', 'categories/create/', {
+        'type': 'expense', 'name': name, 'remark': ''
+    })
+    recorder.request('category_list', 'GET', 'categories/')
+    category_id = (created.get('category') or {}).get('id')
+    if category_id:
+        recorder.request('category_update', 'PUT', f'categories/{category_id}/', {'remark': 'bench'})
+        recorder.request('category_delete', 'DELETE', f'categories/{category_id}/delete/')
+
+
+def scenario_transactions(recorder, context):
+    created = recorder.request('transaction_create', 'POST', 'api/transactions/create/', context.transaction_body())
+    recorder.request('transaction_list', 'GET', 'api/transactions/?limit=50')
+    transaction_id = created.get('transaction_id')
+    if transaction_id:
+        recorder.request('transaction_update', 'PUT', f'api/transactions/{transaction_id}/', {'amount': '23456.00'})
+        recorder.request('transaction_delete', 'DELETE', f'api/transactions/{transaction_id}/delete/')
+
+
+def scenario_bulk_delete(recorder, context):
+    transaction_ids = []
+    for index in range(BULK_DELETE_SIZE):
+        created = recorder.request(
+            'transaction_create', 'POST', 'api/transactions/create/', context.transaction_body(index)
+        )
+        if created.get('transaction_id'):
+            transaction_ids.append(created['transaction_id'])
+    recorder.request('transaction_bulk_delete', 'POST', 'api/transactions/bulk-delete/', {
+        'transaction_ids': transaction_ids
+    })
+
+
+def scenario_reads(recorder, context):
+    recorder.request('auth_status', 'GET', 'session/')
+    recorder.request('transaction_list', 'GET', 'api/transactions/?limit=50')
+    recorder.request('transaction_summary', 'GET', f'api/transactions/summary/?year={date.today().year}')
+    recorder.request('category_list', 'GET', 'categories/')
+
+
+# 이름: (시나리오 함수, 관리자 권한 필요 여부)
+SCENARIOS = {
+    'auth': (scenario_auth, False),
+    'categories': (scenario_categories, True),
+    'transactions': (scenario_transactions, False),
+    'bulk_delete': (scenario_bulk_delete, False),
+    'reads': (scenario_reads, False),
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'PostgreSQL 에 벤치마크 데이터를 시딩한 뒤 accounts/urls.py 의 실제 경로(회원가입/로그인, '
+        '카테고리 CRUD, 거래 내역 CRUD, 일괄 삭제, 조회)를 동시 클라이언트로 호출해 '
+        '작업별 처리량, p50/p95/p99 응답 시간, 요청당 쿼리 수를 JSON 으로 출력합니다. '
+        '서버 없이 프로세스 안에서 테스트 클라이언트 스레드로 실행합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='시딩할 사용자 수')
+        parser.add_argument('--categories', type=int, default=20, help='시딩할 카테고리 수')
+        parser.add_argument('--transactions', type=int, default=1000, help='사용자당 거래 내역 수')
+        parser.add_argument('--skip-seed', action='store_true', help='기존 벤치마크 데이터 재사용')
+        parser.add_argument('--cleanup', action='store_true', help='측정 후 벤치마크 데이터 삭제')
+        parser.add_argument('--concurrency', type=int, default=8, help='동시 클라이언트 수')
+        parser.add_argument('--iterations', type=int, default=200, help='시나리오별 반복 횟수')
+        parser.add_argument(
+            '--scenario', action='append', dest='scenarios', choices=list(SCENARIOS),
+            help='실행할 시나리오 (기본: 전체)'
+        )
+        parser.add_argument('--output', help='결과 JSON 을 저장할 파일 (기본: 표준 출력)')
+
+    def handle(self, *args, **options):
+        seed = {
+            'users': options['users'],
+            'categories': options['categories'],
+            'transactions_per_user': options['transactions'],
+        }
+        if not options['skip_seed']:
+            try:
+                seed_ledger(
+                    users=options['users'],
+                    transactions_per_user=options['transactions'],
+                    categories=options['categories'],
+                    password=BENCH_PASSWORD,
+                    stdout=self.stderr
+                )
+            except RuntimeError as e:
+                raise CommandError(str(e))
+
+        users = list(User.objects.filter(username__startswith=BENCH_PREFIX).exclude(
+            username__startswith=REGISTER_PREFIX
+        ).order_by('id')[:options['users']])
+        category_ids = list(Category.objects.filter(name__regex=rf'^{BENCH_PREFIX}category[0-9]+$').values_list('id', flat=True))
+        if not users or not category_ids:
+            raise CommandError('벤치마크 데이터가 없습니다. --skip-seed 없이 실행해주세요.')
+        context = Context(category_ids, users[0].username)
+
+        # 카테고리 API 는 username 이 admin 인 사용자만 호출 가능
+        admin, admin_created = User.objects.get_or_create(
+            username='admin', defaults={'email': f'{BENCH_PREFIX}admin@example.com'}
+        )
+
+        results = {}
+        try:
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                for name in options['scenarios'] or list(SCENARIOS):
+                    iterations = max(1, int(options['iterations'] * ITERATION_WEIGHTS.get(name, 1)))
+                    results[name] = self.run_scenario(
+                        name, users, admin, context, options['concurrency'], iterations
+                    )
+                    self.stderr.write(f'{name}: {results[name]["throughput_rps"]} req/s')
+        finally:
+            User.objects.filter(username__startswith=REGISTER_PREFIX).delete()
+            Category.objects.filter(name__startswith=f'{BENCH_PREFIX}cat_').delete()
+            if admin_created:
+                admin.delete()
+            if options['cleanup']:
+                cleanup_ledger()
+
+        report = {
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'git_commit': _git_commit(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'database_version': getattr(connection, 'pg_version', None),
+                'conn_max_age': connection.settings_dict.get('CONN_MAX_AGE'),
+                'session_engine': settings.SESSION_ENGINE,
+                'cache_backend': settings.CACHES['default']['BACKEND'],
+                'seed': seed,
+                'concurrency': options['concurrency'],
+                'iterations': options['iterations'],
+            },
+            'scenarios': results,
+        }
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def run_scenario(self, name, users, admin, context, concurrency, iterations):
+        scenario, needs_admin = SCENARIOS[name]
+        lock = threading.Lock()
+        remaining = [iterations]
+        samples = []
+
+        def take():
+            with lock:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+                return True
+
+        def client(index):
+            try:
+                web = Client()
+                web.force_login(admin if needs_admin else users[index % len(users)])
+                recorder = Recorder(web)
+                while take():
+                    scenario(recorder, context)
+                with lock:
+                    samples.append(recorder.samples)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        merged = {}
+        for recorded in samples:
+            for operation, values in recorded.items():
+                merged.setdefault(operation, []).extend(values)
+
+        operations = {}
+        for operation, values in sorted(merged.items()):
+            stats = summarize([latency for latency, _, ok in values if ok], sum(not ok for _, _, ok in values), elapsed)
+            queries = [count for _, count, _ in values]
+            stats['queries_per_request'] = round(sum(queries) / len(queries), 2)
+            stats['max_queries'] = max(queries)
+            operations[operation] = stats
+
+        total = sum(len(values) for values in merged.values())
+        return {
+            'iterations': iterations,
+            'requests': total,
+            'elapsed_s': round(elapsed, 3),
+            'throughput_rps': round(total / elapsed, 1) if elapsed else 0.0,
+            'operations': operations,
+        }
@@ -0,0 +1,91 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.test.utils import override_settings
+
+from accounts.benchmark import BENCH_PREFIX
+from accounts.loadtest import summarize
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        '가벼운 API(로그인 상태 확인, 카테고리 목록)의 요청당 응답 시간을 '
+        '요청마다 새로 연결(CONN_MAX_AGE=0)할 때와 연결을 재사용할 때로 비교합니다. '
+        '--pgbouncer 를 주면 같은 비교를 pgbouncer 경유로도 측정합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='시나리오별 요청 수')
+        parser.add_argument(
+            '--path', action='append', dest='paths',
+            help='요청할 경로 (기본: /api/auth/session/, /api/categories/)'
+        )
+        parser.add_argument(
+            '--pgbouncer', metavar='HOST:PORT',
+            help='transaction 모드 pgbouncer 주소 (DB 이름/계정은 현재 설정과 동일)'
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[DEFAULT_DB_ALIAS]
+        original = dict(connection.settings_dict)
+        targets = [('직접 연결', {})]
+        if options['pgbouncer']:
+            host, _, port = options['pgbouncer'].rpartition(':')
+            if not host or not port.isdigit():
+                raise CommandError('--pgbouncer 는 HOST:PORT 형식이어야 합니다.')
+            targets.append(('pgbouncer', {'HOST': host, 'PORT': port, 'DISABLE_SERVER_SIDE_CURSORS': True}))
+
+        user, _ = User.objects.get_or_create(
+            username=f'{BENCH_PREFIX}connections',
+            defaults={'email': f'{BENCH_PREFIX}connections@example.com'}
+        )
+        paths = options['paths'] or ['/api/auth/session/', '/api/categories/']
+        try:
+            for target, overrides in targets:
+                for label, conn_max_age in (('새 연결', 0), ('연결 재사용', 600)):
+                    connection.close()
+                    connection.settings_dict.update(original, CONN_MAX_AGE=conn_max_age, **overrides)
+                    with override_settings(ALLOWED_HOSTS=['testserver']):
+                        self.run_scenario(f'{target} / {label}', user, paths, options['requests'])
+        finally:
+            connection.close()
+            connection.settings_dict.clear()
+            connection.settings_dict.update(original)
+            user.delete()
+
+    def run_scenario(self, name, user, paths, total):
+        client = Client()
+        client.force_login(user)
+        # 로그인 과정의 연결은 제외하고 측정
+        connections.close_all()
+
+        connects = []
+
+        def on_connect(sender, connection, **kwargs):
+            connects.append(connection.alias)
+
+        connection_created.connect(on_connect)
+        latencies = []
+        started = time.perf_counter()
+        try:
+            for i in range(total):
+                request_started = time.perf_counter()
+                # 테스트 클라이언트는 close_old_connections 시그널 핸들러를 떼고 실행하므로
+                # 실제 서버처럼 요청 시작/종료 시 직접 호출 (CONN_MAX_AGE / 헬스 체크 반영)
+                close_old_connections()
+                client.get(paths[i % len(paths)])
+                close_old_connections()
+                latencies.append(time.perf_counter() - request_started)
+        finally:
+            connection_created.disconnect(on_connect)
+        result = summarize(latencies, 0, time.perf_counter() - started)
+
+        self.stdout.write(
+            f'{name}: {result["throughput_rps"]:.1f} req/s, p50 {result["p50_ms"]:.2f}ms, '
+            f'p95 {result["p95_ms"]:.2f}ms, p99 {result["p99_ms"]:.2f}ms, '
+            f'새 DB 연결 {len(connects)}회 / 요청 {total}회'
+        )
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import override_settings
+
+from accounts.benchmark import BENCH_PREFIX, seed_ledger
+from accounts.loadtest import summarize
+from accounts.management.commands.bench_api import BENCH_PASSWORD, PREFIX, REGISTER_PREFIX, Recorder, _git_commit
+from accounts.models import User
+
+LIST_PATH = 'api/transactions/?limit=50'
+
+
+class Command(BaseCommand):
+    help = (
+        '로그인 폭주 중에도 조회 API 응답 시간이 유지되는지 측정합니다. '
+        '조회(transaction_list) 클라이언트만 실행하는 baseline 구간과, 같은 조회 클라이언트에 '
+        '로그인 클라이언트를 더한 storm 구간을 차례로 실행해 구간별 조회 p50/p95/p99 와 '
+        '로그인 처리량/상태 코드(429 시도 제한, 503 해시 대기열 초과)를 JSON 으로 출력합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='시딩할 사용자 수')
+        parser.add_argument('--transactions', type=int, default=1000, help='사용자당 거래 내역 수')
+        parser.add_argument('--skip-seed', action='store_true', help='기존 벤치마크 데이터 재사용')
+        parser.add_argument('--list-clients', type=int, default=4, help='조회 클라이언트 수')
+        parser.add_argument('--login-clients', type=int, default=16, help='storm 구간의 로그인 클라이언트 수')
+        parser.add_argument('--duration', type=float, default=10.0, help='구간별 실행 시간(초)')
+        parser.add_argument(
+            '--hash-workers', type=int,
+            help='해시 작업 스레드 수 (기본: 설정값, 0 이면 요청 스레드에서 계산해 풀 없이 비교)'
+        )
+        parser.add_argument('--hasher', choices=list(settings.PASSWORD_HASHER_CLASSES), help='비밀번호 해시 알고리즘')
+        parser.add_argument(
+            '--throttle', action='store_true',
+            help='로그인 시도 제한 유지 (기본: 해시 풀만 측정하도록 끔)'
+        )
+        parser.add_argument('--output', help='결과 JSON 을 저장할 파일 (기본: 표준 출력)')
+
+    def handle(self, *args, **options):
+        if not options['skip_seed']:
+            try:
+                seed_ledger(
+                    users=options['users'],
+                    transactions_per_user=options['transactions'],
+                    categories=5,
+                    password=BENCH_PASSWORD,
+                    stdout=self.stderr
+                )
+            except RuntimeError as e:
+                raise CommandError(str(e))
+
+        users = list(User.objects.filter(username__startswith=BENCH_PREFIX).exclude(
+            username__startswith=REGISTER_PREFIX
+        ).order_by('id')[:options['users']])
+        if not users:
+            raise CommandError('벤치마크 데이터가 없습니다. --skip-seed 없이 실행해주세요.')
+
+        overrides = {'ALLOWED_HOSTS': ['testserver']}
+        if options['hash_workers'] is not None:
+            overrides['PASSWORD_HASH_WORKERS'] = options['hash_workers']
+        if options['hasher']:
+            hasher = options['hasher']
+            overrides['PASSWORD_HASHER'] = hasher
+            overrides['PASSWORD_HASHERS'] = [settings.PASSWORD_HASHER_CLASSES[hasher]] + [
+                path for name, path in settings.PASSWORD_HASHER_CLASSES.items() if name != hasher
+            ]
+        if not options['throttle']:
+            overrides['LOGIN_THROTTLE_PER_IP'] = 0
+            overrides['LOGIN_THROTTLE_PER_USERNAME'] = 0
+
+        with override_settings(**overrides):
+            # 현재 해시 설정으로 다시 해시되는 첫 로그인이 측정에 섞이지 않도록 미리 한 번씩 로그인
+            warmup = Client()
+            for user in users:
+                warmup.post(PREFIX + 'login/', json.dumps({
+                    'username': user.username, 'password': BENCH_PASSWORD
+                }), content_type='application/json')
+            # 다시 해시된 비밀번호로 세션 인증 해시를 만들도록 새로 읽음
+            users = list(User.objects.filter(id__in=[user.id for user in users]).order_by('id'))
+
+            phases = {}
+            for phase, login_clients in (('baseline', 0), ('storm', options['login_clients'])):
+                phases[phase] = self.run_phase(users, options['list_clients'], login_clients, options['duration'])
+                self.stderr.write(
+                    f'{phase}: list p99 {phases[phase]["list"]["p99_ms"]}ms, '
+                    f'login {phases[phase]["login"]["throughput_rps"]} req/s'
+                )
+
+            report = {
+                'meta': {
+                    'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                    'git_commit': _git_commit(),
+                    'database': connection.vendor,
+                    'cpu_count': os.cpu_count(),
+                    'password_hasher': settings.PASSWORD_HASHERS[0],
+                    'hash_workers': settings.PASSWORD_HASH_WORKERS,
+                    'hash_queue': settings.PASSWORD_HASH_QUEUE,
+                    'hash_queue_timeout': settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+                    'throttle': options['throttle'],
+                    'list_clients': options['list_clients'],
+                    'login_clients': options['login_clients'],
+                    'duration_s': options['duration'],
+                },
+                'phases': phases,
+            }
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def run_phase(self, users, list_clients, login_clients, duration):
+        deadline = [None]
+        lock = threading.Lock()
+        list_samples = []
+        login_latencies = []
+        login_statuses = {}
+
+        def list_client(index):
+            try:
+                web = Client()
+                web.force_login(users[index % len(users)])
+                recorder = Recorder(web)
+                while time.perf_counter() < deadline[0]:
+                    recorder.request('transaction_list', 'GET', LIST_PATH)
+                with lock:
+                    list_samples.extend(recorder.samples.get('transaction_list', []))
+            finally:
+                connections.close_all()
+
+        def login_client(index):
+            latencies = []
+            statuses = {}
+            # 스레드마다 다른 IP 로 보이게 해 시도 제한을 켠 경우에도 IP 별로 나뉘도록
+            web = Client(REMOTE_ADDR=f'10.0.{index // 250}.{index % 250 + 1}')
+            body = json.dumps({'username': users[index % len(users)].username, 'password': BENCH_PASSWORD})
+            try:
+                while time.perf_counter() < deadline[0]:
+                    started = time.perf_counter()
+                    response = web.post(PREFIX + 'login/', body, content_type='application/json')
+                    latencies.append(time.perf_counter() - started)
+                    statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                with lock:
+                    login_latencies.extend(latencies)
+                    for status, count in statuses.items():
+                        login_statuses[status] = login_statuses.get(status, 0) + count
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=list_client, args=(i,)) for i in range(list_clients)]
+        threads += [threading.Thread(target=login_client, args=(i,)) for i in range(login_clients)]
+        started = time.perf_counter()
+        deadline[0] = started + duration
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        login = summarize(login_latencies, 0, elapsed)
+        login['status_codes'] = {str(status): count for status, count in sorted(login_statuses.items())}
+        return {
+            'list': summarize(
+                [latency for latency, _, ok in list_samples if ok],
+                sum(not ok for _, _, ok in list_samples), elapsed
+            ),
+            'login': login,
+        }
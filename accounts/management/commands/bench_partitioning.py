@@ -0,0 +1,187 @@
+import json
+import platform
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+
+from accounts import partitioning
+from accounts.benchmark import BENCH_PREFIX, plan_nodes, seed_ledger
+from accounts.loadtest import summarize
+from accounts.management.commands.bench_api import Recorder, _git_commit
+from accounts.models import Category, Transaction, User
+
+
+class MainQuery:
+    """execute_wrapper 로 등록해 거래 내역 테이블을 읽는 마지막 쿼리(sql, params)를 기록합니다."""
+
+    def __init__(self):
+        self.sql = None
+        self.params = None
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip().startswith('SELECT') and f'FROM "{Transaction._meta.db_table}"' in sql:
+            self.sql, self.params = sql, params
+        return execute(sql, params, many, context)
+
+
+def _cases(category_id):
+    """이름: 요청 경로 - 최근 목록, 한 달/1년 기간 목록, 1년 금액순 목록, 1년 요약"""
+    today = date.today()
+    # 6개월 전 한 달
+    index = today.year * 12 + today.month - 1 - 6
+    month_start = date(index // 12, index % 12 + 1, 1)
+    month_end = partitioning.next_period(month_start, 'month') - timedelta(days=1)
+    year = today.year - 1
+    return {
+        'list_latest': 'api/transactions/?limit=50',
+        'list_month': f'api/transactions/?start_date={month_start}&end_date={month_end}&limit=50',
+        'list_year': f'api/transactions/?year={year}&limit=50',
+        'list_year_category': f'api/transactions/?year={year}&category_id={category_id}&limit=50',
+        'list_year_amount': f'api/transactions/?year={year}&sort=amount&limit=50',
+        'summary_year': f'api/transactions/summary/?year={year}',
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        '벤치마크 데이터로 거래 내역 목록/요약 API 의 응답 시간과 실행 계획(읽은 파티션 수, '
+        '계획 시간)을 측정합니다. --convert 를 주면 일반 테이블을 측정한 뒤 파티션 테이블로 '
+        '변환하고 다시 측정해 두 결과를 JSON 으로 출력합니다. (PostgreSQL 전용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='벤치마크 사용자 수')
+        parser.add_argument('--transactions', type=int, default=50000000, help='전체 거래 내역 수')
+        parser.add_argument('--skip-seed', action='store_true', help='기존 벤치마크 데이터 재사용')
+        parser.add_argument(
+            '--interval', choices=partitioning.INTERVALS, default='month', help='변환할 파티션 단위'
+        )
+        parser.add_argument(
+            '--convert', action='store_true',
+            help='측정 후 거래 내역 테이블을 파티션 테이블로 변환하고 다시 측정 (기본: 현재 테이블만 측정)'
+        )
+        parser.add_argument('--drop-old', action='store_true', help='--convert 로 변환한 뒤 원래 테이블 삭제')
+        parser.add_argument('--clients', type=int, default=100, help='측정에 쓸 벤치마크 사용자 수')
+        parser.add_argument('--iterations', type=int, default=200, help='경우별 요청 수')
+        parser.add_argument('--output', help='결과 JSON 을 저장할 파일 (기본: 표준 출력)')
+
+    def handle(self, *args, **options):
+        per_user = max(1, options['transactions'] // options['users'])
+        try:
+            if not options['skip_seed']:
+                seed_ledger(
+                    users=options['users'],
+                    transactions_per_user=per_user,
+                    stdout=self.stderr
+                )
+            partitioned = partitioning.is_partitioned()
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        users = list(
+            User.objects.filter(username__startswith=BENCH_PREFIX)
+            .order_by('id')[:options['clients']]
+        )
+        category_id = (
+            Category.objects.filter(name__regex=rf'^{BENCH_PREFIX}category[0-9]+$')
+            .order_by('id').values_list('id', flat=True).first()
+        )
+        if not users or category_id is None:
+            raise CommandError('벤치마크 데이터가 없습니다. --skip-seed 없이 실행해주세요.')
+        cases = _cases(category_id)
+
+        results = {}
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            label = 'partitioned' if partitioned else 'unpartitioned'
+            results[label] = self.measure(users, cases, options['iterations'])
+            if options['convert'] and not partitioned:
+                started = time.perf_counter()
+                try:
+                    partitioning.convert(
+                        interval=options['interval'], drop_old=options['drop_old'], stdout=self.stderr
+                    )
+                except partitioning.PartitioningError as e:
+                    raise CommandError(str(e))
+                self.stderr.write(f'변환 {time.perf_counter() - started:.1f}초')
+                results['partitioned'] = self.measure(users, cases, options['iterations'])
+
+        report = {
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'git_commit': _git_commit(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database_version': getattr(connection, 'pg_version', None),
+                'seed': {
+                    'users': options['users'],
+                    'transactions_per_user': per_user,
+                },
+                'partitions': len(partitioning.list_partitions()),
+                'interval': options['interval'],
+                'iterations': options['iterations'],
+                'cases': cases,
+            },
+            'results': results,
+        }
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def measure(self, users, cases, iterations):
+        recorders = []
+        for user in users:
+            web = Client()
+            web.force_login(user)
+            recorders.append(Recorder(web))
+
+        results = {}
+        for name, path in cases.items():
+            # 첫 요청으로 캐시를 데우고 그 요청의 거래 내역 쿼리를 EXPLAIN
+            main_query = MainQuery()
+            with connection.execute_wrapper(main_query):
+                recorders[0].request(f'{name}_warmup', 'GET', path)
+            for recorder in recorders:
+                recorder.samples.clear()
+
+            started = time.perf_counter()
+            for index in range(iterations):
+                recorders[index % len(recorders)].request(name, 'GET', path)
+            elapsed = time.perf_counter() - started
+
+            samples = [sample for recorder in recorders for sample in recorder.samples.get(name, [])]
+            stats = summarize([latency for latency, _, ok in samples if ok], sum(not ok for _, _, ok in samples), elapsed)
+            stats['plan'] = self.explain(main_query)
+            results[name] = stats
+            self.stderr.write(f'  {name}: p50 {stats["p50_ms"]}ms, p99 {stats["p99_ms"]}ms, plan {stats["plan"]}')
+        return results
+
+    def explain(self, main_query):
+        """뷰가 실행한 거래 내역 쿼리의 계획 시간, 실행 시간, 읽은 파티션 수"""
+        if main_query.sql is None:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {main_query.sql}', main_query.params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        plan = plan[0]
+        table = Transaction._meta.db_table
+        relations = {
+            node['Relation Name'] for node in plan_nodes(plan)
+            if node.get('Relation Name', '').startswith(table)
+        }
+        return {
+            'planning_ms': round(plan['Planning Time'], 2),
+            'execution_ms': round(plan['Execution Time'], 2),
+            'relations_scanned': len(relations),
+            'shared_buffers': plan['Plan'].get('Shared Hit Blocks', 0) + plan['Plan'].get('Shared Read Blocks', 0),
+        }
@@ -0,0 +1,156 @@
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from accounts import serialization
+from accounts.models import Category, Transaction, User
+
+
+def legacy_serialize(transaction):
+    """serialization 도입 전 transaction_list 의 행 단위 직렬화 (비교 기준)"""
+    return {
+        'id': transaction.id,
+        'transaction_type': transaction.transaction_type,
+        'transaction_type_display': transaction.get_transaction_type_display(),
+        'amount': str(transaction.amount),
+        'description': transaction.description,
+        'transaction_date': transaction.transaction_date.strftime('%Y-%m-%d'),
+        'memo': transaction.memo or '',
+        'category': {
+            'id': transaction.category.id,
+            'name': transaction.category.name,
+            'type_display': transaction.category.get_type_display()
+        },
+        'created_at': transaction.created_at.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def legacy_dumps(data):
+    """JsonResponse 의 기본 인코딩과 동일"""
+    return json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8')
+
+
+def stdlib_dumps(data):
+    return json.dumps(
+        data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+class Command(BaseCommand):
+    help = (
+        '거래 내역 목록 직렬화(모델 인스턴스 + 행별 strftime/표시명 + 기본 JSON 인코더)와 '
+        'serialization 모듈의 튜플 기반 경로의 처리량을 비교합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000, help='직렬화할 행 수')
+        parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+        parser.add_argument(
+            '--username',
+            help='지정하면 메모리 데이터 대신 이 사용자의 거래 내역을 DB 에서 읽는 시간까지 측정'
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        if options['username']:
+            user = User.objects.filter(username=options['username']).first()
+            if user is None:
+                raise CommandError('존재하지 않는 사용자입니다.')
+            queryset = Transaction.objects.filter(user=user).order_by(
+                '-transaction_date', '-created_at', 'id'
+            )[:rows]
+
+            def load_instances():
+                return list(queryset.select_related('category').only(
+                    'id', 'transaction_type', 'amount', 'description', 'transaction_date', 'memo',
+                    'created_at', 'category__id', 'category__name', 'category__type'
+                ))
+
+            def load_tuples():
+                return list(queryset.values_list(*serialization.TRANSACTION_VALUES))
+
+            source = f'DB ({user.username})'
+        else:
+            instances, tuples = self.build_rows(rows)
+
+            def load_instances():
+                return instances
+
+            def load_tuples():
+                return tuples
+
+            source = '메모리'
+
+        def legacy():
+            transactions = load_instances()
+            return legacy_dumps({'status': 'success', 'transactions': [
+                legacy_serialize(transaction) for transaction in transactions
+            ]}), len(transactions)
+
+        def fast(dumps):
+            def run():
+                transactions = load_tuples()
+                return dumps({
+                    'status': 'success',
+                    'transactions': serialization.serialize_transactions(transactions)
+                }), len(transactions)
+            return run
+
+        cases = [('기존 (모델 + JsonResponse 인코더)', legacy), ('튜플 + json', fast(stdlib_dumps))]
+        if serialization.orjson is not None:
+            cases.append(('튜플 + orjson', fast(serialization.dumps)))
+        else:
+            self.stdout.write('orjson 이 설치되어 있지 않아 json 인코더만 측정합니다.')
+
+        self.stdout.write(f'데이터: {source}, 반복 {options["repeat"]}회 중 최솟값')
+        baseline = None
+        for name, run in cases:
+            elapsed, size, count = self.measure(run, options['repeat'])
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f'{name}: {count}행 {elapsed * 1000:.1f}ms, {count / elapsed:,.0f} rows/s, '
+                f'{size / 1024:,.0f}KB, x{baseline / elapsed:.2f}'
+            )
+
+    def measure(self, run, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body, count = run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, len(body), count
+
+    def build_rows(self, rows):
+        """DB 없이 같은 내용의 (모델 인스턴스 목록, values_list 튜플 목록)을 만듭니다."""
+        categories = [
+            Category(id=i, type=Category.TYPE_CHOICES[i % 2][0], name=f'카테고리{i}')
+            for i in range(1, 21)
+        ]
+        today = date.today()
+        now = datetime.now(timezone.utc)
+        instances = []
+        tuples = []
+        for i in range(rows):
+            category = categories[i % len(categories)]
+            transaction = Transaction(
+                id=i + 1,
+                category=category,
+                transaction_type='income' if i % 4 == 0 else 'expense',
+                amount=Decimal((i * 7919) % 1000000) / 100,
+                description=f'거래 내역 {i}',
+                transaction_date=today - timedelta(days=i % 1825),
+                memo='' if i % 3 else '메모',
+                created_at=now - timedelta(seconds=i),
+            )
+            instances.append(transaction)
+            tuples.append((
+                transaction.id, transaction.transaction_type, transaction.amount,
+                transaction.description, transaction.transaction_date, transaction.memo,
+                transaction.created_at, category.id, category.name, category.type
+            ))
+        return instances, tuples
@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+
+from accounts.benchmark import BENCH_PREFIX
+from accounts.models import User
+
+SESSION_TABLE = 'django_session'
+
+
+class SessionWriteCounter:
+    """django_session 테이블에 대한 INSERT/UPDATE 쿼리 수를 셉니다."""
+
+    def __init__(self):
+        self.writes = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        statement = sql.lstrip().upper()
+        if statement.startswith(('INSERT', 'UPDATE')) and SESSION_TABLE.upper() in statement:
+            self.writes += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        '읽기 위주 부하(거래 내역/카테고리 목록 조회)에서 세션 테이블 쓰기 횟수를 '
+        '매 요청 저장 방식과 만료 임박 시 연장 방식으로 비교합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help='전략별 요청 수')
+
+    def handle(self, *args, **options):
+        user, _ = User.objects.get_or_create(
+            username=f'{BENCH_PREFIX}session',
+            defaults={'email': f'{BENCH_PREFIX}session@example.com'}
+        )
+        strategies = [
+            ('SESSION_SAVE_EVERY_REQUEST', {'SESSION_SAVE_EVERY_REQUEST': True}),
+            ('sliding renewal', {'SESSION_SAVE_EVERY_REQUEST': False}),
+        ]
+        try:
+            for name, overrides in strategies:
+                with override_settings(ALLOWED_HOSTS=['testserver'], **overrides):
+                    self.run_strategy(name, user, options['requests'])
+        finally:
+            user.delete()
+
+    def run_strategy(self, name, user, total):
+        client = Client()
+        client.force_login(user)
+        paths = ['/api/auth/api/transactions/?limit=50', '/api/categories/']
+        counter = SessionWriteCounter()
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            for i in range(total):
+                client.get(paths[i % len(paths)])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{name}: 요청 {total}회, 세션 쓰기 {counter.writes}회 '
+            f'({counter.writes / total:.3f}/요청, {counter.writes / elapsed:.1f} writes/s), '
+            f'{total / elapsed:.1f} req/s'
+        )
@@ -0,0 +1,155 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from accounts import serialization
+from accounts.benchmark import cleanup_ledger, explain, plan_nodes, scan_summary, seed_ledger, BENCH_PREFIX
+from accounts.models import Transaction, User
+from accounts.pagination import keyset_paginate, page_queryset
+from accounts.views import TRANSACTION_SORTS
+
+INDEX_SCANS = {'Index Scan', 'Index Only Scan', 'Bitmap Index Scan'}
+# 커서 페이지에서 필터로 버려도 되는 행 수 (커서와 같은 날짜의 앞선 행들).
+# 커서 이전의 행을 모두 읽고 버리면 페이지가 뒤로 갈수록 이 값이 커짐
+MAX_FILTERED_ROWS = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        '벤치마크 데이터를 시딩한 뒤 거래 내역 목록/일괄 삭제/필터 쿼리가 '
+        '인덱스를 타는지 EXPLAIN 으로 검증합니다. (PostgreSQL 전용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200, help='벤치마크 사용자 수')
+        parser.add_argument(
+            '--transactions', type=int, default=2000000, help='전체 거래 내역 수'
+        )
+        parser.add_argument('--skip-seed', action='store_true', help='기존 벤치마크 데이터 재사용')
+        parser.add_argument('--cleanup', action='store_true', help='검증 후 벤치마크 데이터 삭제')
+
+    def handle(self, *args, **options):
+        try:
+            if options['skip_seed']:
+                user_ids = list(
+                    User.objects.filter(username__startswith=BENCH_PREFIX)
+                    .order_by('id').values_list('id', flat=True)
+                )
+            else:
+                per_user = max(1, options['transactions'] // options['users'])
+                user_ids = seed_ledger(
+                    users=options['users'],
+                    transactions_per_user=per_user,
+                    stdout=self.stdout
+                )
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        if not user_ids:
+            raise CommandError('벤치마크 데이터가 없습니다. --skip-seed 없이 실행해주세요.')
+
+        failures = []
+        for name, queryset, expected, max_filtered in self.get_checks(user_ids[0]):
+            plan = explain(queryset)
+            scans = scan_summary(plan, Transaction._meta.db_table)
+            used = [index for node_type, index in scans if node_type in INDEX_SCANS]
+            filtered = sum(node.get('Rows Removed by Filter', 0) for node in plan_nodes(plan))
+            ok = (
+                all(node_type != 'Seq Scan' for node_type, _ in scans)
+                and any(index in expected for index in used)
+                and (max_filtered is None or filtered <= max_filtered)
+            )
+            status = 'PASS' if ok else 'FAIL'
+            self.stdout.write(
+                f'[{status}] {name}: {plan["Execution Time"]:.2f}ms, '
+                f'scans={scans}, filtered={filtered}, expected={sorted(expected)}'
+            )
+            if not ok:
+                failures.append(name)
+
+        if options['cleanup']:
+            cleanup_ledger()
+
+        if failures:
+            raise CommandError(f'인덱스를 제대로 사용하지 않는 쿼리: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('모든 쿼리가 인덱스를 사용합니다.'))
+
+    def get_checks(self, user_id):
+        """(이름, queryset, 허용 인덱스 집합, 필터로 버려도 되는 행 수 상한) 목록
+
+        views.py 의 실제 쿼리와 동일하게 유지합니다.
+        """
+        transactions = Transaction.objects.filter(user_id=user_id)
+        newest = transactions.order_by('-transaction_date', '-created_at', 'id')
+        sample_ids = list(newest.values_list('id', flat=True)[:50])
+        category_id = transactions.values_list('category_id', flat=True).first()
+        pkey = f'{Transaction._meta.db_table}_pkey'
+
+        # transaction_list 의 커서 페이지네이션과 같은 queryset
+        ordering = TRANSACTION_SORTS['date']
+        listed = transactions.values_list(*serialization.TRANSACTION_VALUES, named=True)
+        _rows, next_cursor = keyset_paginate(listed, ordering, limit=50)
+        # 끝 쪽 페이지: 뒤 페이지도 첫 페이지처럼 커서 위치부터 읽는지 확인
+        _rows, deep_cursor = keyset_paginate(listed, ordering, limit=max(1, transactions.count() * 9 // 10))
+
+        return [
+            (
+                'transaction_list (첫 페이지)',
+                page_queryset(listed, ordering),
+                {'idx_transactions_user_date'},
+                None,
+            ),
+            (
+                'transaction_list (커서 이후 페이지)',
+                page_queryset(listed, ordering, cursor=next_cursor),
+                {'idx_transactions_user_date'},
+                MAX_FILTERED_ROWS,
+            ),
+            (
+                'transaction_list (끝 쪽 페이지)',
+                page_queryset(listed, ordering, cursor=deep_cursor),
+                {'idx_transactions_user_date'},
+                MAX_FILTERED_ROWS,
+            ),
+            (
+                'transaction_bulk_delete',
+                Transaction.objects.filter(id__in=sample_ids, user_id=user_id),
+                {pkey, 'idx_transactions_user_date'},
+                None,
+            ),
+            (
+                '카테고리 필터',
+                transactions.filter(category_id=category_id),
+                {'idx_transactions_user_category', 'idx_transactions_user_date'},
+                None,
+            ),
+            (
+                '유형 + 기간 필터',
+                transactions.filter(
+                    transaction_type='income',
+                    transaction_date__gte=newest[0].transaction_date.replace(day=1)
+                ),
+                {'idx_transactions_user_type', 'idx_transactions_user_date'},
+                None,
+            ),
+            (
+                '카테고리 필터 (정렬 + 첫 페이지)',
+                transactions.filter(category_id=category_id)
+                .order_by('-transaction_date', '-created_at', 'id')[:51],
+                {'idx_transactions_user_category'},
+                None,
+            ),
+            (
+                '금액 정렬 (첫 페이지)',
+                transactions.order_by('-amount', 'id')[:51],
+                {'idx_transactions_user_amount'},
+                None,
+            ),
+            (
+                '설명/메모 검색',
+                transactions.filter(
+                    Q(description__icontains='transaction 1234') | Q(memo__icontains='transaction 1234')
+                ).order_by('-transaction_date', '-created_at', 'id')[:51],
+                {'idx_transactions_desc_trgm', 'idx_transactions_memo_trgm', 'idx_transactions_user_date'},
+                None,
+            ),
+        ]
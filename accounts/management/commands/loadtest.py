@@ -0,0 +1,133 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.loadtest import LoadTestError, login, run_load
+
+DEFAULT_PATHS = [
+    '/api/auth/session/',
+    '/api/auth/api/transactions/?limit=50',
+    '/api/auth/api/transactions/summary/',
+    '/api/categories/',
+]
+
+# --serve 로 띄우는 서버 (WSGI 동기 워커 / ASGI + async 뷰)
+SERVERS = {
+    'wsgi': {
+        'command': ['-m', 'gunicorn', 'backend.wsgi:application', '--workers', '{workers}',
+                    '--bind', '127.0.0.1:{port}'],
+        'env': {'ASYNC_VIEWS': 'False'},
+    },
+    'asgi': {
+        'command': ['-m', 'uvicorn', 'backend.asgi:application', '--workers', '{workers}',
+                    '--host', '127.0.0.1', '--port', '{port}', '--no-access-log'],
+        'env': {'ASYNC_VIEWS': 'True'},
+    },
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        '읽기 API 에 동시 클라이언트 수를 늘려가며 요청을 보내 처리량과 응답 시간 '
+        '백분위수를 측정합니다. --serve 로 gunicorn(WSGI 동기 워커)과 '
+        'uvicorn(ASGI + async 뷰)을 같은 워커 수로 띄워 비교할 수 있습니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000', help='--serve 가 없을 때 대상 서버')
+        parser.add_argument(
+            '--serve', action='append', choices=sorted(SERVERS),
+            help='서버를 직접 띄워 측정 (여러 번 지정 가능, 예: --serve wsgi --serve asgi)'
+        )
+        parser.add_argument('--workers', type=int, default=2, help='--serve 서버의 워커 프로세스 수')
+        parser.add_argument('--username', required=True, help='로그인할 사용자')
+        parser.add_argument('--password', required=True)
+        parser.add_argument('--path', action='append', dest='paths', help='요청할 경로 (기본: 읽기 API 4종)')
+        parser.add_argument('--concurrency', default='1,10,50,100', help='동시 클라이언트 수 목록')
+        parser.add_argument('--requests', type=int, default=1000, help='동시성 단계별 요청 수')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',')]
+        except ValueError:
+            raise CommandError('--concurrency 는 쉼표로 구분한 정수 목록이어야 합니다.')
+        paths = options['paths'] or DEFAULT_PATHS
+
+        results = {}
+        for name in options['serve'] or [None]:
+            if name is None:
+                results[options['base_url']] = self.measure(options['base_url'], paths, levels, options)
+                continue
+            process, base_url = self.start_server(name, options['workers'])
+            try:
+                results[name] = self.measure(base_url, paths, levels, options)
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+
+    def measure(self, base_url, paths, levels, options):
+        try:
+            cookie = login(base_url, options['username'], options['password'])
+        except (LoadTestError, OSError) as e:
+            raise CommandError(f'{base_url}: {e}')
+
+        results = []
+        for concurrency in levels:
+            result = run_load(
+                base_url, paths, concurrency, options['requests'], headers={'Cookie': cookie}
+            )
+            result['concurrency'] = concurrency
+            results.append(result)
+            if not options['json']:
+                self.stdout.write(
+                    f'[{base_url}] 동시 {concurrency:>4}: {result["throughput_rps"]:>8.1f} req/s, '
+                    f'p50 {result["p50_ms"]:.1f}ms, p95 {result["p95_ms"]:.1f}ms, '
+                    f'p99 {result["p99_ms"]:.1f}ms, 오류 {result["errors"]}'
+                )
+        return results
+
+    def start_server(self, name, workers):
+        """서버를 띄우고 요청을 받을 수 있을 때까지 기다립니다."""
+        server = SERVERS[name]
+        port = _free_port()
+        command = [sys.executable] + [
+            part.format(workers=workers, port=port) for part in server['command']
+        ]
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'backend.settings'))
+        env.update(server['env'])
+        process = subprocess.Popen(
+            command, cwd=settings.BASE_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f'{name} 서버 실행 실패: {" ".join(command)}')
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=1):
+                    break
+            except OSError:
+                time.sleep(0.2)
+        else:
+            process.terminate()
+            raise CommandError(f'{name} 서버가 30초 안에 시작되지 않았습니다.')
+
+        self.stderr.write(f'{name} 서버 실행: {" ".join(command)}')
+        return process, f'http://127.0.0.1:{port}'
@@ -0,0 +1,90 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import partitioning
+
+
+def _months_before(day, months):
+    """day 가 속한 달의 1일에서 months 개월 전 1일"""
+    index = day.year * 12 + day.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class Command(BaseCommand):
+    help = (
+        '거래 내역 테이블을 transaction_date 기준 기간별 파티션 테이블로 변환하고(--convert), '
+        '미래 파티션을 미리 만들고 보관 기간이 지난 파티션을 떼어냅니다. (PostgreSQL 전용) '
+        '옵션 없이 실행하면 파티션 유지 작업을 하므로 cron 등으로 매일 실행합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert', action='store_true',
+            help='일반 테이블을 파티션 테이블로 변환 (복사하는 동안 거래 내역 쓰기가 멈춤)'
+        )
+        parser.add_argument(
+            '--interval', choices=partitioning.INTERVALS,
+            help='파티션 단위 (기본: TRANSACTION_PARTITION_INTERVAL)'
+        )
+        parser.add_argument('--ahead', type=int, help='미리 만들어 둘 미래 파티션 수 (기본: TRANSACTION_PARTITION_AHEAD)')
+        parser.add_argument(
+            '--since', type=date.fromisoformat,
+            help='변환 시 첫 파티션 기준일 YYYY-MM-DD (기본: 가장 오래된 거래일, 이전 날짜는 DEFAULT 파티션)'
+        )
+        parser.add_argument('--drop-old', action='store_true', help='변환 후 원래 테이블 삭제')
+        parser.add_argument(
+            '--detach-before', type=date.fromisoformat,
+            help='이 날짜 YYYY-MM-DD 이전 기간의 파티션을 떼어냄 (기본: TRANSACTION_PARTITION_RETENTION_MONTHS)'
+        )
+        parser.add_argument('--drop', action='store_true', help='떼어낸 파티션 테이블 삭제')
+        parser.add_argument('--status', action='store_true', help='파티션 목록만 출력')
+
+    def handle(self, *args, **options):
+        interval = options['interval'] or settings.TRANSACTION_PARTITION_INTERVAL
+        ahead = options['ahead']
+        if ahead is None:
+            ahead = settings.TRANSACTION_PARTITION_AHEAD
+
+        try:
+            if options['status']:
+                self.print_status()
+                return
+
+            if options['convert']:
+                created = partitioning.convert(
+                    interval=interval, ahead=ahead, since=options['since'],
+                    drop_old=options['drop_old'], stdout=self.stdout
+                )
+                self.stdout.write(self.style.SUCCESS(
+                    f'{partitioning.TABLE} 테이블을 {interval} 단위 파티션 {len(created)}개로 변환했습니다.'
+                ))
+                if not options['drop_old']:
+                    self.stdout.write(
+                        f'원래 테이블은 {partitioning.OLD_TABLE} 로 남아 있습니다. '
+                        f'확인 후 DROP TABLE {partitioning.OLD_TABLE}; 로 삭제하세요.'
+                    )
+                return
+
+            created = partitioning.ensure_partitions(interval=interval, ahead=ahead)
+            self.stdout.write(f'새 파티션 {len(created)}개: {", ".join(created) or "-"}')
+
+            before = options['detach_before']
+            retention = settings.TRANSACTION_PARTITION_RETENTION_MONTHS
+            if before is None and retention > 0:
+                before = _months_before(date.today(), retention)
+            if before is not None:
+                detached = partitioning.detach_partitions(before, drop=options['drop'])
+                action = '삭제' if options['drop'] else '떼어냄'
+                self.stdout.write(f'{before} 이전 파티션 {len(detached)}개 {action}: {", ".join(detached) or "-"}')
+        except (RuntimeError, partitioning.PartitioningError) as e:
+            raise CommandError(str(e))
+
+    def print_status(self):
+        if not partitioning.is_partitioned():
+            self.stdout.write(f'{partitioning.TABLE} 테이블은 파티션 테이블이 아닙니다.')
+            return
+        for name, start, end, rows in partitioning.list_partitions():
+            bounds = f'{start} ~ {end}' if start else 'DEFAULT'
+            self.stdout.write(f'{name:<32} {bounds:<25} 약 {rows}건')
@@ -0,0 +1,23 @@
+import getpass
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from accounts.profiling import issue_token
+
+
+class Command(BaseCommand):
+    help = (
+        '특정 요청을 프로파일링하기 위한 X-Profile 헤더 토큰을 발급합니다. '
+        '서버의 SECRET_KEY 로 서명되며 PROFILING_TOKEN_MAX_AGE 초 동안 유효합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--issued-by', help='로그에 남길 발급자 (기본: 현재 OS 사용자)')
+
+    def handle(self, *args, **options):
+        token = issue_token(options['issued_by'] or getpass.getuser())
+        if not settings.PROFILING_ENABLED:
+            self.stderr.write('PROFILING_ENABLED 가 꺼져 있어 헤더가 무시됩니다.')
+        self.stderr.write(f'유효 시간: {settings.PROFILING_TOKEN_MAX_AGE}초')
+        self.stdout.write(token)
@@ -0,0 +1,66 @@
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from accounts import provisioning
+from accounts.importer import ImportFormatError, read_csv
+
+
+class Command(BaseCommand):
+    help = (
+        'CSV 파일(username,email[,password] 헤더)의 사용자를 일괄 등록합니다. '
+        '중복 확인은 쿼리 한 번, 비밀번호 해시는 여러 프로세스, 저장은 배치 단위 bulk_create 로 처리합니다. '
+        'password 가 비어 있는 사용자는 로그인할 수 없는 비밀번호로 만듭니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help='CSV 파일 경로 (- 이면 표준 입력)')
+        parser.add_argument('--partial', action='store_true', help='오류 행만 건너뛰고 나머지 등록')
+        parser.add_argument('--dry-run', action='store_true', help='검증과 중복 확인만 하고 등록하지 않음')
+        parser.add_argument('--processes', type=int, help='비밀번호 해시 프로세스 수 (기본: PROVISIONING_PROCESSES)')
+        parser.add_argument('--batch-size', type=int, help='bulk_create 배치 크기 (기본: PROVISIONING_BATCH_SIZE)')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            if options['csv_path'] == '-':
+                raw = sys.stdin.buffer.read()
+            else:
+                with open(options['csv_path'], 'rb') as f:
+                    raw = f.read()
+            rows = read_csv(raw, provisioning.REQUIRED_FIELDS)
+        except OSError as e:
+            raise CommandError(f'파일을 읽을 수 없습니다: {e}')
+        except ImportFormatError as e:
+            raise CommandError(str(e))
+
+        objects, passwords, errors = provisioning.build_users(rows)
+        checked = time.perf_counter()
+        self.stdout.write(
+            f'{len(rows)}행 검증: 등록 대상 {len(objects)}명, 오류 {len(errors)}건 ({checked - started:.1f}초)'
+        )
+        for error in errors[:20]:
+            self.stdout.write(f'  {error["row"]}행: {error["message"]}')
+        if len(errors) > 20:
+            self.stdout.write(f'  ... 외 {len(errors) - 20}건')
+
+        if errors and not options['partial']:
+            raise CommandError('오류가 있어 등록하지 않았습니다. 오류 행을 건너뛰려면 --partial 을 사용하세요.')
+        if options['dry_run'] or not objects:
+            return
+
+        try:
+            created = provisioning.provision_users(
+                objects, passwords,
+                processes=options['processes'] or settings.PROVISIONING_PROCESSES,
+                batch_size=options['batch_size']
+            )
+        except IntegrityError as e:
+            raise CommandError(f'등록 중 중복된 아이디 또는 이메일이 생겼습니다. 다시 실행해주세요. ({e})')
+        self.stdout.write(self.style.SUCCESS(
+            f'사용자 {created}명을 등록했습니다. ({time.perf_counter() - checked:.1f}초, '
+            f'전체 {time.perf_counter() - started:.1f}초)'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import rollup
+
+
+class Command(BaseCommand):
+    help = '일별 집계 테이블(daily_balances)을 거래 내역으로부터 다시 만들거나 검증합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help='특정 사용자 id 만 처리')
+        parser.add_argument(
+            '--verify', action='store_true', help='다시 만들지 않고 원본과의 차이만 검사'
+        )
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create 배치 크기')
+
+    def handle(self, *args, **options):
+        user_id = options['user']
+
+        if not options['verify']:
+            created = rollup.rebuild(user_id=user_id, batch_size=options['batch_size'])
+            self.stdout.write(f'집계 행 {created}개를 다시 만들었습니다.')
+
+        mismatches = rollup.verify(user_id=user_id)
+        for (uid, day, category_id), expected, actual in mismatches[:20]:
+            self.stdout.write(
+                f'  user={uid} date={day} category={category_id} '
+                f'기대값={expected} 실제값={actual}'
+            )
+        if mismatches:
+            raise CommandError(f'집계 불일치 {len(mismatches)}건')
+        self.stdout.write(self.style.SUCCESS('집계 테이블이 거래 내역과 일치합니다.'))
@@ -0,0 +1,263 @@
+"""요청별 성능 지표 수집
+
+RequestMetricsMiddleware 를 MIDDLEWARE 맨 앞에 두면 요청마다
+- 전체 처리 시간
+- DB 쿼리 수와 쿼리 실행 시간
+- 직렬화(JSON 변환) 시간
+- 응답 크기
+를 URL 이름(view) 별로 누적하고, /metrics 에서 Prometheus 텍스트 형식으로
+보여줍니다. METRICS_SERVER_TIMING 이 켜져 있으면 같은 값을 Server-Timing
+헤더로 내려보내 브라우저 개발자 도구에서 바로 확인할 수 있습니다.
+
+지표는 프로세스 메모리에 쌓이므로 워커별로 따로 집계됩니다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .query_budget import count_queries
+
+METRIC_PREFIX = 'money_check'
+# 응답 시간 히스토그램 구간(초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# URL 에 매칭되지 않은 요청(404 등)의 view 라벨
+UNMATCHED_VIEW = 'unmatched'
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class RequestMetrics:
+    """처리 중인 요청 하나의 측정값"""
+
+    def __init__(self):
+        self.serialization = 0.0
+
+
+# async 뷰의 sync_to_async 스레드에도 컨텍스트가 복사되므로 같은 객체에 누적됨
+_current = ContextVar('request_metrics', default=None)
+
+
+@contextmanager
+def serialization_timer():
+    """블록(또는 데코레이터로 감싼 함수) 실행 시간을 현재 요청의 직렬화 시간에 더합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        current = _current.get()
+        if current is not None:
+            current.serialization += time.perf_counter() - started
+
+
+class _ViewStats:
+    __slots__ = ('requests', 'buckets', 'duration', 'queries', 'db_time', 'serialization', 'response_bytes')
+
+    def __init__(self):
+        self.requests = {}  # (method, status) -> 요청 수
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.duration = 0.0
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialization = 0.0
+        self.response_bytes = 0
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+class MetricsRegistry:
+    """view 별 누적 지표 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def _stats(self, view):
+        stats = self._views.get(view)
+        if stats is None:
+            stats = self._views[view] = _ViewStats()
+        return stats
+
+    def observe(self, view, method, status, duration, queries, db_time, serialization, response_bytes):
+        with self._lock:
+            stats = self._stats(view)
+            key = (method, status)
+            stats.requests[key] = stats.requests.get(key, 0) + 1
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    stats.buckets[index] += 1
+            stats.duration += duration
+            stats.queries += queries
+            stats.db_time += db_time
+            stats.serialization += serialization
+            stats.response_bytes += response_bytes
+
+    def add_response_bytes(self, view, response_bytes):
+        """스트리밍 응답처럼 전송이 끝난 뒤에 크기를 알 수 있는 경우"""
+        with self._lock:
+            self._stats(view).response_bytes += response_bytes
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+    def render(self):
+        """Prometheus 텍스트 형식 (exposition format 0.0.4)"""
+        with self._lock:
+            views = sorted(self._views.items())
+            lines = []
+
+            def family(name, kind, help_text):
+                lines.append(f'# HELP {METRIC_PREFIX}_{name} {help_text}')
+                lines.append(f'# TYPE {METRIC_PREFIX}_{name} {kind}')
+
+            family('http_requests_total', 'counter', 'Requests by view, method and status code.')
+            for view, stats in views:
+                for (method, status), count in sorted(stats.requests.items()):
+                    labels = _labels(view=view, method=method, status=status)
+                    lines.append(f'{METRIC_PREFIX}_http_requests_total{labels} {count}')
+
+            family('http_request_duration_seconds', 'histogram', 'Wall time spent handling the request.')
+            for view, stats in views:
+                total = sum(stats.requests.values())
+                for bound, count in zip(DURATION_BUCKETS, stats.buckets):
+                    labels = _labels(view=view, le=bound)
+                    lines.append(f'{METRIC_PREFIX}_http_request_duration_seconds_bucket{labels} {count}')
+                labels = _labels(view=view, le='+Inf')
+                lines.append(f'{METRIC_PREFIX}_http_request_duration_seconds_bucket{labels} {total}')
+                labels = _labels(view=view)
+                lines.append(f'{METRIC_PREFIX}_http_request_duration_seconds_sum{labels} {stats.duration:.6f}')
+                lines.append(f'{METRIC_PREFIX}_http_request_duration_seconds_count{labels} {total}')
+
+            for name, attr, help_text, fmt in (
+                ('db_queries_total', 'queries', 'Database queries executed.', '{}'),
+                ('db_query_duration_seconds_total', 'db_time', 'Time spent executing database queries.', '{:.6f}'),
+                ('serialization_duration_seconds_total', 'serialization', 'Time spent encoding response bodies.', '{:.6f}'),
+                ('http_response_size_bytes_total', 'response_bytes', 'Response body bytes sent.', '{}'),
+            ):
+                family(name, 'counter', help_text)
+                for view, stats in views:
+                    value = fmt.format(getattr(stats, attr))
+                    lines.append(f'{METRIC_PREFIX}_{name}{_labels(view=view)} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+def _view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else UNMATCHED_VIEW
+
+
+def _count_stream(view, content):
+    size = 0
+    try:
+        for chunk in content:
+            size += len(chunk)
+            yield chunk
+    finally:
+        registry.add_response_bytes(view, size)
+
+
+class RequestMetricsMiddleware:
+    """요청별 처리 시간/쿼리/직렬화 시간/응답 크기를 registry 에 기록하는 미들웨어
+
+    세션·인증 미들웨어 처리 시간도 포함하도록 MIDDLEWARE 맨 앞에 둡니다.
+    METRICS_ENABLED 가 False 면 미들웨어 체인에서 빠집니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        current = RequestMetrics()
+        token = _current.set(current)
+        started = time.perf_counter()
+        try:
+            with count_queries() as counter:
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.record(request, response, time.perf_counter() - started, counter, current)
+
+    async def __acall__(self, request):
+        current = RequestMetrics()
+        token = _current.set(current)
+        started = time.perf_counter()
+        # async ORM 쿼리가 실행되는 요청별 스레드의 연결에 카운터를 검 (QueryBudgetMiddleware 와 동일)
+        counting = count_queries()
+        counter = await sync_to_async(counting.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(counting.__exit__)(None, None, None)
+            _current.reset(token)
+        return self.record(request, response, time.perf_counter() - started, counter, current)
+
+    def record(self, request, response, duration, counter, current):
+        view = _view_name(request)
+        response_bytes = 0
+        if not response.streaming:
+            response_bytes = len(response.content)
+        elif not getattr(response, 'is_async', False):
+            response.streaming_content = _count_stream(view, response.streaming_content)
+
+        registry.observe(
+            view, request.method, response.status_code, duration,
+            counter.count, counter.duration, current.serialization, response_bytes
+        )
+        if getattr(settings, 'METRICS_SERVER_TIMING', False):
+            response['Server-Timing'] = (
+                f'db;dur={counter.duration * 1000:.2f};desc="{counter.count} queries", '
+                f'ser;dur={current.serialization * 1000:.2f}, '
+                f'total;dur={duration * 1000:.2f}'
+            )
+        return response
+
+
+def client_ip(request):
+    """요청한 클라이언트 IP
+
+    REMOTE_ADDR 가 METRICS_TRUSTED_PROXIES 에 있는 프록시면 X-Forwarded-For 를
+    오른쪽부터 읽어 신뢰하는 프록시가 아닌 첫 주소를 씁니다. 왼쪽 값은
+    클라이언트가 임의로 넣을 수 있으므로 쓰지 않습니다. 헤더가 없으면 프록시를
+    거치지 않은 요청으로 보고 REMOTE_ADDR 를 씁니다.
+    """
+    remote_addr = request.META.get('REMOTE_ADDR')
+    trusted = getattr(settings, 'METRICS_TRUSTED_PROXIES', [])
+    if remote_addr not in trusted:
+        return remote_addr
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if not forwarded:
+        return remote_addr
+    addrs = [addr.strip() for addr in forwarded.split(',')]
+    for addr in reversed(addrs):
+        if addr not in trusted:
+            return addr
+    # 모두 신뢰하는 주소면 가장 처음 주소(프록시와 같은 서버의 클라이언트)
+    return addrs[0]
+
+
+def client_allowed(request):
+    """지표 엔드포인트 접근 허용 여부 (METRICS_ALLOWED_IPS)"""
+    return client_ip(request) in getattr(settings, 'METRICS_ALLOWED_IPS', ['127.0.0.1', '::1'])
@@ -0,0 +1,106 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from . import cache
+
+# 세션에 마지막 만료 연장 시각을 기록하는 키
+SESSION_RENEWED_AT_KEY = '_renewed_at'
+
+
+class SlidingSessionMiddleware:
+    """만료가 가까워진 세션만 연장하는 미들웨어
+
+    SESSION_SAVE_EVERY_REQUEST = True 는 읽기 요청마다 세션을 저장(UPDATE)
+    하므로, 대신 남은 유효 시간이 SESSION_RENEW_THRESHOLD 초 미만일 때만
+    세션을 수정 상태로 표시해 저장과 쿠키 만료 갱신이 일어나게 합니다.
+    SessionMiddleware 다음에 둡니다. ASGI 에서는 async 로 동작합니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        self.renew(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        # 세션 데이터 로딩은 동기 DB/캐시 접근
+        await sync_to_async(self.renew)(request)
+        return response
+
+    def renew(self, request):
+        session = getattr(request, 'session', None)
+        if session is None or settings.SESSION_SAVE_EVERY_REQUEST:
+            return
+        # 세션이 없는 요청(익명 사용자 등)에는 새 세션을 만들지 않음
+        if session.is_empty():
+            return
+
+        now = int(time.time())
+        renewed_at = session.get(SESSION_RENEWED_AT_KEY)
+        if (
+            session.modified  # 어차피 저장되는 요청이면 연장 시각도 함께 기록
+            or renewed_at is None
+            or session.get_expiry_age() - (now - renewed_at) < settings.SESSION_RENEW_THRESHOLD
+        ):
+            session[SESSION_RENEWED_AT_KEY] = now
+
+
+def get_cached_user(request):
+    """auth.get_user 와 같은 결과를 사용자 캐시로 만듭니다.
+
+    세션의 인증 해시가 캐시된 값과 다르면(다른 곳에서 비밀번호 변경)
+    auth.get_user 처럼 세션을 삭제(flush)합니다. SECRET_KEY_FALLBACKS 로 키를
+    교체하는 중이면 이전 키의 해시를 새 키로 바꾸도록 auth.get_user 에 맡깁니다.
+
+    쿼리: 캐시가 차 있으면 0회, 비어 있으면 사용자 조회 1회, 세션을 flush 하면
+    세션 조회/삭제 2회가 더 듭니다 (세션 로딩 1회 별도, @query_budget 참고).
+    """
+    try:
+        user_id = int(request.session[auth.SESSION_KEY])
+        backend_path = request.session[auth.BACKEND_SESSION_KEY]
+    except (KeyError, TypeError, ValueError):
+        return AnonymousUser()
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return AnonymousUser()
+
+    cached = cache.get_auth_user(user_id)
+    if cached is None:
+        return AnonymousUser()
+    user, session_hash = cached
+    # ModelBackend.user_can_authenticate 와 동일
+    if not user.is_active:
+        return AnonymousUser()
+    if not constant_time_compare(request.session.get(auth.HASH_SESSION_KEY, ''), session_hash):
+        if settings.SECRET_KEY_FALLBACKS:
+            return auth.get_user(request)
+        request.session.flush()
+        return AnonymousUser()
+    return user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """request.user 를 DB 대신 사용자 캐시(cache.get_auth_user)에서 읽는 AuthenticationMiddleware
+
+    세션 저장소도 캐시(cached_db)를 쓰면 로그인한 사용자의 읽기 요청은
+    인증 관련 쿼리 없이 처리됩니다.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
@@ -1,7 +1,6 @@
 # Generated by Django 4.2.21 on 2025-05-29 07:24
 
-from django.db import migrations, models
-import django.utils.timezone
+from django.db import migrations
 
 
 class Migration(migrations.Migration):
@@ -10,10 +9,7 @@ class Migration(migrations.Migration):
         ('accounts', '0003_auto_20250529_1615'),
     ]
 
+    # categories.updated_at 은 0002 의 CreateModel 에 이미 포함되어 있어 새 DB 에서
+    # AddField 가 'column already exists' 로 실패하므로 비워 둠 (적용된 DB 에는 영향 없음)
     operations = [
-        migrations.AddField(
-            model_name='category',
-            name='updated_at',
-            field=models.DateTimeField(auto_now=True),
-        ),
     ]
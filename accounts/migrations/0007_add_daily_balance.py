@@ -0,0 +1,61 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:48
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_daily_balances(apps, schema_editor):
+    """기존 거래 내역으로 집계 테이블을 채웁니다."""
+    Transaction = apps.get_model('accounts', 'Transaction')
+    DailyBalance = apps.get_model('accounts', 'DailyBalance')
+    groups = (
+        Transaction.objects.order_by()
+        .values('user_id', 'transaction_date', 'category_id')
+        .annotate(
+            income=models.Sum('amount', filter=models.Q(transaction_type='income')),
+            expense=models.Sum('amount', filter=models.Q(transaction_type='expense'))
+        )
+    )
+    DailyBalance.objects.bulk_create([
+        DailyBalance(
+            user_id=row['user_id'],
+            date=row['transaction_date'],
+            category_id=row['category_id'],
+            income_sum=row['income'] or 0,
+            expense_sum=row['expense'] or 0
+        )
+        for row in groups.iterator()
+    ], batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_add_transaction_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='일자')),
+                ('income_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='수입 합계')),
+                ('expense_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='지출 합계')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_balances', to='accounts.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_balances', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '일별 잔액',
+                'verbose_name_plural': '일별 잔액들',
+                'db_table': 'daily_balances',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailybalance',
+            constraint=models.UniqueConstraint(fields=('user', 'date', 'category'), name='uniq_daily_balances_user_date_category'),
+        ),
+        migrations.RunPython(backfill_daily_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_add_daily_balance'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='ledger_version',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='거래 내역 버전'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_add_user_ledger_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TransactionTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('transaction_id', models.BigIntegerField(verbose_name='거래 내역 ID')),
+                ('version', models.PositiveBigIntegerField(verbose_name='버전')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '삭제된 거래 내역',
+                'verbose_name_plural': '삭제된 거래 내역들',
+                'db_table': 'transaction_tombstones',
+            },
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='버전'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'version'], name='idx_transactions_user_version'),
+        ),
+        migrations.AddField(
+            model_name='transactiontombstone',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transaction_tombstones', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='transactiontombstone',
+            index=models.Index(fields=['user', 'version'], name='idx_tombstones_user_version'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:54
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.text
+
+from accounts.operations import PostgresOnly
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_add_transaction_sync'),
+    ]
+
+    operations = [
+        # 설명/메모 검색용 trigram 인덱스에 필요
+        PostgresOnly(TrigramExtension()),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='idx_transactions_user_category',
+        ),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='idx_transactions_user_type',
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'category', '-transaction_date', '-created_at', 'id'], name='idx_transactions_user_category'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'transaction_type', '-transaction_date', '-created_at', 'id'], name='idx_transactions_user_type'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-amount', 'id'], name='idx_transactions_user_amount'),
+        ),
+        PostgresOnly(migrations.AddIndex(
+            model_name='transaction',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='idx_transactions_desc_trgm'),
+        )),
+        PostgresOnly(migrations.AddIndex(
+            model_name='transaction',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('memo'), name='gin_trgm_ops'), name='idx_transactions_memo_trgm'),
+        )),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:13
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+from accounts.operations import PostgresOnly
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_add_transaction_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-date_joined', '-id'], name='idx_users_date_joined'),
+        ),
+        # text_pattern_ops 는 PostgreSQL 연산자 클래스
+        PostgresOnly(migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('username'), name='text_pattern_ops'), name='idx_users_username_prefix'),
+        )),
+        PostgresOnly(migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='text_pattern_ops'), name='idx_users_email_prefix'),
+        )),
+    ]
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 class User(AbstractUser):
     """커스텀 사용자 모델"""
@@ -7,15 +9,41 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     email = models.EmailField(unique=True)
+    # 거래 내역이 바뀔 때마다 1씩 증가 (목록 ETag 용)
+    ledger_version = models.PositiveBigIntegerField('거래 내역 버전', default=0)
 
     class Meta:
         db_table = 'users'
         verbose_name = '사용자'
         verbose_name_plural = '사용자들'
+        indexes = [
+            # 관리자 사용자 목록 정렬/커서 페이지네이션
+            models.Index(fields=['-date_joined', '-id'], name='idx_users_date_joined'),
+            # 사용자명/이메일 앞부분 검색 (istartswith 가 만드는 UPPER(...) LIKE 'ABC%' 에 맞춘 인덱스,
+            # text_pattern_ops 라서 DB 콜레이션과 관계없이 LIKE 앞부분 일치에 사용됨)
+            models.Index(
+                OpClass(Upper('username'), name='text_pattern_ops'),
+                name='idx_users_username_prefix'
+            ),
+            models.Index(
+                OpClass(Upper('email'), name='text_pattern_ops'),
+                name='idx_users_email_prefix'
+            ),
+        ]
 
     def __str__(self):
         return self.username
 
+    def save(self, *args, **kwargs):
+        # ledger_version 은 ledger.bump_version 이 UPDATE ... + 1 로만 바꿈. 전체 저장(관리자 화면,
+        # changepassword 등)이 읽어 둔 예전 값을 다시 쓰면 버전이 되돌아가므로 기존 행이면 빼고 저장
+        if self.pk is not None and not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'ledger_version'
+            ]
+        super().save(*args, **kwargs)
+
 class Category(models.Model):
     """카테고리 모델"""
     TYPE_CHOICES = [
@@ -56,6 +84,8 @@ class Transaction(models.Model):
     description = models.CharField('설명', max_length=200)
     transaction_date = models.DateField('거래 날짜')
     memo = models.TextField('메모', blank=True, null=True)
+    # 마지막으로 변경될 때의 User.ledger_version (변경분 동기화용)
+    version = models.PositiveBigIntegerField('버전', default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -64,6 +94,80 @@ class Transaction(models.Model):
         verbose_name = '거래 내역'
         verbose_name_plural = '거래 내역들'
         ordering = ['-transaction_date', '-created_at']
+        indexes = [
+            # 목록 조회/커서 페이지네이션 정렬 순서와 동일
+            models.Index(
+                fields=['user', '-transaction_date', '-created_at', 'id'],
+                name='idx_transactions_user_date'
+            ),
+            # 카테고리 필터 + 기본 정렬
+            models.Index(
+                fields=['user', 'category', '-transaction_date', '-created_at', 'id'],
+                name='idx_transactions_user_category'
+            ),
+            # 수입/지출 유형 필터 + 기본 정렬
+            models.Index(
+                fields=['user', 'transaction_type', '-transaction_date', '-created_at', 'id'],
+                name='idx_transactions_user_type'
+            ),
+            # 금액 정렬/범위 조회
+            models.Index(fields=['user', '-amount', 'id'], name='idx_transactions_user_amount'),
+            # 설명/메모 검색 (icontains 가 만드는 UPPER(...) LIKE '%...%' 에 맞춘 trigram 인덱스)
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='idx_transactions_desc_trgm'
+            ),
+            GinIndex(
+                OpClass(Upper('memo'), name='gin_trgm_ops'),
+                name='idx_transactions_memo_trgm'
+            ),
+            # 변경분 동기화
+            models.Index(fields=['user', 'version'], name='idx_transactions_user_version'),
+        ]
     
     def __str__(self):
-        return f"{self.get_transaction_type_display()} - {self.description} ({self.amount}원)" 
\ No newline at end of file
+        return f"{self.get_transaction_type_display()} - {self.description} ({self.amount}원)" 
+
+class TransactionTombstone(models.Model):
+    """삭제된 거래 내역 기록 (변경분 동기화 시 삭제 id 전달용)"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='transaction_tombstones')
+    transaction_id = models.BigIntegerField('거래 내역 ID')
+    version = models.PositiveBigIntegerField('버전')
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'transaction_tombstones'
+        verbose_name = '삭제된 거래 내역'
+        verbose_name_plural = '삭제된 거래 내역들'
+        indexes = [
+            models.Index(fields=['user', 'version'], name='idx_tombstones_user_version'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} #{self.transaction_id} (v{self.version})"
+
+class DailyBalance(models.Model):
+    """사용자/일자/카테고리별 수입·지출 합계 (Transaction 집계 테이블)
+
+    거래 내역이 생성/수정/삭제될 때마다 accounts.rollup 에서 증분 갱신합니다.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_balances')
+    date = models.DateField('일자')
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='daily_balances')
+    income_sum = models.DecimalField('수입 합계', max_digits=14, decimal_places=2, default=0)
+    expense_sum = models.DecimalField('지출 합계', max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'daily_balances'
+        verbose_name = '일별 잔액'
+        verbose_name_plural = '일별 잔액들'
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'date', 'category'],
+                name='uniq_daily_balances_user_date_category'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.date} {self.category} (+{self.income_sum} / -{self.expense_sum})"
@@ -0,0 +1,44 @@
+"""마이그레이션용 작업(operation)"""
+from django.db.migrations.operations.base import Operation
+
+
+class PostgresOnly(Operation):
+    """감싼 작업의 DDL 을 PostgreSQL 에서만 실행합니다.
+
+    trigram 확장, gin_trgm_ops/text_pattern_ops 인덱스처럼 PostgreSQL 전용
+    작업에 씁니다. 모델 상태는 DB 와 관계없이 바꾸므로 이후 마이그레이션과
+    makemigrations 는 PostgreSQL 과 같은 상태를 봅니다. 다른 DB(SQLite 등)에는
+    해당 확장/인덱스가 없습니다.
+    """
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    @property
+    def reduces_to_sql(self):
+        return self.operation.reduces_to_sql
+
+    @property
+    def reversible(self):
+        return self.operation.reversible
+
+    def deconstruct(self):
+        return self.__class__.__name__, [self.operation], {}
+
+    def state_forwards(self, app_label, state):
+        self.operation.state_forwards(app_label, state)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            self.operation.database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            self.operation.database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f'{self.operation.describe()} (PostgreSQL 전용)'
+
+    @property
+    def migration_name_fragment(self):
+        return self.operation.migration_name_fragment
@@ -0,0 +1,133 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db.models import Q
+
+# 페이지 크기 기본값/상한값
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursor(ValueError):
+    """잘못된 커서 또는 limit 값"""
+
+
+def _to_json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # float 로 바꾸면 자릿수가 틀어질 수 있으므로 문자열로 보관
+        return str(value)
+    return value
+
+
+def encode_cursor(values):
+    """정렬 키 값 목록을 URL 에 실을 수 있는 불투명 문자열로 변환합니다."""
+    raw = json.dumps([_to_json_value(v) for v in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, ordering):
+    """encode_cursor 로 만든 문자열을 정렬 키 값 목록으로 되돌립니다."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise InvalidCursor('잘못된 커서입니다.')
+
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor('잘못된 커서입니다.')
+
+    decoded = []
+    for value, (_field, _descending, kind) in zip(values, ordering):
+        try:
+            if kind is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            elif kind is date:
+                decoded.append(date.fromisoformat(value))
+            else:
+                decoded.append(kind(value))
+        except (ValueError, TypeError, ArithmeticError):  # Decimal 은 InvalidOperation
+            raise InvalidCursor('잘못된 커서입니다.')
+    return decoded
+
+
+def parse_limit(raw_limit):
+    """limit 쿼리 파라미터를 검증해 정수로 반환합니다."""
+    if raw_limit in (None, ''):
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw_limit)
+    except (TypeError, ValueError):
+        raise InvalidCursor('limit 은 정수여야 합니다.')
+    if limit < 1:
+        raise InvalidCursor('limit 은 1 이상이어야 합니다.')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _after_cursor(ordering, values):
+    """커서 이후의 행만 남기는 Q 식을 만듭니다.
+
+    (a, b, c) 정렬에서 커서 (x, y, z) 이후 행은
+    a >= x AND (a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)) 이며,
+    내림차순 필드는 비교 방향만 뒤집습니다.
+
+    앞의 a >= x 는 OR 식과 중복이지만, 이것이 있어야 플래너가 첫 정렬 필드를
+    인덱스 조건으로 써서 커서 위치부터 읽기 시작합니다. 없으면 커서 이전의
+    행을 모두 읽고 필터로 버리므로 뒤 페이지일수록 느려집니다.
+    """
+    first_field, first_descending, _kind = ordering[0]
+    bound = Q(**{f'{first_field}__{"lte" if first_descending else "gte"}': values[0]})
+    condition = Q()
+    for i, (field, descending, _kind) in enumerate(ordering):
+        lookup = 'lt' if descending else 'gt'
+        branch = Q(**{f'{field}__{lookup}': values[i]})
+        for (prev_field, _desc, _kind), prev_value in zip(ordering[:i], values):
+            branch &= Q(**{prev_field: prev_value})
+        condition |= branch
+    return bound & condition
+
+
+def keyset_paginate(queryset, ordering, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """키셋(커서) 방식으로 queryset 의 한 페이지를 가져옵니다.
+
+    ordering 은 (필드명, 내림차순 여부, 값 타입) 튜플 목록이며 마지막 필드는
+    유일해야 합니다. OFFSET 을 쓰지 않으므로 몇 번째 페이지든 인덱스 탐색
+    한 번으로 끝납니다.
+
+    반환값: (행 목록, 다음 커서 또는 None)
+    """
+    queryset = page_queryset(queryset, ordering, cursor, limit)
+    return page_result(list(queryset), ordering, limit)
+
+
+def page_queryset(queryset, ordering, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """keyset_paginate 가 실행하는 한 페이지 queryset (실행 계획 검증용)"""
+    order_by = [f'-{field}' if descending else field for field, descending, _ in ordering]
+    queryset = queryset.order_by(*order_by)
+
+    if cursor:
+        queryset = queryset.filter(_after_cursor(ordering, decode_cursor(cursor, ordering)))
+
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 가져옴
+    return queryset[:limit + 1]
+
+
+def page_result(rows, ordering, limit):
+    """page_queryset 을 실행한 행 목록을 (한 페이지 행 목록, 다음 커서 또는 None)으로 나눕니다.
+
+    async 뷰처럼 queryset 을 직접 실행하는 경우에 씁니다.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor([
+            last[field] if isinstance(last, dict) else getattr(last, field)
+            for field, _descending, _kind in ordering
+        ])
+    return rows, next_cursor
@@ -0,0 +1,334 @@
+"""거래 내역 테이블 기간별 파티셔닝 (PostgreSQL 선언적 파티셔닝)
+
+transactions 테이블을 transaction_date 기준 RANGE 파티션(월 또는 연 단위)으로
+바꾸고, 앞으로 쓸 파티션을 미리 만들고, 오래된 파티션을 떼어내는 작업을
+모읍니다. partition_transactions 관리 명령어에서 사용합니다.
+
+- 모델은 바꾸지 않습니다. 기본 키만 (id, transaction_date) 로 바뀌고 id 는
+  같은 시퀀스에서 계속 발급되므로 ORM 의 pk 조회/수정/삭제는 그대로 동작합니다.
+  transaction_date 를 바꾸는 수정은 PostgreSQL 이 행을 다른 파티션으로 옮깁니다.
+- 기간 조건(year, start_date/end_date)이 있는 조회는 해당 파티션만 읽습니다.
+- 어떤 파티션 범위에도 맞지 않는 날짜는 DEFAULT 파티션에 들어갑니다.
+"""
+import re
+from datetime import date
+
+from django.db import connection, transaction as db_transaction
+
+from .benchmark import require_postgresql
+from .models import DailyBalance, Transaction, User
+
+TABLE = Transaction._meta.db_table
+PARTITION_KEY = 'transaction_date'
+INTERVALS = ('month', 'year')
+DEFAULT_PARTITION = f'{TABLE}_default'
+# 변환 중 새 테이블 이름, 변환 후 원래 테이블 이름
+BUILD_TABLE = f'{TABLE}_partitioned'
+OLD_TABLE = f'{TABLE}_unpartitioned'
+
+_BOUND_PATTERN = re.compile(r"FROM \('([0-9-]+)'\) TO \('([0-9-]+)'\)")
+
+
+class PartitioningError(Exception):
+    """파티셔닝 작업을 진행할 수 없는 상태"""
+    pass
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def _old_name(name):
+    # 식별자 길이 제한(63자) 안에서 접미사 추가
+    return f'{name[:59]}_old'
+
+
+def period_start(day, interval):
+    """day 가 속한 파티션 구간의 시작일"""
+    if interval == 'year':
+        return date(day.year, 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def next_period(start, interval):
+    """start 다음 파티션 구간의 시작일"""
+    if interval == 'year':
+        return date(start.year + 1, 1, 1)
+    if start.month == 12:
+        return date(start.year + 1, 1, 1)
+    return date(start.year, start.month + 1, 1)
+
+
+def partition_name(start, interval):
+    """예: transactions_p2024_03 (월), transactions_p2024 (연)"""
+    if interval == 'year':
+        return f'{TABLE}_p{start:%Y}'
+    return f'{TABLE}_p{start:%Y_%m}'
+
+
+def periods(first, last, interval):
+    """first 가 속한 구간부터 last 가 속한 구간까지 (시작일, 끝일) 목록"""
+    start = period_start(first, interval)
+    result = []
+    while start <= last:
+        end = next_period(start, interval)
+        result.append((start, end))
+        start = end
+    return result
+
+
+def is_partitioned():
+    require_postgresql()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))',
+            [TABLE]
+        )
+        return cursor.fetchone()[0]
+
+
+def list_partitions():
+    """[(파티션 이름, 시작일, 끝일, 예상 행 수)] - 시작일 순, DEFAULT 파티션은 시작일/끝일이 None"""
+    require_postgresql()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), child.reltuples
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [TABLE]
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound, estimated_rows in rows:
+        match = _BOUND_PATTERN.search(bound)
+        start, end = (
+            (date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2)))
+            if match else (None, None)
+        )
+        partitions.append((name, start, end, max(int(estimated_rows), 0)))
+    partitions.sort(key=lambda partition: (partition[1] is None, partition[1] or date.min))
+    return partitions
+
+
+def _create_partition(cursor, parent, start, end, interval):
+    name = partition_name(start, interval)
+    cursor.execute(
+        f'CREATE TABLE {_quote(name)} PARTITION OF {_quote(parent)} FOR VALUES FROM (%s) TO (%s)',
+        [start, end]
+    )
+    return name
+
+
+def convert(interval='month', ahead=3, since=None, drop_old=False, stdout=None):
+    """transactions 를 RANGE 파티션 테이블로 바꿉니다.
+
+    파티션은 since(없으면 가장 오래된 거래일)가 속한 구간부터 오늘 이후
+    ahead 구간까지 만들고, 그 밖의 날짜는 DEFAULT 파티션에 들어갑니다.
+
+    한 DB 트랜잭션 안에서 새 파티션 테이블을 만들어 행을 복사한 뒤 이름을
+    맞바꾸므로 중간에 실패하면 원래 테이블이 그대로 남습니다. 복사하는 동안
+    조회는 가능하지만 쓰기는 기다립니다 (EXCLUSIVE 잠금).
+    drop_old 가 아니면 원래 테이블을 transactions_unpartitioned 로 남깁니다.
+
+    반환값: 만든 파티션 이름 목록
+    """
+    require_postgresql()
+    if interval not in INTERVALS:
+        raise PartitioningError(f'파티션 단위는 {", ".join(INTERVALS)} 중 하나여야 합니다.')
+    if is_partitioned():
+        raise PartitioningError(f'{TABLE} 테이블은 이미 파티션 테이블입니다.')
+
+    def log(message):
+        if stdout:
+            stdout.write(message)
+
+    table, build, old = _quote(TABLE), _quote(BUILD_TABLE), _quote(OLD_TABLE)
+    with db_transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE {table} IN EXCLUSIVE MODE')
+        cursor.execute('SELECT to_regclass(%s), to_regclass(%s)', [BUILD_TABLE, OLD_TABLE])
+        if any(cursor.fetchone()):
+            raise PartitioningError(f'{BUILD_TABLE} 또는 {OLD_TABLE} 테이블이 이미 있습니다.')
+
+        # 원래 테이블의 인덱스(기본 키 제외), 외래 키, 시퀀스 상태
+        cursor.execute(
+            """
+            SELECT index_class.relname, pg_get_indexdef(pg_index.indexrelid)
+            FROM pg_index
+            JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+            WHERE pg_index.indrelid = to_regclass(%s) AND NOT pg_index.indisprimary
+            ORDER BY index_class.relname
+            """,
+            [TABLE]
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [TABLE]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+            [TABLE]
+        )
+        primary_key = cursor.fetchone()[0]
+        cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [TABLE, 'id'])
+        sequence = cursor.fetchone()[0]
+        cursor.execute(f'SELECT last_value, is_called FROM {sequence}')
+        last_value, is_called = cursor.fetchone()
+        first_day = since
+        if first_day is None:
+            cursor.execute(f'SELECT min({PARTITION_KEY}) FROM {table}')
+            first_day = cursor.fetchone()[0] or date.today()
+
+        # 새 파티션 테이블 (컬럼, 기본값, identity, CHECK 제약 조건 복사)
+        cursor.execute(
+            f'CREATE TABLE {build} (LIKE {table} INCLUDING ALL EXCLUDING INDEXES) '
+            f'PARTITION BY RANGE ({PARTITION_KEY})'
+        )
+        # PostgreSQL 14~18 에서는 파티션 테이블에도 identity 가 복사됨. 복사되지 않는 버전이면
+        # 새 거래 내역의 id 가 비므로 변환하지 않음 (트랜잭션이 롤백되어 원래 테이블 유지)
+        cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [BUILD_TABLE, 'id'])
+        if cursor.fetchone()[0] is None:
+            raise PartitioningError(
+                f'{BUILD_TABLE}.id 에 identity/시퀀스가 복사되지 않았습니다. '
+                f'PostgreSQL {connection.pg_version // 10000} 에서는 변환할 수 없습니다.'
+            )
+        today = date.today()
+        last_day = period_start(today, interval)
+        for _ in range(ahead):
+            last_day = next_period(last_day, interval)
+        created = []
+        for start, end in periods(first_day, last_day, interval):
+            created.append(_create_partition(cursor, BUILD_TABLE, start, end, interval))
+        cursor.execute(f'CREATE TABLE {_quote(DEFAULT_PARTITION)} PARTITION OF {build} DEFAULT')
+        log(f'파티션 {len(created)}개 생성 ({created[0]} ~ {created[-1]}, {DEFAULT_PARTITION})')
+
+        # 인덱스는 복사 후에 만드는 편이 빠름
+        cursor.execute(f'INSERT INTO {build} SELECT * FROM {table}')
+        log(f'거래 내역 {cursor.rowcount}건 복사')
+
+        # 원래 테이블과 그 인덱스/제약 조건/시퀀스 이름을 비켜두고 새 테이블이 원래 이름을 가짐
+        cursor.execute(f'ALTER TABLE {table} RENAME TO {old}')
+        cursor.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {_quote(primary_key)} TO {_quote(OLD_TABLE + "_pkey")}')
+        for name, _ in indexes:
+            cursor.execute(f'ALTER INDEX {_quote(name)} RENAME TO {_quote(_old_name(name))}')
+        # 사용자/카테고리 삭제가 남겨둔 원래 테이블의 행 때문에 막히지 않도록 외래 키는 옮김
+        for name, _ in foreign_keys:
+            cursor.execute(f'ALTER TABLE {old} DROP CONSTRAINT {_quote(name)}')
+        cursor.execute(f'ALTER SEQUENCE {sequence} RENAME TO {_quote(OLD_TABLE + "_id_seq")}')
+
+        cursor.execute(f'ALTER TABLE {build} RENAME TO {table}')
+        cursor.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {_quote(primary_key)} PRIMARY KEY (id, {PARTITION_KEY})'
+        )
+        for _, definition in indexes:
+            # pg_get_indexdef 는 원래 테이블 이름으로 된 정의이므로 이름을 바꾼 새 테이블에 만들어짐
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {_quote(name)} {definition}')
+        log(f'인덱스 {len(indexes)}개, 외래 키 {len(foreign_keys)}개 생성')
+
+        # 삭제된 거래 내역 id(TransactionTombstone)가 재사용되지 않도록 원래 시퀀스 값에서 이어감
+        cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [TABLE, 'id'])
+        new_sequence = cursor.fetchone()[0]
+        cursor.execute(f'ALTER SEQUENCE {new_sequence} RENAME TO {_quote(TABLE + "_id_seq")}')
+        cursor.execute('SELECT setval(pg_get_serial_sequence(%s, %s), %s, %s)', [TABLE, 'id', last_value, is_called])
+
+        if drop_old:
+            cursor.execute(f'DROP TABLE {old}')
+        cursor.execute(f'ANALYZE {table}')
+    return created
+
+
+def _moved_from_default(cursor, start, end):
+    """DEFAULT 파티션에서 [start, end) 범위의 행을 임시 테이블 partition_moved 로
+    옮기고 옮긴 행 수를 반환합니다. DEFAULT 파티션이 없으면 None
+
+    DEFAULT 파티션에 새 파티션 범위의 행이 있으면 파티션을 만들 수 없습니다.
+    """
+    cursor.execute('SELECT to_regclass(%s)', [DEFAULT_PARTITION])
+    if cursor.fetchone()[0] is None:
+        return None
+    cursor.execute(
+        f"""
+        CREATE TEMPORARY TABLE partition_moved AS
+        WITH moved AS (
+            DELETE FROM {_quote(DEFAULT_PARTITION)}
+            WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s
+            RETURNING *
+        )
+        SELECT * FROM moved
+        """,
+        [start, end]
+    )
+    return cursor.rowcount
+
+
+def ensure_partitions(interval='month', ahead=3):
+    """오늘이 속한 구간부터 ahead 구간 뒤까지 없는 파티션을 만듭니다.
+
+    이미 있는 파티션과 겹치는 구간은 건너뜁니다. DEFAULT 파티션에 들어가 있던
+    해당 기간의 행은 새 파티션으로 옮겨집니다.
+    반환값: 만든 파티션 이름 목록
+    """
+    require_postgresql()
+    if interval not in INTERVALS:
+        raise PartitioningError(f'파티션 단위는 {", ".join(INTERVALS)} 중 하나여야 합니다.')
+    if not is_partitioned():
+        raise PartitioningError(f'{TABLE} 테이블이 파티션 테이블이 아닙니다. 먼저 --convert 로 변환하세요.')
+
+    existing = [(start, end) for _, start, end, _ in list_partitions() if start is not None]
+    last_day = period_start(date.today(), interval)
+    for _ in range(ahead):
+        last_day = next_period(last_day, interval)
+
+    created = []
+    for start, end in periods(date.today(), last_day, interval):
+        if any(start < other_end and other_start < end for other_start, other_end in existing):
+            continue
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            moved = _moved_from_default(cursor, start, end)
+            created.append(_create_partition(cursor, TABLE, start, end, interval))
+            if moved is not None:
+                cursor.execute(f'INSERT INTO {_quote(TABLE)} SELECT * FROM partition_moved')
+                cursor.execute('DROP TABLE partition_moved')
+    return created
+
+
+def detach_partitions(before, drop=False):
+    """끝일이 before 이하인(전체가 before 이전인) 파티션을 떼어냅니다.
+
+    떼어낸 파티션의 거래 내역은 API 에서 보이지 않게 되므로 같은 DB
+    트랜잭션에서 그 기간의 일별 집계(DailyBalance)를 지우고 해당 사용자의
+    거래 내역 버전을 올립니다(목록 ETag 무효화). 동기화 클라이언트에는 삭제
+    기록을 남기지 않으므로 이미 받아 간 사본은 클라이언트에 남습니다.
+    drop 이 아니면 떼어낸 테이블은 같은 이름으로 남아 pg_dump 등으로 보관할 수 있습니다.
+
+    반환값: 떼어낸 파티션 이름 목록
+    """
+    require_postgresql()
+    if not is_partitioned():
+        raise PartitioningError(f'{TABLE} 테이블이 파티션 테이블이 아닙니다.')
+
+    detached = []
+    for name, start, end, _ in list_partitions():
+        if end is None or end > before:
+            continue
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {_quote(User._meta.db_table)} SET ledger_version = ledger_version + 1 '
+                f'WHERE id IN (SELECT DISTINCT user_id FROM {_quote(name)})'
+            )
+            DailyBalance.objects.filter(date__gte=start, date__lt=end).delete()
+            cursor.execute(f'ALTER TABLE {_quote(TABLE)} DETACH PARTITION {_quote(name)}')
+            if drop:
+                cursor.execute(f'DROP TABLE {_quote(name)}')
+        detached.append(name)
+    return detached
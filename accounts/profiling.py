@@ -0,0 +1,231 @@
+"""운영 환경용 샘플링 프로파일러
+
+ProfilingMiddleware 는 선택된 요청을 처리하는 동안 별도 스레드에서 요청
+스레드의 호출 스택을 일정 간격(PROFILING_INTERVAL_MS)으로 읽어, 요청이
+끝나면 flamegraph.pl / speedscope 에서 바로 열 수 있는 collapsed stack
+형식(`a;b;c 횟수`)으로 PROFILING_DIR 에 저장합니다.
+
+프로파일할 요청은
+- PROFILING_SAMPLE_RATE 비율로 무작위 선택하거나
+- `python manage.py profile_token` 으로 발급한 서명 토큰을 X-Profile
+  헤더에 실어 보낸 요청
+이며, 프로세스당 분당 PROFILING_MAX_PER_MINUTE 건으로 제한합니다.
+뷰 코드를 바꾸지 않고 모든 URL 에 적용됩니다.
+"""
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SALT = 'accounts.profiling'
+TOKEN_HEADER = 'HTTP_X_PROFILE'
+# 헤더로 요청한 프로파일의 저장 파일명을 알려주는 응답 헤더
+RESULT_HEADER = 'X-Profile-File'
+FILE_SUFFIX = '.collapsed'
+
+
+def issue_token(issued_by):
+    """X-Profile 헤더용 서명 토큰 (PROFILING_TOKEN_MAX_AGE 초 동안 유효)"""
+    return signing.dumps({'by': issued_by}, salt=TOKEN_SALT)
+
+
+def verify_token(token):
+    """유효한 토큰이면 발급자, 아니면 None"""
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:  # 만료(SignatureExpired) 포함
+        return None
+    return payload.get('by') or '?'
+
+
+class RateLimiter:
+    """최근 period 초 동안 max_events 건까지만 허용 (스레드 안전)"""
+
+    def __init__(self, max_events, period=60.0):
+        self.max_events = max_events
+        self.period = period
+        self._events = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        now = time.monotonic()
+        with self._lock:
+            while self._events and now - self._events[0] >= self.period:
+                self._events.popleft()
+            if len(self._events) >= self.max_events:
+                return False
+            self._events.append(now)
+            return True
+
+
+_labels = {}
+
+
+def _frame_label(code):
+    """함수 이름 (파일:첫 줄) - 줄 단위가 아닌 함수 단위로 스택을 합침"""
+    label = _labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        # 서드파티 / 프로젝트 / 표준 라이브러리 경로 앞부분은 생략
+        for marker in ('site-packages' + os.sep, str(settings.BASE_DIR) + os.sep, os.path.dirname(os.__file__) + os.sep):
+            if marker in filename:
+                filename = filename.split(marker, 1)[1]
+                break
+        label = _labels[code] = f'{code.co_name} ({filename}:{code.co_firstlineno})'.replace(';', ':')
+    return label
+
+
+def collapse(frame):
+    """가장 바깥 호출부터 ; 로 이은 스택 문자열"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class StackSampler:
+    """thread_id 스레드의 호출 스택을 interval 초마다 읽어 스택별 횟수를 셉니다."""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self.counts
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.counts[collapse(frame)] += 1
+
+
+def write_profile(directory, name, counts, max_files):
+    """collapsed stack 파일을 쓰고, 파일이 max_files 개를 넘으면 오래된 것부터 지웁니다."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, count in counts.most_common():
+            f.write(f'{stack} {count}\n')
+
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith(FILE_SUFFIX)),
+        key=lambda entry: entry.stat().st_mtime
+    )
+    for entry in profiles[:max(0, len(profiles) - max_files)]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+    return path
+
+
+class ProfilingMiddleware:
+    """선택된 요청의 호출 스택을 샘플링해 collapsed stack 파일로 저장하는 미들웨어
+
+    미들웨어와 뷰 전체를 포함하도록 RequestMetricsMiddleware 바로 다음에 둡니다.
+    PROFILING_ENABLED 가 False 면 미들웨어 체인에서 빠집니다.
+    ASGI 에서는 이벤트 루프 스레드만 샘플링하므로 sync_to_async 로 실행되는
+    ORM 호출 내부는 await 지점으로만 보입니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.limiter = RateLimiter(settings.PROFILING_MAX_PER_MINUTE)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        reason = self.select(request)
+        if reason is None:
+            return self.get_response(request)
+        sampler = self.start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            counts = sampler.stop()
+        return self.save(request, response, reason, counts, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        reason = self.select(request)
+        if reason is None:
+            return await self.get_response(request)
+        sampler = self.start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            counts = sampler.stop()
+        return self.save(request, response, reason, counts, time.perf_counter() - started)
+
+    def select(self, request):
+        """프로파일할 요청이면 선택 사유('header:발급자' / 'sample'), 아니면 None"""
+        reason = None
+        token = request.META.get(TOKEN_HEADER)
+        if token:
+            issued_by = verify_token(token)
+            if issued_by is None:
+                logger.warning('유효하지 않은 프로파일링 토큰', extra={'path': request.path})
+            else:
+                reason = f'header:{issued_by}'
+        if reason is None and random.random() < settings.PROFILING_SAMPLE_RATE:
+            reason = 'sample'
+        if reason is None:
+            return None
+        if not self.limiter.acquire():
+            logger.debug('프로파일링 요청 수 제한으로 건너뜀', extra={'path': request.path, 'reason': reason})
+            return None
+        return reason
+
+    def start(self):
+        sampler = StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL_MS / 1000)
+        sampler.start()
+        return sampler
+
+    def save(self, request, response, reason, counts, duration):
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match is not None else 'unmatched'
+        name = (
+            f'{datetime.now():%Y%m%dT%H%M%S.%f}_{view.replace(":", ".")}_'
+            f'{duration * 1000:.0f}ms_{os.getpid()}{FILE_SUFFIX}'
+        )
+        try:
+            path = write_profile(settings.PROFILING_DIR, name, counts, settings.PROFILING_MAX_FILES)
+        except OSError:
+            logger.exception('프로파일 저장 실패')
+            return response
+
+        logger.info('요청 프로파일 저장', extra={
+            'path': request.path, 'view': view, 'reason': reason,
+            'duration_ms': round(duration * 1000, 2), 'samples': sum(counts.values()), 'file': path
+        })
+        if reason.startswith('header:'):
+            response[RESULT_HEADER] = name
+        return response
@@ -0,0 +1,154 @@
+"""사용자 일괄 등록 (CSV / JSON 배열)
+
+회원가입 API 를 사용자마다 호출하면 중복 확인 쿼리 2번, 비밀번호 해시,
+INSERT 가 한 건씩 실행됩니다. 여기서는
+- 기존 아이디/이메일과의 중복을 전체 행에 대해 한 번에 확인하고
+- 비밀번호를 여러 프로세스에서 나눠 해시한 뒤(hashers.hash_passwords)
+- bulk_create 로 배치 단위로 저장합니다.
+
+provision_users 관리 명령어와 관리자용 users/import/ API 에서 사용합니다.
+password 컬럼이 없거나 비어 있는 행은 로그인할 수 없는 비밀번호로 만들고,
+관리자가 사용자 수정 API 로 비밀번호를 설정합니다.
+"""
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import connection, transaction as db_transaction
+from django.db.models import Q
+
+from .hashers import hash_passwords
+from .importer import ImportFormatError, read_csv
+from .models import User
+
+REQUIRED_FIELDS = ['username', 'email']
+DEFAULT_BATCH_SIZE = 1000
+# SQLite 는 쿼리당 파라미터 수 제한(기본 32766)이 있어 중복 확인을 나눠서 실행
+SQLITE_LOOKUP_CHUNK = 10000
+
+
+def read_rows(request):
+    """요청에서 사용자 행(dict) 목록을 읽습니다.
+
+    - multipart 의 file 필드 또는 text/csv 본문: CSV (첫 줄은 헤더)
+    - 그 외: JSON 배열 또는 {"users": [...]}
+    """
+    upload = request.FILES.get('file')
+    if upload is not None:
+        return read_csv(upload.read(), REQUIRED_FIELDS)
+    if request.content_type == 'text/csv':
+        return read_csv(request.body, REQUIRED_FIELDS)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        raise ImportFormatError('잘못된 JSON 형식입니다.')
+    if isinstance(data, dict):
+        data = data.get('users')
+    if not isinstance(data, list):
+        raise ImportFormatError('사용자 배열이 필요합니다.')
+    return data
+
+
+def find_existing(usernames, emails):
+    """DB 에 이미 있는 (아이디 집합, 이메일 집합)을 한 번에 조회합니다."""
+    usernames = list(usernames)
+    emails = list(emails)
+    if connection.vendor == 'postgresql':
+        # 값 목록을 배열 파라미터 2개로 넘김 (IN (...) 은 값마다 파라미터가 생겨 10만 건이면 쿼리가 커짐)
+        # username/email 의 unique 인덱스를 각각 타는 BitmapOr 로 실행됨
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT username, email FROM {User._meta.db_table} '
+                'WHERE username = ANY(%s) OR email = ANY(%s)',
+                [usernames, emails]
+            )
+            rows = cursor.fetchall()
+    else:
+        rows = []
+        for start in range(0, max(len(usernames), len(emails)), SQLITE_LOOKUP_CHUNK):
+            end = start + SQLITE_LOOKUP_CHUNK
+            rows.extend(User.objects.filter(
+                Q(username__in=usernames[start:end]) | Q(email__in=emails[start:end])
+            ).values_list('username', 'email'))
+
+    return {username for username, _ in rows}, {email for _, email in rows}
+
+
+def build_users(rows):
+    """행 목록을 검증해 (User 객체 목록, 비밀번호 목록, 오류 목록)을 반환합니다.
+
+    User 객체의 password 는 비어 있고, 같은 순서의 비밀번호 목록을
+    hash_passwords 로 해시해 채웁니다.
+    오류 항목은 {'row': 1부터 시작하는 행 번호, 'message': ...} 입니다.
+    """
+    candidates = []
+    errors = []
+    seen_usernames = set()
+    seen_emails = set()
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({'row': number, 'message': '잘못된 행 형식입니다.'})
+            continue
+
+        username = str(row.get('username') or '').strip()
+        email = str(row.get('email') or '').strip()
+        if not username or not email:
+            errors.append({'row': number, 'message': 'username, email 은 필수 항목입니다.'})
+            continue
+
+        try:
+            User.username_validator(username)
+        except ValidationError:
+            username = None
+        if username is None or len(username) > 150:
+            errors.append({'row': number, 'message': '유효하지 않은 아이디입니다.'})
+            continue
+        try:
+            validate_email(email)
+        except ValidationError:
+            email = None
+        if email is None or len(email) > 254:
+            errors.append({'row': number, 'message': '유효하지 않은 이메일입니다.'})
+            continue
+
+        if username in seen_usernames:
+            errors.append({'row': number, 'message': '파일 안에서 중복된 아이디입니다.'})
+            continue
+        if email in seen_emails:
+            errors.append({'row': number, 'message': '파일 안에서 중복된 이메일입니다.'})
+            continue
+        seen_usernames.add(username)
+        seen_emails.add(email)
+        candidates.append((number, username, email, str(row.get('password') or '')))
+
+    taken_usernames, taken_emails = find_existing(seen_usernames, seen_emails)
+
+    objects = []
+    passwords = []
+    for number, username, email, password in candidates:
+        if username in taken_usernames:
+            errors.append({'row': number, 'message': '이미 존재하는 아이디입니다.'})
+            continue
+        if email in taken_emails:
+            errors.append({'row': number, 'message': '이미 존재하는 이메일입니다.'})
+            continue
+        objects.append(User(username=username, email=email))
+        passwords.append(password)
+
+    errors.sort(key=lambda error: error['row'])
+    return objects, passwords, errors
+
+
+def provision_users(objects, passwords, processes=1, batch_size=None):
+    """비밀번호를 해시해 채운 뒤 한 DB 트랜잭션 안에서 배치 단위로 저장합니다.
+
+    processes 는 hashers.hash_passwords 와 같습니다 (웹 요청에서는 1).
+    """
+    batch_size = batch_size or getattr(settings, 'PROVISIONING_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+    for obj, hashed in zip(objects, hash_passwords(passwords, processes)):
+        obj.password = hashed
+    with db_transaction.atomic():
+        User.objects.bulk_create(objects, batch_size=batch_size)
+    return len(objects)
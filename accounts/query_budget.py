@@ -0,0 +1,138 @@
+"""뷰별 쿼리 수 상한(query budget) 검사
+
+뷰에 @query_budget(n) 을 붙이고 QueryBudgetMiddleware 를 MIDDLEWARE 마지막에
+두면, 뷰 실행 중 실행된 쿼리 수가 n 을 넘을 때
+- settings.QUERY_BUDGET_RAISE 가 True 이면 QueryBudgetExceeded 를 발생시키고
+- 아니면 경고 로그만 남깁니다.
+
+세션/사용자 로딩처럼 뷰 안에서 지연 실행되는 쿼리도 포함되므로 상한에는
+인증 쿼리(세션 1 + 사용자 1)를 더해 선언합니다. 비밀번호가 바뀐 세션은
+get_cached_user 가 flush 하므로 2회(세션 조회 + 삭제)가 더 듭니다.
+"""
+import logging
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """쿼리 수 상한 초과"""
+
+
+class QueryCounter:
+    """connection.execute_wrapper 로 등록해 실행된 쿼리와 실행 시간 합계를 기록합니다."""
+
+    def __init__(self):
+        self.queries = []
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+
+@contextmanager
+def count_queries(using=None):
+    """블록 안에서 실행된 쿼리를 QueryCounter 로 수집합니다."""
+    counter = QueryCounter()
+    aliases = [using] if using else list(connections)
+    wrapped = []
+    try:
+        for alias in aliases:
+            ctx = connections[alias].execute_wrapper(counter)
+            ctx.__enter__()
+            wrapped.append(ctx)
+        yield counter
+    finally:
+        for ctx in reversed(wrapped):
+            ctx.__exit__(None, None, None)
+
+
+def query_budget(max_queries):
+    """뷰의 쿼리 수 상한을 선언하는 데코레이터"""
+    def decorator(view_func):
+        view_func.query_budget = max_queries
+        return view_func
+    return decorator
+
+
+def _report(label, counter, max_queries):
+    message = f'{label}: 쿼리 {counter.count}회 실행 (상한 {max_queries}회)'
+    if getattr(settings, 'QUERY_BUDGET_RAISE', False):
+        raise QueryBudgetExceeded(message + '\n' + '\n'.join(counter.queries))
+    logger.warning(message)
+
+
+@contextmanager
+def assert_max_queries(max_queries, label='query budget', using=None):
+    """테스트용: 블록 안의 쿼리 수가 max_queries 를 넘으면 실패시킵니다.
+
+    with assert_max_queries(3):
+        client.get('/api/categories/')
+    """
+    with count_queries(using) as counter:
+        yield counter
+    if counter.count > max_queries:
+        raise QueryBudgetExceeded(
+            f'{label}: 쿼리 {counter.count}회 실행 (상한 {max_queries}회)\n'
+            + '\n'.join(counter.queries)
+        )
+
+
+class QueryBudgetMiddleware:
+    """@query_budget 이 선언된 뷰의 쿼리 수를 검사하는 미들웨어
+
+    뷰 실행 구간만 세도록 MIDDLEWARE 목록의 마지막에 둡니다.
+    ASGI 에서는 async 로 동작하며, async ORM 쿼리가 실행되는 요청별 동기
+    스레드의 연결에 카운터를 겁니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request._query_budget = None
+        with count_queries() as counter:
+            response = self.get_response(request)
+        self.check(request, counter)
+        return response
+
+    async def __acall__(self, request):
+        request._query_budget = None
+        # async ORM 은 sync_to_async(thread_sensitive=True) 로 요청별 같은 스레드에서
+        # 실행되므로, 그 스레드에서 execute_wrapper 를 등록/해제
+        counting = count_queries()
+        counter = await sync_to_async(counting.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(counting.__exit__)(None, None, None)
+        self.check(request, counter)
+        return response
+
+    def check(self, request, counter):
+        max_queries = request._query_budget
+        if max_queries is not None and counter.count > max_queries:
+            _report(f'{request.method} {request.path}', counter, max_queries)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._query_budget = getattr(view_func, 'query_budget', None)
@@ -0,0 +1,162 @@
+"""읽기 전용 복제본(read replica) 라우팅
+
+settings.DATABASE_REPLICAS 에 복제본 DB alias 가 있으면
+ReplicaRoutingMiddleware 가 읽기 요청(GET/HEAD)마다 복제본 하나를 골라 두고,
+ReplicaRouter 가 그 요청의 읽기 쿼리를 복제본으로 보냅니다. 쓰기와 다음
+경우의 읽기는 항상 기본 DB(default)로 갑니다.
+- 쓰기 요청(POST/PUT/DELETE)과 요청 밖(관리 명령어, 셸)의 쿼리
+- 같은 요청에서 이미 쓰기를 한 뒤, 또는 transaction.atomic() 안의 읽기
+- 세션 테이블 (방금 만든 세션이 복제 지연으로 안 보이면 로그아웃되므로)
+- primary() 블록 안 (캐시 채우기처럼 최신 값이 필요한 경우)
+
+read-your-writes: 요청에서 쓰기가 일어나면 응답에 REPLICA_STICKY_COOKIE
+쿠키를 실어, 그 클라이언트의 읽기는 REPLICA_STICKY_SECONDS 초 동안 기본
+DB 로 보냅니다. 방금 만든 거래 내역이 바로 다음 목록 조회에 보이게 됩니다.
+"""
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_STICKY_COOKIE = 'db_primary_until'
+READ_METHODS = ('GET', 'HEAD')
+# 항상 기본 DB 에서 읽는 앱
+PRIMARY_ONLY_APPS = {'sessions'}
+
+
+class RequestState:
+    """처리 중인 요청의 DB 선택 상태"""
+    __slots__ = ('replica', 'wrote')
+
+    def __init__(self, replica):
+        self.replica = replica
+        self.wrote = False
+
+
+_state = ContextVar('replica_state', default=None)
+_force_primary = ContextVar('replica_force_primary', default=False)
+
+
+@contextmanager
+def primary():
+    """블록 안의 읽기를 기본 DB 로 보냅니다. (async 함수 안에서도 사용 가능)"""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS 용 라우터
+
+    None 을 반환하면 Django 가 인스턴스가 읽혀 온 DB 를 쓰므로(복제본에서
+    읽은 객체를 save() 하면 복제본에 쓰게 됨) 기본 DB 도 명시적으로 반환합니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None or state.replica is None or state.wrote
+            or _force_primary.get()
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        # 세션은 항상 기본 DB 에서 읽으므로 세션 저장(만료 연장 등)은 고정 대상이 아님
+        if state is not None and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB 와 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in getattr(settings, 'DATABASE_REPLICAS', ()):
+            return False
+        return None
+
+
+def _sticky(request):
+    try:
+        return float(request.COOKIES.get(REPLICA_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def _iterate_in(state, content):
+    """스트리밍 응답은 미들웨어가 끝난 뒤에 본문을 만드므로 청크마다 요청 상태를 다시 적용"""
+    iterator = iter(content)
+    while True:
+        token = _state.set(state)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _state.reset(token)
+        yield chunk
+
+
+class ReplicaRoutingMiddleware:
+    """읽기 요청의 쿼리를 복제본으로 보내고, 쓰기 후 잠시 기본 DB 에 고정하는 미들웨어
+
+    세션·인증 미들웨어의 쿼리도 같은 상태를 보도록 SessionMiddleware 앞에 둡니다.
+    DATABASE_REPLICAS 가 비어 있으면 미들웨어 체인에서 빠집니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'DATABASE_REPLICAS', None):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = self.select(request)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.finish(state, response)
+
+    async def __acall__(self, request):
+        state = self.select(request)
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.finish(state, response)
+
+    def select(self, request):
+        replica = None
+        if request.method in READ_METHODS and not _sticky(request):
+            replica = random.choice(settings.DATABASE_REPLICAS)
+        return RequestState(replica)
+
+    def finish(self, state, response):
+        if state.wrote:
+            sticky_seconds = settings.REPLICA_STICKY_SECONDS
+            response.set_cookie(
+                REPLICA_STICKY_COOKIE, str(time.time() + sticky_seconds),
+                max_age=sticky_seconds, httponly=True, samesite='Lax'
+            )
+        elif response.streaming and state.replica is not None and not getattr(response, 'is_async', False):
+            response.streaming_content = _iterate_in(state, response.streaming_content)
+        return response
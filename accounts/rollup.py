@@ -0,0 +1,226 @@
+"""DailyBalance 집계 테이블 증분 갱신
+
+거래 내역을 바꾸는 모든 경로(생성/수정/삭제/일괄 삭제)에서 같은 DB
+트랜잭션 안에 호출해야 합니다.
+"""
+from datetime import date
+from decimal import Decimal
+
+from django.db import IntegrityError, connection, transaction as db_transaction
+from django.db.models import F, Q, Sum
+
+from .models import DailyBalance, Transaction
+
+ZERO = Decimal('0')
+
+
+def _as_date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _split_amount(transaction_type, amount):
+    """(수입, 지출) 증감값으로 나눕니다."""
+    amount = Decimal(str(amount))
+    if transaction_type == 'income':
+        return amount, ZERO
+    return ZERO, amount
+
+
+def apply_delta(user_id, day, category_id, income_delta, expense_delta):
+    """(사용자, 일자, 카테고리) 집계 행에 증감값을 더합니다."""
+    apply_deltas({(user_id, _as_date(day), category_id): (income_delta, expense_delta)})
+
+
+def apply_deltas(deltas):
+    """{(사용자, 일자, 카테고리): (수입 증감, 지출 증감)} 을 집계 행에 더합니다.
+
+    PostgreSQL 에서는 모든 키를 INSERT ... ON CONFLICT DO UPDATE 한 번으로 더하고,
+    합계가 0 이 된 행을 DELETE 한 번으로 지웁니다. 새 (사용자, 일자, 카테고리)
+    묶음이 많은 가져오기/일괄 삭제도 키 수와 관계없이 쿼리 두 번으로 끝납니다.
+    """
+    deltas = {
+        (user_id, _as_date(day), category_id): (income, expense)
+        for (user_id, day, category_id), (income, expense) in deltas.items()
+        if income or expense
+    }
+    if not deltas:
+        return
+    if connection.vendor != 'postgresql':
+        for (user_id, day, category_id), (income, expense) in deltas.items():
+            _apply_delta_row(user_id, day, category_id, income, expense)
+        return
+
+    table = connection.ops.quote_name(DailyBalance._meta.db_table)
+    # 같은 행을 동시에 갱신하는 요청끼리 교착 상태가 생기지 않도록 키 순서대로 잠금
+    keys = sorted(deltas)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (user_id, date, category_id, income_sum, expense_sum)
+            SELECT * FROM unnest(%s::bigint[], %s::date[], %s::bigint[], %s::numeric[], %s::numeric[])
+            ON CONFLICT (user_id, date, category_id) DO UPDATE SET
+                income_sum = {table}.income_sum + EXCLUDED.income_sum,
+                expense_sum = {table}.expense_sum + EXCLUDED.expense_sum
+            """,
+            [
+                [key[0] for key in keys], [key[1] for key in keys], [key[2] for key in keys],
+                [deltas[key][0] for key in keys], [deltas[key][1] for key in keys],
+            ]
+        )
+        decreased = [key for key in keys if deltas[key][0] < 0 or deltas[key][1] < 0]
+        if decreased:
+            cursor.execute(
+                f"""
+                DELETE FROM {table} AS balance
+                USING unnest(%s::bigint[], %s::date[], %s::bigint[]) AS k(user_id, date, category_id)
+                WHERE balance.user_id = k.user_id AND balance.date = k.date
+                    AND balance.category_id = k.category_id
+                    AND balance.income_sum = 0 AND balance.expense_sum = 0
+                """,
+                [[key[0] for key in decreased], [key[1] for key in decreased], [key[2] for key in decreased]]
+            )
+
+
+def _apply_delta_row(user_id, day, category_id, income_delta, expense_delta):
+    """PostgreSQL 이 아닌 DB 에서 한 집계 행에 증감값을 더합니다."""
+    key = {'user_id': user_id, 'date': _as_date(day), 'category_id': category_id}
+    updated = DailyBalance.objects.filter(**key).update(
+        income_sum=F('income_sum') + income_delta,
+        expense_sum=F('expense_sum') + expense_delta
+    )
+    if not updated:
+        try:
+            with db_transaction.atomic():
+                DailyBalance.objects.create(income_sum=income_delta, expense_sum=expense_delta, **key)
+        except IntegrityError:
+            # 동시에 다른 요청이 같은 행을 만든 경우
+            DailyBalance.objects.filter(**key).update(
+                income_sum=F('income_sum') + income_delta,
+                expense_sum=F('expense_sum') + expense_delta
+            )
+
+    if income_delta < 0 or expense_delta < 0:
+        DailyBalance.objects.filter(income_sum=0, expense_sum=0, **key).delete()
+
+
+def snapshot(tx):
+    """수정 전 값을 기억해 두기 위한 (사용자, 일자, 카테고리, 유형, 금액) 튜플"""
+    return (
+        tx.user_id, _as_date(tx.transaction_date), tx.category_id,
+        tx.transaction_type, Decimal(str(tx.amount))
+    )
+
+
+def add_transaction(tx):
+    """생성된 거래 내역을 집계에 반영합니다."""
+    income, expense = _split_amount(tx.transaction_type, tx.amount)
+    apply_delta(tx.user_id, tx.transaction_date, tx.category_id, income, expense)
+
+
+def add_transactions(transactions):
+    """여러 거래 내역을 (사용자, 일자, 카테고리) 별로 묶어 집계에 반영합니다."""
+    deltas = {}
+    for tx in transactions:
+        key = (tx.user_id, _as_date(tx.transaction_date), tx.category_id)
+        income, expense = _split_amount(tx.transaction_type, tx.amount)
+        prev_income, prev_expense = deltas.get(key, (ZERO, ZERO))
+        deltas[key] = (prev_income + income, prev_expense + expense)
+    apply_deltas(deltas)
+
+
+def remove_snapshot(snap):
+    """snapshot() 으로 기억한 거래 내역을 집계에서 뺍니다."""
+    user_id, day, category_id, transaction_type, amount = snap
+    income, expense = _split_amount(transaction_type, amount)
+    apply_delta(user_id, day, category_id, -income, -expense)
+
+
+def remove_transaction(tx):
+    """삭제될 거래 내역을 집계에서 뺍니다."""
+    remove_snapshot(snapshot(tx))
+
+
+def move_transaction(before, tx):
+    """수정된 거래 내역(일자/카테고리/금액/유형 변경 포함)을 집계에 반영합니다."""
+    if before == snapshot(tx):
+        return
+    remove_snapshot(before)
+    add_transaction(tx)
+
+
+def remove_queryset(queryset):
+    """일괄 삭제될 거래 내역들을 GROUP BY 한 번으로 모아 집계에서 뺍니다."""
+    groups = (
+        queryset.order_by()
+        .values('user_id', 'transaction_date', 'category_id')
+        .annotate(
+            income=Sum('amount', filter=Q(transaction_type='income')),
+            expense=Sum('amount', filter=Q(transaction_type='expense'))
+        )
+    )
+    apply_deltas({
+        (row['user_id'], row['transaction_date'], row['category_id']):
+            (-(row['income'] or ZERO), -(row['expense'] or ZERO))
+        for row in groups
+    })
+
+
+def aggregate_transactions(user_id=None):
+    """Transaction 원본에서 계산한 {(사용자, 일자, 카테고리): (수입, 지출)}"""
+    queryset = Transaction.objects.all()
+    if user_id is not None:
+        queryset = queryset.filter(user_id=user_id)
+    totals = {}
+    groups = (
+        queryset.order_by()
+        .values('user_id', 'transaction_date', 'category_id')
+        .annotate(
+            income=Sum('amount', filter=Q(transaction_type='income')),
+            expense=Sum('amount', filter=Q(transaction_type='expense'))
+        )
+        .iterator(chunk_size=5000)
+    )
+    for row in groups:
+        key = (row['user_id'], row['transaction_date'], row['category_id'])
+        totals[key] = (row['income'] or ZERO, row['expense'] or ZERO)
+    return totals
+
+
+def rebuild(user_id=None, batch_size=5000):
+    """집계 테이블을 원본 거래 내역으로부터 다시 만듭니다. 반환값: 생성 행 수"""
+    totals = aggregate_transactions(user_id)
+    with db_transaction.atomic():
+        existing = DailyBalance.objects.all()
+        if user_id is not None:
+            existing = existing.filter(user_id=user_id)
+        existing.delete()
+        DailyBalance.objects.bulk_create([
+            DailyBalance(
+                user_id=key[0], date=key[1], category_id=key[2],
+                income_sum=income, expense_sum=expense
+            )
+            for key, (income, expense) in totals.items()
+        ], batch_size=batch_size)
+    return len(totals)
+
+
+def verify(user_id=None):
+    """집계 테이블과 원본의 차이 목록 [(키, 기대값, 실제값)] 을 반환합니다."""
+    expected = aggregate_transactions(user_id)
+    rows = DailyBalance.objects.all()
+    if user_id is not None:
+        rows = rows.filter(user_id=user_id)
+    actual = {
+        (row['user_id'], row['date'], row['category_id']): (row['income_sum'], row['expense_sum'])
+        for row in rows.order_by().values(
+            'user_id', 'date', 'category_id', 'income_sum', 'expense_sum'
+        ).iterator(chunk_size=5000)
+    }
+
+    mismatches = []
+    for key in expected.keys() | actual.keys():
+        want = expected.get(key, (ZERO, ZERO))
+        got = actual.get(key, (ZERO, ZERO))
+        if want != got:
+            mismatches.append((key, want, got))
+    return mismatches
@@ -0,0 +1,154 @@
+"""목록 응답용 빠른 직렬화
+
+목록 API 는 행마다 모델 인스턴스를 만들고 strftime / get_*_display() 를
+호출한 뒤 JsonResponse 의 기본 인코더로 변환했습니다. 여기서는
+- values_list 튜플로 행을 읽고 (모델 인스턴스 생성 생략)
+- 선택지 표시명은 미리 만든 dict 에서 찾고
+- 날짜는 값별로 한 번만 문자열로 바꾸며
+- orjson 이 설치되어 있으면 그것으로 JSON 을 만듭니다.
+
+응답 형식은 기존 뷰의 것과 같습니다.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.http import JsonResponse as _JsonResponse
+
+from .metrics import serialization_timer
+from .models import Category, Transaction
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+# 선택지 값 -> 표시명
+TRANSACTION_TYPE_DISPLAY = dict(Transaction.TRANSACTION_TYPE_CHOICES)
+CATEGORY_TYPE_DISPLAY = dict(Category.TYPE_CHOICES)
+
+# serialize_transactions 가 기대하는 values_list 컬럼 순서
+# (키셋 페이지네이션 정렬 키인 transaction_date / created_at / id / amount 포함)
+TRANSACTION_VALUES = [
+    'id', 'transaction_type', 'amount', 'description', 'transaction_date', 'memo', 'created_at',
+    'category_id', 'category__name', 'category__type'
+]
+CATEGORY_VALUES = ['id', 'type', 'name', 'remark', 'created_by__username', 'created_at']
+USER_VALUES = ['id', 'username', 'email', 'is_active', 'date_joined', 'last_login']
+
+NO_LOGIN_DISPLAY = '로그인 기록 없음'
+
+
+@serialization_timer()
+def dumps(data):
+    """data 를 UTF-8 JSON bytes 로 변환합니다."""
+    if orjson is not None:
+        # Decimal 등 orjson 이 모르는 타입은 DjangoJSONEncoder 규칙을 따름
+        return orjson.dumps(data, default=DjangoJSONEncoder().default)
+    return json.dumps(
+        data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def json_response(data, **kwargs):
+    """JsonResponse 대신 dumps 로 본문을 만든 응답"""
+    kwargs.setdefault('content_type', 'application/json')
+    return HttpResponse(dumps(data), **kwargs)
+
+
+class JsonResponse(_JsonResponse):
+    """JSON 변환 시간을 요청 지표(직렬화 시간)에 기록하는 JsonResponse"""
+
+    def __init__(self, *args, **kwargs):
+        with serialization_timer():
+            super().__init__(*args, **kwargs)
+
+
+class _Formatter(dict):
+    """같은 날짜/시각 값은 한 번만 문자열로 바꾸는 캐시
+
+    거래 내역은 같은 날짜가 많이 반복되므로 행마다 strftime 을 호출하는
+    대신 값별로 한 번만 변환합니다. str(date) 는 YYYY-MM-DD,
+    str(datetime)[:19] 는 YYYY-MM-DD HH:MM:SS 로 strftime 결과와 같습니다.
+    """
+
+    def __init__(self, width):
+        super().__init__()
+        self.width = width
+
+    def __missing__(self, value):
+        text = self[value] = str(value)[:self.width]
+        return text
+
+
+def date_formatter():
+    return _Formatter(10)
+
+
+def datetime_formatter():
+    return _Formatter(19)
+
+
+def serialize_transactions(rows):
+    """TRANSACTION_VALUES 순서의 튜플 목록을 거래 내역 dict 목록으로 변환합니다."""
+    dates = date_formatter()
+    datetimes = datetime_formatter()
+    type_display = TRANSACTION_TYPE_DISPLAY
+    category_display = CATEGORY_TYPE_DISPLAY
+    return [{
+        'id': id_,
+        'transaction_type': transaction_type,
+        'transaction_type_display': type_display.get(transaction_type, transaction_type),
+        'amount': str(amount),
+        'description': description,
+        'transaction_date': dates[transaction_date],
+        'memo': memo or '',
+        'category': {
+            'id': category_id,
+            'name': category_name,
+            'type_display': category_display.get(category_type, category_type)
+        },
+        'created_at': datetimes[created_at]
+    } for (
+        id_, transaction_type, amount, description, transaction_date, memo, created_at,
+        category_id, category_name, category_type
+    ) in rows]
+
+
+def serialize_categories(rows):
+    """CATEGORY_VALUES 순서의 튜플 목록을 카테고리 dict 목록으로 변환합니다."""
+    datetimes = datetime_formatter()
+    type_display = CATEGORY_TYPE_DISPLAY
+    return [{
+        'id': id_,
+        'type': category_type,
+        'type_display': type_display.get(category_type, category_type),
+        'name': name,
+        'remark': remark or '',
+        'created_by': created_by,
+        'created_at': datetimes[created_at],
+    } for id_, category_type, name, remark, created_by, created_at in rows]
+
+
+def serialize_users(rows, stats=None):
+    """USER_VALUES 순서의 튜플 목록을 사용자 dict 목록으로 변환합니다.
+
+    stats({사용자 id: (거래 내역 수, 마지막 활동 시각)})를 주면 두 값을
+    transaction_count / last_activity 로 함께 넣습니다.
+    """
+    datetimes = datetime_formatter()
+    users = [{
+        'id': id_,
+        'username': username,
+        'email': email,
+        'is_admin': username == 'admin',
+        'is_active': is_active,
+        'date_joined': datetimes[date_joined],
+        'last_login': datetimes[last_login] if last_login else NO_LOGIN_DISPLAY
+    } for id_, username, email, is_active, date_joined, last_login in rows]
+    if stats is not None:
+        for user in users:
+            count, last_activity = stats.get(user['id'], (0, None))
+            user['transaction_count'] = count
+            user['last_activity'] = datetimes[last_activity] if last_activity else None
+    return users
@@ -0,0 +1,74 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory, TestCase
+
+from accounts import async_views, rollup, views
+from accounts.models import Category, Transaction, User
+
+
+class AsyncViewParityTests(TestCase):
+    """async 읽기 뷰가 동기 뷰와 같은 응답을 반환하는지 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        category = Category.objects.create(type='expense', name='food', created_by=cls.user)
+        Transaction.objects.bulk_create([
+            Transaction(
+                user=cls.user,
+                category=category,
+                transaction_type='expense',
+                amount=Decimal(1000 + i),
+                description=f'transaction {i}',
+                transaction_date=date(2024, 1, 1) + timedelta(days=i * 10),
+            )
+            for i in range(12)
+        ])
+        rollup.rebuild(cls.user.id)
+
+    def call(self, view, query, **extra):
+        request = RequestFactory().get('/', query, **extra)
+        request.user = self.user
+        if view.__module__ == async_views.__name__:
+            return async_to_sync(view)(request)
+        return view(request)
+
+    def assert_same(self, name, query, **extra):
+        sync = self.call(getattr(views, name), query, **extra)
+        async_ = self.call(getattr(async_views, name), query, **extra)
+        self.assertEqual(async_.status_code, sync.status_code)
+        self.assertEqual(async_.content, sync.content)
+        self.assertEqual(async_.get('ETag'), sync.get('ETag'))
+        return sync
+
+    def test_transaction_list(self):
+        self.assert_same('transaction_list', {})
+        self.assert_same('transaction_list', {'sort': 'amount', 'min_amount': '1005'})
+        self.assert_same('transaction_list', {'sort': 'unknown'})
+        self.assert_same('transaction_list', {'cursor': 'invalid'})
+
+    def test_transaction_list_pages(self):
+        query = {'limit': '5'}
+        while True:
+            data = json.loads(self.assert_same('transaction_list', query).content)
+            if not data['has_more']:
+                break
+            query = {'limit': '5', 'cursor': data['next_cursor']}
+
+    def test_transaction_list_not_modified(self):
+        etag = self.call(views.transaction_list, {})['ETag']
+        response = self.assert_same('transaction_list', {}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_transaction_summary(self):
+        self.assert_same('transaction_summary', {'year': '2024'})
+        self.assert_same('transaction_summary', {'start_date': 'invalid'})
+
+    def test_decorators_match(self):
+        for name in ('auth_status', 'category_list', 'transaction_list', 'transaction_summary'):
+            self.assertTrue(getattr(getattr(views, name), 'csrf_exempt', False), name)
+            self.assertTrue(getattr(getattr(async_views, name), 'csrf_exempt', False), name)
+            self.assertEqual(getattr(async_views, name).query_budget, getattr(views, name).query_budget, name)
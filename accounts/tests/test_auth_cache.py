@@ -0,0 +1,80 @@
+import json
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from accounts import cache
+from accounts.models import User
+from accounts.query_budget import assert_max_queries
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class CachedUserInvalidationTests(TestCase):
+    """뷰를 거치지 않은 사용자 변경도 다음 요청의 인증에 바로 반영되는지 확인합니다.
+
+    QUERY_BUDGET_RAISE 로 캐시를 채우거나 세션을 flush 하는 요청도 auth_status 의
+    쿼리 수 상한 안에 있는지 함께 확인합니다.
+    """
+
+    def setUp(self):
+        # 캐시는 테스트 사이에 롤백되지 않음
+        for cache_ in caches.all():
+            cache_.clear()
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        self.client.force_login(self.user)
+        # 사용자 캐시를 채움
+        self.assertTrue(self.is_authenticated())
+
+    def is_authenticated(self):
+        return self.client.get('/api/auth/session/').json()['is_authenticated']
+
+    def test_set_password_logs_out(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.set_password('changed')
+        user.save()
+        self.assertFalse(self.is_authenticated())
+        # auth.get_user 처럼 세션 자체를 삭제
+        self.assertNotIn(SESSION_KEY, self.client.session)
+
+    @override_settings(AUTH_PASSWORD_VALIDATORS=[])
+    def test_changepassword_command_logs_out(self):
+        with mock.patch('getpass.getpass', return_value='changed'):
+            call_command('changepassword', 'member', stdout=StringIO())
+        self.assertFalse(self.is_authenticated())
+
+    def test_deactivation_logs_out(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        self.assertFalse(self.is_authenticated())
+
+    def test_delete_logs_out(self):
+        User.objects.get(pk=self.user.pk).delete()
+        self.assertFalse(self.is_authenticated())
+
+    def test_last_login_update_keeps_cache(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.save(update_fields=['last_login'])
+        self.assertIsNotNone(cache._cache().get(cache.AUTH_USER_KEY.format(user.pk)))
+
+    def test_first_request_after_login_fills_cache(self):
+        self.client.logout()
+        response = self.client.post(
+            '/api/auth/login/', json.dumps({'username': 'member', 'password': 'pw'}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.json()['status'], 'success')
+        key = cache.AUTH_USER_KEY.format(self.user.pk)
+        cache._cache().delete(key)
+
+        # 세션 조회 + 사용자 캐시 채우기
+        with assert_max_queries(2, label='auth_status'):
+            self.assertTrue(self.is_authenticated())
+        self.assertIsNotNone(cache._cache().get(key))
+        # 캐시가 채워진 뒤에는 세션 조회만
+        with assert_max_queries(1, label='auth_status'):
+            self.assertTrue(self.is_authenticated())
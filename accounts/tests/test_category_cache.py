@@ -0,0 +1,57 @@
+import json
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from accounts import cache
+from accounts.models import Category, User
+
+
+@override_settings(CATEGORY_CACHE_TIMEOUT=None)
+class CategoryCacheRaceTests(TestCase):
+    """무효화 전에 이전 목록을 읽은 요청이 캐시를 채워도 다음 조회에 반영되는지 확인합니다."""
+
+    def setUp(self):
+        caches[cache.CACHE_ALIAS].clear()
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        Category.objects.create(type='expense', name='food', created_by=self.user)
+
+    def names(self, payload):
+        return [category['name'] for category in json.loads(payload['body'])['categories']]
+
+    def write_during_build(self):
+        build = cache.build_category_list
+
+        def build_then_write():
+            # 읽기 요청이 목록을 읽은 직후 다른 요청이 카테고리를 추가하고 커밋
+            category_list = build()
+            with self.captureOnCommitCallbacks(execute=True):
+                Category.objects.create(type='income', name='salary', created_by=self.user)
+                cache.invalidate_categories()
+            return category_list
+
+        with mock.patch.object(cache, 'build_category_list', side_effect=build_then_write):
+            return cache.get_category_payload()
+
+    def test_stale_payload_stored_after_commit_is_rebuilt(self):
+        stale = self.write_during_build()
+        self.assertEqual(self.names(stale), ['food'])
+
+        self.assertEqual(self.names(cache.get_category_payload()), ['food', 'salary'])
+
+    def test_stale_payload_stored_before_commit_is_rebuilt(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(type='income', name='salary', created_by=self.user)
+            cache.invalidate_categories()
+            # 커밋 전: 다른 요청이 아직 새 카테고리가 보이지 않는 목록을 캐시
+            with mock.patch.object(cache, 'build_category_list', return_value=[]):
+                self.assertEqual(self.names(cache.get_category_payload()), [])
+
+        self.assertEqual(self.names(cache.get_category_payload()), ['food', 'salary'])
+
+    def test_cached_payload_is_reused(self):
+        first = cache.get_category_payload()
+        with mock.patch.object(cache, 'build_category_list') as build:
+            self.assertEqual(cache.get_category_payload(), first)
+        build.assert_not_called()
@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounts.models import Category, Transaction, User
+
+
+class TransactionExportTests(TestCase):
+    """CSV 내보내기에서 사용자 입력 텍스트가 수식으로 실행되지 않는지 확인합니다."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        category = Category.objects.create(type='expense', name='@category', created_by=self.user)
+        for i, (description, memo) in enumerate([
+            ('=HYPERLINK("http://example.com")', '+1+2'),
+            ('-2+3', '@SUM(A1)'),
+            ('\tcell', 'lunch'),
+        ]):
+            Transaction.objects.create(
+                user=self.user, category=category, transaction_type='expense', amount=Decimal('1000'),
+                description=description, memo=memo, transaction_date=date(2024, 1, 1 + i)
+            )
+        self.client.force_login(self.user)
+
+    def export(self, export_format):
+        response = self.client.get(f'/api/auth/api/transactions/export/?format={export_format}')
+        return b''.join(response.streaming_content).decode('utf-8-sig')
+
+    def test_csv_prefixes_formula_cells(self):
+        rows = list(csv.DictReader(io.StringIO(self.export('csv'))))
+        cells = [(row['category_name'], row['description'], row['memo']) for row in rows]
+        self.assertEqual(cells, [
+            ("'@category", "'\tcell", 'lunch'),
+            ("'@category", "'-2+3", "'@SUM(A1)"),
+            ("'@category", '\'=HYPERLINK("http://example.com")', "'+1+2"),
+        ])
+        self.assertEqual({row['amount'] for row in rows}, {'1000.00'})
+
+    def test_ndjson_keeps_values(self):
+        rows = [json.loads(line) for line in self.export('ndjson').splitlines()]
+        self.assertEqual(rows[-1]['description'], '=HYPERLINK("http://example.com")')
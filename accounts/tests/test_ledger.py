@@ -0,0 +1,52 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+
+from accounts import ledger
+from accounts.models import User
+
+
+class LedgerVersionTests(TestCase):
+    """사용자 행을 저장해도 그사이 올라간 거래 내역 버전이 되돌아가지 않는지 확인합니다."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+
+    def test_stale_full_save_keeps_version(self):
+        stale = User.objects.get(pk=self.user.pk)
+        ledger.bump_version(self.user.pk)
+        ledger.bump_version(self.user.pk)
+
+        stale.first_name = 'changed'
+        stale.set_password('new-password')
+        stale.save()
+
+        self.assertEqual(ledger.current_version(self.user.pk), 2)
+        stale.refresh_from_db()
+        self.assertEqual(stale.first_name, 'changed')
+        self.assertTrue(stale.check_password('new-password'))
+
+    def test_user_update_keeps_version_bumped_during_request(self):
+        admin = User.objects.create_user(username='admin', email='admin@example.com', password='pw')
+        self.client.force_login(admin)
+        get = User.objects.get
+
+        def get_then_bump(*args, **kwargs):
+            # 뷰가 사용자를 읽은 직후 다른 요청이 거래 내역을 쓴 경우
+            user = get(*args, **kwargs)
+            ledger.bump_version(user.pk)
+            return user
+
+        with mock.patch.object(User.objects, 'get', side_effect=get_then_bump):
+            response = self.client.put(
+                f'/api/auth/users/{self.user.pk}/',
+                json.dumps({'email': 'changed@example.com', 'is_active': False}),
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.json()['status'], 'success')
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'changed@example.com')
+        self.assertFalse(self.user.is_active)
+        self.assertEqual(self.user.ledger_version, 1)
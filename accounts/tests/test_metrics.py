@@ -0,0 +1,32 @@
+from django.test import TestCase, override_settings
+
+
+@override_settings(METRICS_ALLOWED_IPS=['127.0.0.1'], METRICS_TRUSTED_PROXIES=['127.0.0.1'])
+class MetricsAccessTests(TestCase):
+    """리버스 프록시 뒤에서 /metrics 접근을 실제 클라이언트 IP 로 판단하는지 확인합니다."""
+
+    def get(self, remote_addr, forwarded=None):
+        extra = {'REMOTE_ADDR': remote_addr}
+        if forwarded is not None:
+            extra['HTTP_X_FORWARDED_FOR'] = forwarded
+        return self.client.get('/metrics', **extra).status_code
+
+    def test_external_client_through_proxy_is_denied(self):
+        self.assertEqual(self.get('127.0.0.1', '203.0.113.5'), 403)
+
+    def test_spoofed_forwarded_for_is_ignored(self):
+        # 클라이언트가 보낸 값 뒤에 프록시가 실제 주소를 덧붙임
+        self.assertEqual(self.get('127.0.0.1', '127.0.0.1, 203.0.113.5'), 403)
+
+    def test_local_client_through_proxy_is_allowed(self):
+        self.assertEqual(self.get('127.0.0.1', '127.0.0.1'), 200)
+
+    def test_direct_local_request_is_allowed(self):
+        self.assertEqual(self.get('127.0.0.1'), 200)
+
+    def test_forwarded_for_from_untrusted_address_is_ignored(self):
+        self.assertEqual(self.get('203.0.113.5', '127.0.0.1'), 403)
+
+    @override_settings(METRICS_TRUSTED_PROXIES=[])
+    def test_without_trusted_proxies_uses_remote_addr(self):
+        self.assertEqual(self.get('127.0.0.1', '203.0.113.5'), 200)
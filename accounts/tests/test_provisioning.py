@@ -0,0 +1,43 @@
+import json
+
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+
+
+@override_settings(
+    PROVISIONING_MAX_PASSWORDS=2,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
+class UserImportLimitTests(TestCase):
+    """users/import/ API 가 비밀번호 수를 제한하고 상한을 응답으로 알려주는지 확인합니다."""
+
+    def setUp(self):
+        admin = User.objects.create_user(username='admin', email='admin@example.com', password='pw')
+        self.client.force_login(admin)
+
+    def post(self, count, password=True):
+        users = [
+            {'username': f'user{i}', 'email': f'user{i}@example.com', 'password': 'secret-pw' if password else ''}
+            for i in range(count)
+        ]
+        return self.client.post('/api/auth/users/import/', json.dumps({'users': users}), content_type='application/json')
+
+    def test_too_many_passwords(self):
+        response = self.post(3)
+        self.assertEqual(response.status_code, 400)
+        data = response.json()
+        self.assertEqual((data['password_count'], data['max_passwords']), (3, 2))
+        self.assertFalse(User.objects.filter(username__startswith='user').exists())
+
+    def test_within_limit(self):
+        response = self.post(2)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['max_passwords'], 2)
+        self.assertTrue(User.objects.get(username='user0').check_password('secret-pw'))
+
+    def test_without_passwords_not_limited(self):
+        response = self.post(5, password=False)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['created_count'], 5)
+        self.assertFalse(User.objects.get(username='user0').has_usable_password())
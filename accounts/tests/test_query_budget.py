@@ -0,0 +1,104 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from accounts import rollup
+from accounts.models import Category, Transaction, User
+from accounts.query_budget import assert_max_queries
+
+
+@override_settings(QUERY_BUDGET_RAISE=True)
+class QueryBudgetTests(TestCase):
+    """목록/요약 API 의 쿼리 수가 행 수에 관계없이 상한 안에 있는지 확인합니다.
+
+    행마다 쿼리가 추가되는(N+1) 변경이 생기면 이 테스트가 실패합니다.
+    상한은 각 뷰의 @query_budget 과 같으며 세션/사용자 조회를 포함합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='admin', email='admin@example.com', password='pw')
+        cls.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        User.objects.bulk_create([
+            User(username=f'user{i}', email=f'user{i}@example.com', password='!')
+            for i in range(20)
+        ])
+        categories = Category.objects.bulk_create([
+            Category(type='expense', name=f'category{i}', created_by=cls.admin)
+            for i in range(5)
+        ])
+        Transaction.objects.bulk_create([
+            Transaction(
+                user=cls.user,
+                category=categories[i % len(categories)],
+                transaction_type='income' if i % 3 == 0 else 'expense',
+                amount=Decimal(1000 + i),
+                description=f'transaction {i}',
+                transaction_date=date(2024, 1, 1) + timedelta(days=i * 7),
+            )
+            for i in range(40)
+        ])
+        rollup.rebuild(cls.user.id)
+
+    def setUp(self):
+        # 캐시는 테스트 사이에 롤백되지 않음
+        for cache in caches.all():
+            cache.clear()
+
+    def assert_budget(self, user, path, max_queries):
+        self.client.force_login(user)
+        # force_login 한 세션의 첫 요청은 만료 연장 시각을 저장하므로 미리 한 번 요청
+        self.client.get('/api/auth/session/')
+        # 캐시(카테고리 목록, 세션 사용자)를 채우는 쿼리까지 세도록 비움
+        for cache in caches.all():
+            cache.clear()
+        with assert_max_queries(max_queries, label=path):
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'success')
+        return response.json()
+
+    def test_transaction_list(self):
+        data = self.assert_budget(self.user, '/api/auth/api/transactions/', 4)
+        self.assertEqual(len(data['transactions']), 40)
+
+    def test_transaction_list_page(self):
+        data = self.assert_budget(self.user, '/api/auth/api/transactions/?limit=10', 4)
+        self.assertEqual(len(data['transactions']), 10)
+        self.assert_budget(self.user, f'/api/auth/api/transactions/?limit=10&cursor={data["next_cursor"]}', 4)
+
+    def test_transaction_summary(self):
+        data = self.assert_budget(self.user, '/api/auth/api/transactions/summary/?year=2024', 4)
+        self.assertEqual(len(data['categories']), 5)
+
+    def test_category_list(self):
+        data = self.assert_budget(self.user, '/api/categories/', 4)
+        self.assertEqual(len(data['categories']), 5)
+
+    def test_user_list(self):
+        data = self.assert_budget(self.admin, '/api/auth/users/?stats=1', 4)
+        self.assertEqual(len(data['users']), 22)
+
+    def test_auth_status_after_login(self):
+        # 로그인 직후 첫 요청: 세션 조회 + 사용자 캐시 채우기 (만료 연장 저장은 응답 단계)
+        response = self.client.post(
+            '/api/auth/login/', json.dumps({'username': 'member', 'password': 'pw'}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.json()['status'], 'success')
+        with assert_max_queries(4, label='auth_status'):
+            data = self.client.get('/api/auth/session/').json()
+        self.assertTrue(data['is_authenticated'])
+
+    def test_auth_status_after_password_change(self):
+        # 다른 곳에서 비밀번호가 바뀐 세션은 flush 하므로 가장 많은 쿼리를 씀
+        self.client.force_login(self.user)
+        self.client.get('/api/auth/session/')
+        self.user.set_password('changed')
+        self.user.save()
+        with assert_max_queries(4, label='auth_status'):
+            data = self.client.get('/api/auth/session/').json()
+        self.assertFalse(data['is_authenticated'])
@@ -0,0 +1,117 @@
+import json
+import time
+
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.test import Client, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from accounts import replicas
+from accounts.models import Category, Transaction, User
+
+REPLICA = 'replica1'
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA])
+class ReplicaRoutingTests(TransactionTestCase):
+    """읽기 요청은 복제본으로, 쓰기 이후/atomic/세션/primary() 는 기본 DB 로 가는지 확인합니다.
+
+    replica1 은 테스트에서 기본 DB 를 미러링하므로(settings.py) 같은 데이터를
+    다른 연결로 읽습니다. 커밋된 데이터가 복제본 연결에 보이도록 TransactionTestCase 를 씁니다.
+    """
+    databases = {'default', REPLICA}
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        self.category = Category.objects.create(type='expense', name='food', created_by=self.user)
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def capture(self):
+        return CaptureQueriesContext(connections['default']), CaptureQueriesContext(connections[REPLICA])
+
+    def get_list(self):
+        primary, replica = self.capture()
+        with primary, replica:
+            response = self.client.get('/api/auth/api/transactions/')
+        self.assertEqual(response.status_code, 200)
+        return primary, replica
+
+    def test_read_request_uses_replica_except_sessions(self):
+        primary, replica = self.get_list()
+
+        replica_sql = ' '.join(query['sql'] for query in replica.captured_queries)
+        primary_sql = ' '.join(query['sql'] for query in primary.captured_queries)
+        self.assertIn('"transactions"', replica_sql)
+        self.assertNotIn('django_session', replica_sql)
+        # 세션과 사용자 캐시 채우기(primary())만 기본 DB 에서 읽음
+        self.assertIn('django_session', primary_sql)
+        self.assertNotIn('"transactions"', primary_sql)
+
+    def test_write_sets_cookie_and_next_reads_use_primary(self):
+        response = self.client.post(
+            '/api/auth/api/transactions/create/',
+            json.dumps({
+                'category_id': self.category.id, 'transaction_type': 'expense',
+                'amount': '1000', 'description': 'lunch', 'transaction_date': '2024-03-01',
+            }),
+            content_type='application/json'
+        )
+        self.assertEqual(response.json()['status'], 'success')
+        self.assertIn(replicas.REPLICA_STICKY_COOKIE, response.cookies)
+
+        # 쿠키가 유효한 동안에는 방금 만든 거래 내역을 기본 DB 에서 읽음
+        primary, replica = self.get_list()
+        self.assertEqual(replica.captured_queries, [])
+        self.assertTrue(any('"transactions"' in query['sql'] for query in primary.captured_queries))
+
+        # 쿠키가 만료되면 다시 복제본에서 읽음
+        self.client.cookies[replicas.REPLICA_STICKY_COOKIE] = str(time.time() - 1)
+        _primary, replica = self.get_list()
+        self.assertTrue(replica.captured_queries)
+
+    def test_reads_after_write_in_same_request_use_primary(self):
+        router = replicas.ReplicaRouter()
+        token = replicas._state.set(replicas.RequestState(REPLICA))
+        try:
+            self.assertEqual(router.db_for_read(Transaction), REPLICA)
+            self.assertEqual(router.db_for_write(Transaction), 'default')
+            self.assertEqual(router.db_for_read(Transaction), 'default')
+        finally:
+            replicas._state.reset(token)
+
+    def test_session_writes_do_not_pin_request(self):
+        router = replicas.ReplicaRouter()
+        token = replicas._state.set(replicas.RequestState(REPLICA))
+        try:
+            self.assertEqual(router.db_for_read(Session), 'default')
+            self.assertEqual(router.db_for_write(Session), 'default')
+            self.assertEqual(router.db_for_read(Transaction), REPLICA)
+        finally:
+            replicas._state.reset(token)
+
+    def test_atomic_and_primary_blocks_read_from_primary(self):
+        token = replicas._state.set(replicas.RequestState(REPLICA))
+        try:
+            primary, replica = self.capture()
+            with primary, replica:
+                with transaction.atomic():
+                    list(Transaction.objects.filter(user=self.user))
+                with replicas.primary():
+                    list(Transaction.objects.filter(user=self.user))
+            self.assertEqual(replica.captured_queries, [])
+            selects = [query for query in primary.captured_queries if query['sql'].startswith('SELECT')]
+            self.assertEqual(len(selects), 2)
+
+            # 블록 밖에서는 다시 복제본
+            with self.capture()[1] as replica:
+                list(Transaction.objects.filter(user=self.user))
+            self.assertEqual(len(replica.captured_queries), 1)
+        finally:
+            replicas._state.reset(token)
+
+    def test_queries_outside_requests_use_primary(self):
+        self.assertEqual(replicas.ReplicaRouter().db_for_read(Transaction), 'default')
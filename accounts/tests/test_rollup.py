@@ -0,0 +1,114 @@
+import json
+import threading
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection, connections
+from django.test import Client, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+
+from accounts import ledger, rollup
+from accounts.models import Category, DailyBalance, Transaction, User
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class ConcurrentUpdateTests(TransactionTestCase):
+    """같은 거래 내역을 동시에 수정해도 일별 집계가 원본과 일치하는지 확인합니다.
+
+    transaction_update 의 행 잠금(select_for_update)에 의존하므로 잠금이 없는
+    DB(SQLite)에서는 건너뜁니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        category = Category.objects.create(type='expense', name='food', created_by=self.user)
+        self.transaction = Transaction.objects.create(
+            user=self.user, category=category, transaction_type='expense',
+            amount=Decimal('1000'), description='lunch', transaction_date=date(2024, 3, 1)
+        )
+        rollup.add_transaction(self.transaction)
+
+    def test_concurrent_updates_keep_daily_balance(self):
+        # 두 요청이 모두 거래 내역을 읽은 뒤에 쓰기를 시작하도록 맞춤
+        barrier = threading.Barrier(2, timeout=10)
+        bump_version = ledger.bump_version
+
+        def bump_after_both_read(user_id):
+            barrier.wait()
+            return bump_version(user_id)
+
+        def update(amount, responses):
+            client = Client()
+            client.force_login(self.user)
+            try:
+                responses.append(client.put(
+                    f'/api/auth/api/transactions/{self.transaction.pk}/',
+                    json.dumps({'amount': amount, 'transaction_date': '2024-03-02'}),
+                    content_type='application/json'
+                ).json())
+            finally:
+                connections.close_all()
+
+        responses = []
+        with mock.patch.object(ledger, 'bump_version', bump_after_both_read):
+            threads = [
+                threading.Thread(target=update, args=(amount, responses))
+                for amount in ('2000', '3000')
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([response['status'] for response in responses], ['success', 'success'])
+        self.assertEqual(rollup.verify(self.user.id), [])
+
+
+class BulkDeltaTests(TestCase):
+    """여러 (사용자, 일자, 카테고리) 묶음을 한 번의 upsert 로 반영하는지 확인합니다.
+
+    쿼리 수는 PostgreSQL 에서만 확인합니다 (다른 DB 는 묶음마다 반영).
+    """
+
+    def assert_queries(self, queries, count):
+        if connection.vendor == 'postgresql':
+            self.assertEqual(len(queries.captured_queries), count)
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='member', email='member@example.com', password='pw')
+        self.categories = [
+            Category.objects.create(type='expense', name=f'category{i}', created_by=self.user) for i in range(3)
+        ]
+
+    def make(self, days):
+        return [
+            Transaction(
+                user=self.user, category=category, transaction_type=transaction_type,
+                amount=Decimal('100'), description='bulk', transaction_date=date(2024, 1, day)
+            )
+            for day in days
+            for category in self.categories
+            for transaction_type in ('income', 'expense')
+        ]
+
+    def test_add_and_remove_many_groups(self):
+        existing = Transaction.objects.bulk_create(self.make([1]))
+        rollup.add_transactions(existing)
+        added = Transaction.objects.bulk_create(self.make([1, 2, 3]))
+
+        # 새 묶음 6개와 기존 묶음 3개를 쿼리 한 번으로 반영
+        with CaptureQueriesContext(connection) as queries:
+            rollup.add_transactions(added)
+        self.assert_queries(queries, 1)
+        self.assertEqual(rollup.verify(self.user.id), [])
+        self.assertEqual(DailyBalance.objects.get(date=date(2024, 1, 1), category=self.categories[0]).income_sum, 200)
+
+        # 일괄 삭제로 합계가 0 이 된 묶음은 지워짐 (GROUP BY, upsert, 0 행 삭제)
+        targets = Transaction.objects.filter(transaction_date__gte=date(2024, 1, 2))
+        with CaptureQueriesContext(connection) as queries:
+            rollup.remove_queryset(targets)
+        self.assert_queries(queries, 3)
+        targets.delete()
+        self.assertEqual(rollup.verify(self.user.id), [])
+        self.assertEqual(DailyBalance.objects.filter(user=self.user).count(), 3)
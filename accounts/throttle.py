@@ -0,0 +1,95 @@
+"""로그인/회원가입 시도 제한
+
+비밀번호 해시를 계산하기 전에 IP 별(LOGIN_THROTTLE_PER_IP), 아이디 별
+(LOGIN_THROTTLE_PER_USERNAME)로 최근 LOGIN_THROTTLE_WINDOW 초 동안의
+시도 수를 세어 상한을 넘은 요청을 바로 거절합니다. 값이 0 이면 해당 제한을
+쓰지 않습니다.
+
+카운터는 프로세스 메모리에 있으므로 워커별로 따로 셉니다.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# 키(IP/아이디)를 이 개수까지만 기억하고 가장 오래 쓰지 않은 것부터 버림
+MAX_KEYS = 10000
+
+
+class SlidingWindowThrottle:
+    """키별로 최근 window 초 동안 limit 건까지 허용 (스레드 안전)"""
+
+    def __init__(self, limit, window, max_keys=MAX_KEYS):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._events = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key):
+        """허용하면 기록하고 0, 거절하면 다시 시도할 수 있을 때까지의 초"""
+        if self.limit <= 0:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                events = self._events[key] = deque()
+                if len(self._events) > self.max_keys:
+                    self._events.popitem(last=False)
+            else:
+                self._events.move_to_end(key)
+            while events and now - events[0] >= self.window:
+                events.popleft()
+            if len(events) >= self.limit:
+                return max(1, int(self.window - (now - events[0])) + 1)
+            events.append(now)
+            return 0
+
+    def reset(self, key):
+        with self._lock:
+            self._events.pop(key, None)
+
+
+_ips = None
+_usernames = None
+_init_lock = threading.Lock()
+
+
+def _throttles():
+    global _ips, _usernames
+    if _ips is None:
+        with _init_lock:
+            if _ips is None:
+                window = settings.LOGIN_THROTTLE_WINDOW
+                _usernames = SlidingWindowThrottle(settings.LOGIN_THROTTLE_PER_USERNAME, window)
+                _ips = SlidingWindowThrottle(settings.LOGIN_THROTTLE_PER_IP, window)
+    return _ips, _usernames
+
+
+@receiver(setting_changed)
+def _reset_throttles(*, setting, **kwargs):
+    global _ips, _usernames
+    if setting.startswith('LOGIN_THROTTLE_'):
+        _ips = _usernames = None
+
+
+def client_ip(request):
+    return request.META.get('REMOTE_ADDR') or ''
+
+
+def check(request, username=None):
+    """시도를 기록하고, 제한에 걸리면 Retry-After 초(아니면 0)를 반환합니다."""
+    ips, usernames = _throttles()
+    retry_after = ips.hit(client_ip(request))
+    if retry_after or username is None:
+        return retry_after
+    return usernames.hit(username)
+
+
+def login_succeeded(username):
+    """로그인에 성공하면 그 아이디의 시도 기록을 지움"""
+    _throttles()[1].reset(username)
@@ -1,20 +1,30 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# ASGI 프로필(ASYNC_VIEWS=True)에서는 읽기 API 를 async 뷰로 처리
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
     path('register/', views.register, name='register'),
     path('login/', views.login_view, name='login'),
+    path('session/', read_views.auth_status, name='auth_status'),
     path('users/', views.user_list, name='user_list'),
+    path('users/import/', views.user_import, name='user_import'),
     path('users/<int:user_id>/', views.user_update, name='user_update'),
     path('users/<int:user_id>/delete/', views.user_delete, name='user_delete'),
-    path('categories/', views.category_list, name='category_list'),
+    path('categories/', read_views.category_list, name='category_list'),
     path('categories/create/', views.category_create, name='category_create'),
     path('categories/<int:category_id>/', views.category_update, name='category_update'),
     path('categories/<int:category_id>/delete/', views.category_delete, name='category_delete'),
     
     # 거래 내역 관련 URL
-    path('api/transactions/', views.transaction_list, name='transaction_list'),
+    path('api/transactions/', read_views.transaction_list, name='transaction_list'),
+    path('api/transactions/sync/', views.transaction_sync, name='transaction_sync'),
+    path('api/transactions/summary/', read_views.transaction_summary, name='transaction_summary'),
+    path('api/transactions/export/', views.transaction_export, name='transaction_export'),
     path('api/transactions/create/', views.transaction_create, name='transaction_create'),
+    path('api/transactions/import/', views.transaction_import, name='transaction_import'),
     path('api/transactions/<int:transaction_id>/', views.transaction_update, name='transaction_update'),
     path('api/transactions/<int:transaction_id>/delete/', views.transaction_delete, name='transaction_delete'),
     path('api/transactions/bulk-delete/', views.transaction_bulk_delete, name='transaction_bulk_delete'),
@@ -1,9 +1,87 @@
+from django.conf import settings
 from django.contrib.auth import authenticate, login
-from django.http import JsonResponse
+from django.db import IntegrityError, transaction as db_transaction
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from .models import User, Category, Transaction
+from .models import User, Category, Transaction, TransactionTombstone, DailyBalance
+from . import cache, importer, ledger, metrics, provisioning, rollup, serialization, throttle
+from .hashers import HashingBusy
+from .pagination import InvalidCursor, keyset_paginate, page_queryset, page_result, parse_limit
+from .query_budget import query_budget
+from .serialization import JsonResponse
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+import csv
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 컬럼 (values_list 순서와 동일)
+EXPORT_FIELDS = [
+    'id', 'transaction_date', 'transaction_type', 'amount', 'category_id',
+    'category__name', 'description', 'memo', 'created_at'
+]
+EXPORT_HEADER = [
+    'id', 'transaction_date', 'transaction_type', 'amount', 'category_id',
+    'category_name', 'description', 'memo', 'created_at'
+]
+EXPORT_CHUNK_SIZE = 2000
+# 스프레드시트가 수식으로 실행하는 셀 시작 문자 (CSV 내보내기에서 앞에 ' 를 붙임)
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# 거래 내역 키셋 페이지네이션 정렬 키 (마지막 id 로 동순위 해소)
+TRANSACTION_ORDERING = [
+    ('transaction_date', True, date),
+    ('created_at', True, datetime),
+    ('id', False, int),
+]
+
+# 사용자 목록 키셋 페이지네이션 정렬 키 (models.py 의 idx_users_date_joined 와 짝을 이룸)
+USER_ORDERING = [
+    ('date_joined', True, datetime),
+    ('id', True, int),
+]
+
+# transaction_list 의 sort 파라미터 값별 정렬 키 (각각 models.py 의 인덱스와 짝을 이룸)
+TRANSACTION_SORTS = {
+    'date': TRANSACTION_ORDERING,
+    'date_asc': [
+        ('transaction_date', False, date),
+        ('created_at', False, datetime),
+        ('id', True, int),
+    ],
+    'amount': [
+        ('amount', True, Decimal),
+        ('id', False, int),
+    ],
+    'amount_asc': [
+        ('amount', False, Decimal),
+        ('id', True, int),
+    ],
+}
+
+def _throttled_response(retry_after):
+    response = JsonResponse({
+        'status': 'error',
+        'message': '시도 횟수가 너무 많습니다. 잠시 후 다시 시도해주세요.'
+    }, status=429)
+    response['Retry-After'] = str(retry_after)
+    return response
+
+def _hashing_busy_response():
+    logger.warning('비밀번호 해시 대기열 초과')
+    response = JsonResponse({
+        'status': 'error',
+        'message': '요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.'
+    }, status=503)
+    response['Retry-After'] = '1'
+    return response
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -14,6 +92,11 @@ def register(request):
         email = data.get('email')
         password = data.get('password')
         
+        # 비밀번호 해시 전에 IP 별 시도 수 제한
+        retry_after = throttle.check(request)
+        if retry_after:
+            return _throttled_response(retry_after)
+        
         # 필수 필드 검증
         if not username or not email or not password:
             return JsonResponse({
@@ -53,7 +136,10 @@ def register(request):
             'status': 'error',
             'message': '잘못된 JSON 형식입니다.'
         }, status=400)
-    except Exception as e:
+    except HashingBusy:
+        return _hashing_busy_response()
+    except Exception:
+        logger.exception('register 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -67,14 +153,20 @@ def login_view(request):
         username = data.get('username')
         password = data.get('password')
         
-        print(f"Login attempt - Username: {username}")  # 디버깅
+        logger.debug('로그인 시도: %s', username)
+        
+        # 비밀번호 해시 전에 IP/아이디 별 시도 수 제한
+        retry_after = throttle.check(request, username)
+        if retry_after:
+            logger.info('로그인 시도 제한', extra={'username': username, 'ip': throttle.client_ip(request)})
+            return _throttled_response(retry_after)
         
         # 사용자 존재 확인
         try:
             user_exists = User.objects.get(username=username)
-            print(f"User exists: {user_exists.username}, is_active: {user_exists.is_active}")  # 디버깅
+            logger.debug('사용자 확인: %s, is_active=%s', user_exists.username, user_exists.is_active)
         except User.DoesNotExist:
-            print(f"User {username} does not exist")  # 디버깅
+            logger.info('로그인 실패: 존재하지 않는 사용자', extra={'username': username})
             return JsonResponse({
                 'status': 'error',
                 'message': '존재하지 않는 사용자입니다.'
@@ -83,7 +175,8 @@ def login_view(request):
         user = authenticate(request, username=username, password=password)
         
         if user is not None:
-            print(f"Authentication successful for {username}")  # 디버깅
+            logger.info('로그인 성공', extra={'username': username})
+            throttle.login_succeeded(username)
             login(request, user)
             return JsonResponse({
                 'status': 'success',
@@ -93,7 +186,7 @@ def login_view(request):
                 'is_admin': user.username == 'admin'
             })
         else:
-            print(f"Authentication failed for {username}")  # 디버깅
+            logger.info('로그인 실패: 인증 오류', extra={'username': username})
             return JsonResponse({
                 'status': 'error',
                 'message': '아이디 또는 비밀번호가 잘못되었습니다.'
@@ -104,8 +197,10 @@ def login_view(request):
             'status': 'error',
             'message': '잘못된 JSON 형식입니다.'
         }, status=400)
-    except Exception as e:
-        print(f"Login error: {e}")  # 디버깅
+    except HashingBusy:
+        return _hashing_busy_response()
+    except Exception:
+        logger.exception('로그인 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -113,12 +208,48 @@ def login_view(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+# 세션 1 + 사용자 캐시 채우기 1, 비밀번호가 바뀐 세션은 flush(조회 1 + 삭제 1)
+@query_budget(4)
+def auth_status(request):
+    """로그인 상태 확인 (세션의 사용자 정보)"""
+    return JsonResponse(_auth_status_response(request.user))
+
+def _auth_status_response(user):
+    if not user.is_authenticated:
+        return {'status': 'success', 'is_authenticated': False}
+    return {
+        'status': 'success',
+        'is_authenticated': True,
+        'user_id': user.id,
+        'username': user.username,
+        'is_admin': user.username == 'admin'
+    }
+
+def _user_stats(user_ids):
+    """사용자별 (거래 내역 수, 마지막 거래 내역 변경 시각)을 GROUP BY 쿼리 한 번으로 조회합니다."""
+    rows = Transaction.objects.filter(user_id__in=user_ids).values('user_id').annotate(
+        transaction_count=Count('id'),
+        last_activity=Max('updated_at')
+    ).order_by().values_list('user_id', 'transaction_count', 'last_activity')
+    return {user_id: (count, last_activity) for user_id, count, last_activity in rows}
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@query_budget(4)
 def user_list(request):
+    """사용자 목록 조회 (관리자 전용)
+
+    q: 사용자명/이메일 앞부분 검색 (대소문자 무시)
+    limit / cursor: 커서 페이지네이션 (가입일 내림차순)
+    stats=1: 사용자별 거래 내역 수(transaction_count)와 마지막 활동 시각(last_activity) 포함
+    """
     try:
-        # 디버깅을 위한 로그
-        print(f"Request user: {request.user}")
-        print(f"Is authenticated: {request.user.is_authenticated}")
-        print(f"Session key: {request.session.session_key}")
+        # 디버깅을 위한 로그 (DEBUG 레벨이 꺼져 있으면 값도 읽지 않음)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                '사용자 목록 요청: user=%s, authenticated=%s, session=%s',
+                request.user, request.user.is_authenticated, request.session.session_key
+            )
         
         # 로그인 확인
         if not request.user.is_authenticated:
@@ -134,30 +265,51 @@ def user_list(request):
                 'message': '관리자 권한이 필요합니다.'
             }, status=403)
         
-        # 모든 사용자 목록 가져오기
-        users = User.objects.all().order_by('-date_joined')
-        user_list = []
+        users = User.objects.all()
+        query = request.GET.get('q', '').strip()
+        if query:
+            # 앞부분 일치만 지원 (UPPER(...) text_pattern_ops 인덱스 사용)
+            users = users.filter(Q(username__istartswith=query) | Q(email__istartswith=query))
+        users = users.values_list(*serialization.USER_VALUES, named=True).order_by(
+            *[f'-{field}' if descending else field for field, descending, _ in USER_ORDERING]
+        )
         
-        for user in users:
-            user_data = {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'is_admin': user.username == 'admin',
-                'is_active': user.is_active,
-                'date_joined': user.date_joined.strftime('%Y-%m-%d %H:%M:%S'),
-                'last_login': user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else '로그인 기록 없음'
-            }
-            user_list.append(user_data)
+        # limit 또는 cursor 가 있으면 커서 페이지네이션 모드
+        paginated = 'limit' in request.GET or 'cursor' in request.GET
+        next_cursor = None
+        if paginated:
+            try:
+                users, next_cursor = keyset_paginate(
+                    users,
+                    USER_ORDERING,
+                    cursor=request.GET.get('cursor'),
+                    limit=parse_limit(request.GET.get('limit'))
+                )
+            except InvalidCursor as e:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': str(e)
+                }, status=400)
+        else:
+            users = list(users)
         
-        return JsonResponse({
+        stats = None
+        if request.GET.get('stats') in ('1', 'true'):
+            stats = _user_stats([user.id for user in users])
+        user_list = serialization.serialize_users(users, stats)
+        
+        response_data = {
             'status': 'success',
             'users': user_list,
             'total_count': len(user_list)
-        })
+        }
+        if paginated:
+            response_data['next_cursor'] = next_cursor
+            response_data['has_more'] = next_cursor is not None
+        return serialization.json_response(response_data)
         
-    except Exception as e:
-        print(f"Error in user_list: {e}")
+    except Exception:
+        logger.exception('user_list 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -194,6 +346,7 @@ def user_update(request, user_id):
         data = json.loads(request.body)
         
         # 사용자 정보 업데이트
+        changed = []
         if 'email' in data:
             # 이메일 중복 검사 (자신 제외)
             if User.objects.filter(email=data['email']).exclude(id=user_id).exists():
@@ -202,14 +355,19 @@ def user_update(request, user_id):
                     'message': '이미 존재하는 이메일입니다.'
                 }, status=400)
             user.email = data['email']
+            changed.append('email')
         
         if 'is_active' in data:
             user.is_active = data['is_active']
+            changed.append('is_active')
         
         if 'password' in data and data['password']:
             user.set_password(data['password'])
+            changed.append('password')
         
-        user.save()
+        # 바꾼 필드만 저장 (동시에 올라간 ledger_version 등을 예전 값으로 덮어쓰지 않도록)
+        # 세션 인증용 사용자 캐시는 post_save 시그널에서 무효화 (비활성화/비밀번호 변경 즉시 반영)
+        user.save(update_fields=changed + ['updated_at'])
         
         return JsonResponse({
             'status': 'success',
@@ -230,8 +388,10 @@ def user_update(request, user_id):
             'status': 'error',
             'message': '잘못된 JSON 형식입니다.'
         }, status=400)
-    except Exception as e:
-        print(f"Error in user_update: {e}")
+    except HashingBusy:
+        return _hashing_busy_response()
+    except Exception:
+        logger.exception('user_update 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -273,23 +433,33 @@ def user_delete(request, user_id):
         
         username = user.username
         user.delete()
+        # 사용자가 만든 카테고리도 함께 삭제되므로 캐시 무효화
+        cache.invalidate_categories()
         
         return JsonResponse({
             'status': 'success',
             'message': f'사용자 "{username}"이(가) 삭제되었습니다.'
         })
         
-    except Exception as e:
-        print(f"Error in user_delete: {e}")
+    except Exception:
+        logger.exception('user_delete 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
         }, status=500)
 
 @csrf_exempt
-@require_http_methods(["GET"])
-def category_list(request):
-    """카테고리 목록 조회"""
+@require_http_methods(["POST"])
+def user_import(request):
+    """사용자 일괄 등록 (CSV 업로드 또는 JSON 배열, 관리자 전용)
+
+    한 행이라도 오류가 있으면 아무도 등록하지 않고 행별 오류를 반환합니다.
+    partial=true 이면 오류 행만 건너뛰고 나머지를 등록합니다.
+    비밀번호는 로그인과 같은 해시 작업 풀에서 한 건씩 해시하므로, 요청 하나가
+    작업 스레드를 오래 붙잡지 않도록 PROVISIONING_MAX_PASSWORDS(기본 10)건까지만
+    받고 응답의 max_passwords 로 알려줍니다. PROVISIONING_MAX_ROWS 보다 많은
+    사용자나 그보다 많은 비밀번호는 provision_users 관리 명령어로 등록합니다.
+    """
     try:
         # 로그인 확인
         if not request.user.is_authenticated:
@@ -298,30 +468,118 @@ def category_list(request):
                 'message': '로그인이 필요합니다.'
             }, status=401)
         
-        # 모든 카테고리 목록 가져오기 (일반 사용자도 조회 가능)
-        categories = Category.objects.all().order_by('type', 'name')
-        category_list = []
+        # Admin 권한 확인
+        if request.user.username != 'admin':
+            return JsonResponse({
+                'status': 'error',
+                'message': '관리자 권한이 필요합니다.'
+            }, status=403)
         
-        for category in categories:
-            category_data = {
-                'id': category.id,
-                'type': category.type,
-                'type_display': category.get_type_display(),
-                'name': category.name,
-                'remark': category.remark or '',
-                'created_by': category.created_by.username,
-                'created_at': category.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            }
-            category_list.append(category_data)
+        try:
+            rows = provisioning.read_rows(request)
+        except importer.ImportFormatError as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=400)
+        
+        if not rows:
+            return JsonResponse({
+                'status': 'error',
+                'message': '등록할 사용자가 없습니다.'
+            }, status=400)
+        if len(rows) > settings.PROVISIONING_MAX_ROWS:
+            return JsonResponse({
+                'status': 'error',
+                'message': (
+                    f'한 번에 {settings.PROVISIONING_MAX_ROWS}명까지 등록할 수 있습니다. '
+                    '더 많은 사용자는 provision_users 관리 명령어를 사용해주세요.'
+                )
+            }, status=400)
+        password_count = sum(1 for row in rows if row.get('password'))
+        if password_count > settings.PROVISIONING_MAX_PASSWORDS:
+            return JsonResponse({
+                'status': 'error',
+                'message': (
+                    f'비밀번호가 있는 사용자는 한 번에 {settings.PROVISIONING_MAX_PASSWORDS}명까지 등록할 수 있습니다. '
+                    '비밀번호 없이 등록한 뒤 사용자 수정 API 로 설정하거나, '
+                    'provision_users 관리 명령어를 사용해주세요.'
+                ),
+                'password_count': password_count,
+                'max_passwords': settings.PROVISIONING_MAX_PASSWORDS
+            }, status=400)
+        
+        objects, passwords, errors = provisioning.build_users(rows)
+        partial = request.GET.get('partial', '').lower() == 'true'
+        
+        if errors and not partial:
+            return JsonResponse({
+                'status': 'error',
+                'message': f'{len(errors)}개 행에 오류가 있어 등록하지 않았습니다.',
+                'created_count': 0,
+                'errors': errors
+            }, status=400)
+        
+        created_count = provisioning.provision_users(objects, passwords)
+        logger.info('사용자 일괄 등록', extra={'created_count': created_count, 'error_count': len(errors)})
         
         return JsonResponse({
             'status': 'success',
-            'categories': category_list,
-            'total_count': len(category_list)
-        })
+            'message': f'{created_count}명의 사용자를 등록했습니다.',
+            'created_count': created_count,
+            'errors': errors,
+            'max_passwords': settings.PROVISIONING_MAX_PASSWORDS
+        }, status=201)
         
-    except Exception as e:
-        print(f"Error in category_list: {e}")
+    except IntegrityError:
+        # 중복 확인 후 저장 전에 같은 아이디/이메일이 다른 요청으로 등록된 경우
+        return JsonResponse({
+            'status': 'error',
+            'message': '등록 중 중복된 아이디 또는 이메일이 생겼습니다. 다시 시도해주세요.'
+        }, status=409)
+    except HashingBusy:
+        return _hashing_busy_response()
+    except Exception:
+        logger.exception('user_import 처리 중 오류')
+        return JsonResponse({
+            'status': 'error',
+            'message': '서버 오류가 발생했습니다.'
+        }, status=500)
+
+def _category_list_response(request, payload):
+    # 클라이언트가 가진 목록이 최신이면 304
+    response = get_conditional_response(
+        request,
+        etag=payload['etag'],
+        last_modified=payload['last_modified']
+    )
+    if response is None:
+        response = HttpResponse(payload['body'], content_type='application/json')
+    response['ETag'] = payload['etag']
+    response['Last-Modified'] = http_date(payload['last_modified'])
+    # 브라우저가 임의로 캐시하지 않고 항상 ETag 로 재검증하도록
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@query_budget(4)
+def category_list(request):
+    """카테고리 목록 조회"""
+    try:
+        # 로그인 확인
+        if not request.user.is_authenticated:
+            return JsonResponse({
+                'status': 'error',
+                'message': '로그인이 필요합니다.'
+            }, status=401)
+        
+        # 모든 카테고리 목록 가져오기 (일반 사용자도 조회 가능, 캐시된 응답 사용)
+        payload = cache.get_category_payload()
+        return _category_list_response(request, payload)
+        
+    except Exception:
+        logger.exception('category_list 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -382,6 +640,7 @@ def category_create(request):
             remark=remark,
             created_by=request.user
         )
+        cache.invalidate_categories()
         
         return JsonResponse({
             'status': 'success',
@@ -402,8 +661,8 @@ def category_create(request):
             'status': 'error',
             'message': '잘못된 JSON 형식입니다.'
         }, status=400)
-    except Exception as e:
-        print(f"Error in category_create: {e}")
+    except Exception:
+        logger.exception('category_create 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -466,6 +725,9 @@ def category_update(request, category_id):
             category.remark = data['remark']
         
         category.save()
+        cache.invalidate_categories()
+        # 거래 내역 목록에 카테고리명이 포함되므로 관련 사용자 버전도 올림
+        ledger.bump_versions_for_category(category.id)
         
         return JsonResponse({
             'status': 'success',
@@ -486,8 +748,8 @@ def category_update(request, category_id):
             'status': 'error',
             'message': '잘못된 JSON 형식입니다.'
         }, status=400)
-    except Exception as e:
-        print(f"Error in category_update: {e}")
+    except Exception:
+        logger.exception('category_update 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
@@ -522,51 +784,157 @@ def category_delete(request, category_id):
             }, status=404)
         
         category_name = category.name
-        category.delete()
+        with db_transaction.atomic():
+            ledger.bump_versions_for_category(category.id, deleting=True)
+            category.delete()
+        cache.invalidate_categories()
         
         return JsonResponse({
             'status': 'success',
             'message': f'카테고리 "{category_name}"가 삭제되었습니다.'
         })
         
-    except Exception as e:
-        print(f"Error in category_delete: {e}")
+    except Exception:
+        logger.exception('category_delete 처리 중 오류')
         return JsonResponse({
             'status': 'error',
             'message': '서버 오류가 발생했습니다.'
         }, status=500)
 
+def _not_modified(request, etag):
+    """클라이언트의 If-None-Match 가 etag 와 같으면 304 응답, 아니면 None"""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+def _transaction_list_query(request, user_id, version):
+    """transaction_list 의 ETag, 조회 조건, 정렬, 커서를 처리합니다. (동기/async 뷰 공용)
+
+    쿼리는 실행하지 않습니다. 바로 돌려줄 응답(304 또는 오류)이 있으면 그
+    응답을, 아니면 (etag, queryset, page) 를 반환합니다. page 는 커서
+    페이지네이션 모드(limit 또는 cursor 지정)일 때 (ordering, limit), 아니면 None
+    """
+    # 거래 내역 버전이 그대로면 직렬화 없이 304
+    etag = ledger.list_etag(user_id, version, request.GET.urlencode())
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    ordering = TRANSACTION_SORTS.get(request.GET.get('sort') or 'date')
+    if ordering is None:
+        return JsonResponse({'status': 'error', 'message': '유효하지 않은 정렬 기준입니다.'})
+    
+    try:
+        transactions = _filter_transactions(
+            Transaction.objects.filter(user_id=user_id), request.GET
+        )
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': '잘못된 조회 조건입니다.'})
+    
+    # 모델 인스턴스 대신 튜플로 읽어 serialization 에서 일괄 변환
+    transactions = transactions.values_list(
+        *serialization.TRANSACTION_VALUES, named=True
+    ).order_by(*[f'-{field}' if descending else field for field, descending, _ in ordering])
+    
+    # limit 또는 cursor 가 있으면 커서 페이지네이션 모드
+    page = None
+    if 'limit' in request.GET or 'cursor' in request.GET:
+        try:
+            limit = parse_limit(request.GET.get('limit'))
+            transactions = page_queryset(transactions, ordering, cursor=request.GET.get('cursor'), limit=limit)
+        except InvalidCursor as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+        page = (ordering, limit)
+    
+    return etag, transactions, page
+
+def _transaction_list_response(rows, version, etag, page):
+    """_transaction_list_query 의 queryset 을 실행한 행 목록으로 응답을 만듭니다."""
+    next_cursor = None
+    if page is not None:
+        rows, next_cursor = page_result(rows, *page)
+    
+    response_data = {
+        'status': 'success',
+        'transactions': serialization.serialize_transactions(rows),
+        # transaction_sync 의 since 로 사용
+        'version': version
+    }
+    if page is not None:
+        response_data['next_cursor'] = next_cursor
+        response_data['has_more'] = next_cursor is not None
+    
+    response = serialization.json_response(response_data)
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
 @csrf_exempt
+@query_budget(4)
 def transaction_list(request):
-    """거래 내역 목록 조회"""
+    """거래 내역 목록 조회
+
+    조회 조건: year / start_date / end_date, category_id, transaction_type,
+    min_amount / max_amount, q (설명·메모 검색)
+    정렬(sort): date(기본), date_asc, amount, amount_asc
+    """
     if request.method == 'GET':
         if not request.user.is_authenticated:
             return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
         
         try:
-            transactions = Transaction.objects.filter(user=request.user).order_by('-transaction_date', '-created_at')
-            
-            transaction_list = []
-            for transaction in transactions:
-                transaction_list.append({
-                    'id': transaction.id,
-                    'transaction_type': transaction.transaction_type,
-                    'transaction_type_display': transaction.get_transaction_type_display(),
-                    'amount': str(transaction.amount),
-                    'description': transaction.description,
-                    'transaction_date': transaction.transaction_date.strftime('%Y-%m-%d'),
-                    'memo': transaction.memo or '',
-                    'category': {
-                        'id': transaction.category.id,
-                        'name': transaction.category.name,
-                        'type_display': transaction.category.get_type_display()
-                    },
-                    'created_at': transaction.created_at.strftime('%Y-%m-%d %H:%M:%S')
-                })
+            version = ledger.current_version(request.user.id)
+            query = _transaction_list_query(request, request.user.id, version)
+            if isinstance(query, HttpResponse):
+                return query
             
-            return JsonResponse({
+            etag, transactions, page = query
+            return _transaction_list_response(list(transactions), version, etag, page)
+            
+        except Exception as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+    
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+
+@csrf_exempt
+@query_budget(5)
+def transaction_sync(request):
+    """since 버전 이후 변경된 거래 내역과 삭제된 거래 내역 id 조회
+
+    응답의 version 을 다음 요청의 since 로 사용합니다. since 가 없거나 0 이면
+    전체 목록을 반환합니다.
+    """
+    if request.method == 'GET':
+        if not request.user.is_authenticated:
+            return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
+        
+        try:
+            try:
+                since = int(request.GET.get('since') or 0)
+            except ValueError:
+                return JsonResponse({'status': 'error', 'message': 'since 는 정수여야 합니다.'})
+            
+            version = ledger.current_version(request.user.id)
+            transactions = Transaction.objects.filter(user=request.user).values_list(
+                *serialization.TRANSACTION_VALUES
+            ).order_by('-transaction_date', '-created_at', 'id')
+            deleted_ids = []
+            if since:
+                transactions = transactions.filter(version__gt=since, version__lte=version)
+                deleted_ids = list(TransactionTombstone.objects.filter(
+                    user=request.user,
+                    version__gt=since,
+                    version__lte=version
+                ).values_list('transaction_id', flat=True))
+            
+            return serialization.json_response({
                 'status': 'success',
-                'transactions': transaction_list
+                'transactions': serialization.serialize_transactions(transactions),
+                'deleted_ids': deleted_ids,
+                'version': version,
+                'full': not since
             })
             
         except Exception as e:
@@ -574,6 +942,216 @@ def transaction_list(request):
     
     return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
 
+def _parse_date_range(params, field):
+    """조회 기간 파라미터(year 또는 start_date/end_date)를 field 에 대한 필터로 바꿉니다."""
+    filters = {}
+    if params.get('year'):
+        year = int(params['year'])
+        filters[f'{field}__gte'] = date(year, 1, 1)
+        filters[f'{field}__lte'] = date(year, 12, 31)
+    if params.get('start_date'):
+        filters[f'{field}__gte'] = date.fromisoformat(params['start_date'])
+    if params.get('end_date'):
+        filters[f'{field}__lte'] = date.fromisoformat(params['end_date'])
+    return filters
+
+def _filter_transactions(transactions, params):
+    """거래 내역 조회 조건을 queryset 에 적용합니다. 잘못된 값이면 ValueError"""
+    transactions = transactions.filter(**_parse_date_range(params, 'transaction_date'))
+    
+    if params.get('category_id'):
+        transactions = transactions.filter(category_id=int(params['category_id']))
+    
+    if params.get('transaction_type'):
+        if params['transaction_type'] not in dict(Transaction.TRANSACTION_TYPE_CHOICES):
+            raise ValueError('유효하지 않은 거래 유형입니다.')
+        transactions = transactions.filter(transaction_type=params['transaction_type'])
+    
+    for param, lookup in (('min_amount', 'amount__gte'), ('max_amount', 'amount__lte')):
+        if params.get(param):
+            try:
+                amount = Decimal(params[param])
+            except InvalidOperation:
+                raise ValueError('잘못된 금액입니다.')
+            if not amount.is_finite():
+                raise ValueError('잘못된 금액입니다.')
+            transactions = transactions.filter(**{lookup: amount})
+    
+    # icontains 는 UPPER(컬럼) LIKE UPPER('%검색어%') 가 되며, models.py 의
+    # UPPER(...) trigram GIN 인덱스로 처리됨 (3글자 이상일 때 효과적)
+    search = (params.get('q') or '').strip()
+    if search:
+        transactions = transactions.filter(
+            Q(description__icontains=search) | Q(memo__icontains=search)
+        )
+    return transactions
+
+def _summary_querysets(request, user):
+    """(월별 합계, 카테고리별 합계) queryset - 원본 거래 내역 대신 일별 집계 테이블(DailyBalance)에서 합산
+
+    동기/async 뷰 공용이며 쿼리는 실행하지 않습니다. 기간 형식이 잘못되었으면
+    오류 응답을 반환합니다.
+    """
+    try:
+        date_filters = _parse_date_range(request.GET, 'date')
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': '잘못된 기간 형식입니다.'})
+    
+    balances = DailyBalance.objects.filter(user=user, **date_filters).order_by()
+    income = Sum('income_sum')
+    expense = Sum('expense_sum')
+    
+    monthly = (
+        balances
+        .annotate(month=TruncMonth('date'))
+        .values('month')
+        .annotate(income=income, expense=expense)
+        .order_by('month')
+    )
+    by_category = (
+        balances
+        .values('category_id', 'category__name', 'category__type')
+        .annotate(income=income, expense=expense)
+        .order_by('category__type', 'category__name')
+    )
+    return monthly, by_category
+
+def _summary_response(monthly, by_category):
+    type_display = serialization.CATEGORY_TYPE_DISPLAY
+    
+    monthly_list = []
+    total_income = total_expense = 0
+    for row in monthly:
+        row_income = row['income'] or 0
+        row_expense = row['expense'] or 0
+        total_income += row_income
+        total_expense += row_expense
+        monthly_list.append({
+            'month': row['month'].strftime('%Y-%m'),
+            'income': str(row_income),
+            'expense': str(row_expense)
+        })
+    
+    category_list = [{
+        'category_id': row['category_id'],
+        'name': row['category__name'],
+        'type_display': type_display.get(row['category__type'], row['category__type']),
+        'income': str(row['income'] or 0),
+        'expense': str(row['expense'] or 0)
+    } for row in by_category]
+    
+    return {
+        'status': 'success',
+        'monthly': monthly_list,
+        'categories': category_list,
+        'total': {
+            'income': str(total_income),
+            'expense': str(total_expense),
+            'balance': str(total_income - total_expense)
+        }
+    }
+
+@csrf_exempt
+@query_budget(4)
+def transaction_summary(request):
+    """월별/카테고리별 수입·지출 합계 조회 (일별 집계 테이블에서 GROUP BY)"""
+    if request.method == 'GET':
+        if not request.user.is_authenticated:
+            return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
+        
+        try:
+            querysets = _summary_querysets(request, request.user)
+            if isinstance(querysets, HttpResponse):
+                return querysets
+            
+            monthly, by_category = querysets
+            return JsonResponse(_summary_response(list(monthly), list(by_category)))
+            
+        except Exception as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+    
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+
+class _EchoBuffer:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 가짜 파일 객체"""
+    def write(self, value):
+        return value
+
+def _export_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if value is None:
+        return ''
+    return str(value) if not isinstance(value, (int, str)) else value
+
+def _export_csv_value(value):
+    # 설명/메모/카테고리명처럼 사용자가 입력한 텍스트가 =, +, -, @ 등으로 시작하면
+    # 엑셀이 수식으로 실행하므로 ' 를 붙여 텍스트로 표시 (숫자 칸은 그대로)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return _export_value(value)
+
+def _export_csv_rows(rows):
+    writer = csv.writer(_EchoBuffer())
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    yield '\ufeff' + writer.writerow(EXPORT_HEADER)
+    for row in rows:
+        yield writer.writerow([_export_csv_value(value) for value in row])
+
+def _export_ndjson_rows(rows):
+    for row in rows:
+        yield json.dumps(
+            dict(zip(EXPORT_HEADER, (_export_value(value) for value in row))),
+            ensure_ascii=False
+        ) + '\n'
+
+@csrf_exempt
+def transaction_export(request):
+    """거래 내역 내보내기 (CSV / NDJSON 스트리밍)
+
+    서버 측 커서로 EXPORT_CHUNK_SIZE 건씩 읽어 바로 내보내므로 거래 내역 수와
+    관계없이 메모리 사용량이 일정합니다.
+    """
+    if request.method == 'GET':
+        if not request.user.is_authenticated:
+            return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
+        
+        try:
+            export_format = request.GET.get('format', 'csv').lower()
+            if export_format not in ('csv', 'ndjson'):
+                return JsonResponse({'status': 'error', 'message': 'format 은 csv 또는 ndjson 이어야 합니다.'})
+            
+            try:
+                transactions = _filter_transactions(
+                    Transaction.objects.filter(user=request.user), request.GET
+                )
+            except ValueError:
+                return JsonResponse({'status': 'error', 'message': '잘못된 조회 조건입니다.'})
+            
+            rows = (
+                transactions
+                .order_by('-transaction_date', '-created_at', 'id')
+                .values_list(*EXPORT_FIELDS)
+                .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+            )
+            
+            if export_format == 'csv':
+                content = _export_csv_rows(rows)
+                content_type = 'text/csv; charset=utf-8'
+            else:
+                content = _export_ndjson_rows(rows)
+                content_type = 'application/x-ndjson; charset=utf-8'
+            
+            filename = f'transactions_{date.today().strftime("%Y%m%d")}.{export_format}'
+            response = StreamingHttpResponse(content, content_type=content_type)
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
+            
+        except Exception as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+    
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+
 @csrf_exempt
 def transaction_create(request):
     """거래 내역 생성"""
@@ -596,16 +1174,19 @@ def transaction_create(request):
             except Category.DoesNotExist:
                 return JsonResponse({'status': 'error', 'message': '존재하지 않는 카테고리입니다.'})
             
-            # 거래 내역 생성
-            transaction = Transaction.objects.create(
-                user=request.user,
-                category=category,
-                transaction_type=data['transaction_type'],
-                amount=data['amount'],
-                description=data['description'],
-                transaction_date=data['transaction_date'],
-                memo=data.get('memo', '')
-            )
+            # 거래 내역 생성 (일별 집계와 함께 반영)
+            with db_transaction.atomic():
+                transaction = Transaction.objects.create(
+                    user=request.user,
+                    category=category,
+                    transaction_type=data['transaction_type'],
+                    amount=data['amount'],
+                    description=data['description'],
+                    transaction_date=data['transaction_date'],
+                    memo=data.get('memo', ''),
+                    version=ledger.bump_version(request.user.id)
+                )
+                rollup.add_transaction(transaction)
             
             return JsonResponse({
                 'status': 'success',
@@ -620,6 +1201,51 @@ def transaction_create(request):
     
     return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
 
+@csrf_exempt
+def transaction_import(request):
+    """거래 내역 일괄 가져오기 (JSON 배열 또는 CSV 업로드)
+
+    한 행이라도 오류가 있으면 아무것도 저장하지 않고 행별 오류를 반환합니다.
+    partial=true 이면 오류 행만 건너뛰고 나머지를 저장합니다.
+    """
+    if request.method == 'POST':
+        if not request.user.is_authenticated:
+            return JsonResponse({'status': 'error', 'message': '로그인이 필요합니다.'})
+        
+        try:
+            try:
+                rows = importer.read_rows(request)
+            except importer.ImportFormatError as e:
+                return JsonResponse({'status': 'error', 'message': str(e)})
+            
+            if not rows:
+                return JsonResponse({'status': 'error', 'message': '가져올 거래 내역이 없습니다.'})
+            
+            objects, errors = importer.build_transactions(request.user, rows)
+            partial = request.GET.get('partial', '').lower() == 'true'
+            
+            if errors and not partial:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': f'{len(errors)}개 행에 오류가 있어 가져오지 않았습니다.',
+                    'imported_count': 0,
+                    'errors': errors
+                })
+            
+            imported_count = importer.import_transactions(objects)
+            
+            return JsonResponse({
+                'status': 'success',
+                'message': f'{imported_count}개의 거래 내역을 가져왔습니다.',
+                'imported_count': imported_count,
+                'errors': errors
+            })
+            
+        except Exception as e:
+            return JsonResponse({'status': 'error', 'message': str(e)})
+    
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+
 @csrf_exempt
 def transaction_update(request, transaction_id):
     """거래 내역 수정"""
@@ -635,28 +1261,38 @@ def transaction_update(request, transaction_id):
                 return JsonResponse({'status': 'error', 'message': '존재하지 않는 거래 내역이거나 권한이 없습니다.'})
             
             data = json.loads(request.body)
+            changes = {}
             
             # 카테고리 존재 확인
             if data.get('category_id'):
                 try:
-                    category = Category.objects.get(id=data['category_id'])
-                    transaction.category = category
+                    changes['category'] = Category.objects.get(id=data['category_id'])
                 except Category.DoesNotExist:
                     return JsonResponse({'status': 'error', 'message': '존재하지 않는 카테고리입니다.'})
             
             # 필드 업데이트
-            if data.get('transaction_type'):
-                transaction.transaction_type = data['transaction_type']
-            if data.get('amount'):
-                transaction.amount = data['amount']
-            if data.get('description'):
-                transaction.description = data['description']
-            if data.get('transaction_date'):
-                transaction.transaction_date = data['transaction_date']
+            for field in ('transaction_type', 'amount', 'description', 'transaction_date'):
+                if data.get(field):
+                    changes[field] = data[field]
             if 'memo' in data:
-                transaction.memo = data['memo']
+                changes['memo'] = data['memo']
             
-            transaction.save()
+            with db_transaction.atomic():
+                # 사용자 행 잠금(버전)을 먼저 잡아 다른 쓰기와 잠금 순서를 맞춤
+                version = ledger.bump_version(request.user.id)
+                # 동시에 수정한 요청이 같은 이전 값을 집계에서 두 번 빼지 않도록
+                # 잠근 행을 다시 읽어 그 값으로 스냅숏을 만듦
+                transaction = Transaction.objects.select_for_update().filter(
+                    pk=transaction.pk, user=request.user
+                ).first()
+                if transaction is None:
+                    return JsonResponse({'status': 'error', 'message': '존재하지 않는 거래 내역이거나 권한이 없습니다.'})
+                before = rollup.snapshot(transaction)
+                for field, value in changes.items():
+                    setattr(transaction, field, value)
+                transaction.version = version
+                transaction.save()
+                rollup.move_transaction(before, transaction)
             
             return JsonResponse({
                 'status': 'success',
@@ -684,7 +1320,13 @@ def transaction_delete(request, transaction_id):
             except Transaction.DoesNotExist:
                 return JsonResponse({'status': 'error', 'message': '존재하지 않는 거래 내역이거나 권한이 없습니다.'})
             
-            transaction.delete()
+            with db_transaction.atomic():
+                # 사용자 행 잠금(버전)을 먼저 잡아 다른 쓰기와 잠금 순서를 맞춤
+                version = ledger.bump_version(request.user.id)
+                # 동시에 삭제된 경우 집계를 두 번 빼지 않도록 실제 삭제된 경우에만 반영
+                if Transaction.objects.filter(pk=transaction.pk).delete()[0]:
+                    rollup.remove_transaction(transaction)
+                    ledger.record_deletes(request.user.id, [transaction.pk], version)
             
             return JsonResponse({
                 'status': 'success',
@@ -711,10 +1353,16 @@ def transaction_bulk_delete(request):
                 return JsonResponse({'status': 'error', 'message': '삭제할 거래 내역을 선택해주세요.'})
             
             # 사용자의 거래 내역만 삭제
-            deleted_count = Transaction.objects.filter(
-                id__in=transaction_ids,
-                user=request.user
-            ).delete()[0]
+            with db_transaction.atomic():
+                version = ledger.bump_version(request.user.id)
+                locked_ids = list(Transaction.objects.filter(
+                    id__in=transaction_ids,
+                    user=request.user
+                ).select_for_update().values_list('id', flat=True))
+                targets = Transaction.objects.filter(id__in=locked_ids)
+                rollup.remove_queryset(targets)
+                deleted_count = targets.delete()[0]
+                ledger.record_deletes(request.user.id, locked_ids, version)
             
             return JsonResponse({
                 'status': 'success',
@@ -727,4 +1375,12 @@ def transaction_bulk_delete(request):
         except Exception as e:
             return JsonResponse({'status': 'error', 'message': str(e)})
     
-    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'}) 
\ No newline at end of file
+    return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'})
+
+@require_http_methods(["GET"])
+@query_budget(0)
+def prometheus_metrics(request):
+    """요청별 성능 지표 (Prometheus 텍스트 형식, METRICS_ALLOWED_IPS 에서만 접근 가능)"""
+    if not metrics.client_allowed(request):
+        return HttpResponse('Forbidden', status=403, content_type='text/plain')
+    return HttpResponse(metrics.registry.render(), content_type=metrics.PROMETHEUS_CONTENT_TYPE)
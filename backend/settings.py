@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -42,6 +43,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party apps
     'rest_framework',
@@ -52,16 +54,57 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 전체 요청 처리 시간을 재도록 항상 맨 앞에 둠
+    'accounts.metrics.RequestMetricsMiddleware',
+    # 미들웨어와 뷰 전체를 샘플링하도록 지표 미들웨어 바로 다음에 둠
+    'accounts.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # 읽기 요청을 복제본으로 보냄 (세션·인증 미들웨어보다 앞에 둠)
+    'accounts.replicas.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'accounts.middleware.SlidingSessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # request.user 를 사용자 캐시에서 읽음 (accounts/cache.py)
+    'accounts.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # 뷰 실행 구간의 쿼리 수만 세도록 항상 마지막에 둠
+    'accounts.query_budget.QueryBudgetMiddleware',
 ]
 
+# True 면 읽기 API(거래 내역 목록/요약, 카테고리 목록, 로그인 상태)를 async 뷰로 연결
+# ASGI(uvicorn) 로 배포할 때만 켭니다 - knowledge_transfer/asgi_deployment.md 참고
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'False').lower() == 'true'
+
+# 쿼리 수 상한 초과 시 예외 발생 여부 (False 면 경고 로그만 남김, 테스트에서는 True 로 설정)
+QUERY_BUDGET_RAISE = os.getenv('QUERY_BUDGET_RAISE', 'False').lower() == 'true'
+
+# 요청별 성능 지표 수집 (/metrics, Prometheus 텍스트 형식) - knowledge_transfer/metrics.md 참고
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+# True 면 응답마다 Server-Timing 헤더(db / ser / total) 추가
+METRICS_SERVER_TIMING = os.getenv('METRICS_SERVER_TIMING', 'False').lower() == 'true'
+# /metrics 에 접근할 수 있는 클라이언트 IP
+METRICS_ALLOWED_IPS = os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+# 리버스 프록시 주소. 이 주소에서 온 요청은 X-Forwarded-For 로 클라이언트 IP 를 판단
+METRICS_TRUSTED_PROXIES = [ip for ip in os.getenv('METRICS_TRUSTED_PROXIES', '').split(',') if ip]
+
+# 샘플링 프로파일러 (collapsed stack 파일 저장) - knowledge_transfer/profiling.md 참고
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'False').lower() == 'true'
+# 무작위로 프로파일할 요청 비율 (0 이면 X-Profile 헤더가 있는 요청만)
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+# 스택 샘플링 간격(ms)
+PROFILING_INTERVAL_MS = float(os.getenv('PROFILING_INTERVAL_MS', '5'))
+# 프로세스당 분당 최대 프로파일 수 (헤더 요청 포함)
+PROFILING_MAX_PER_MINUTE = int(os.getenv('PROFILING_MAX_PER_MINUTE', '6'))
+# 상대 경로는 프로젝트 루트 기준
+PROFILING_DIR = str(BASE_DIR / os.getenv('PROFILING_DIR', 'profiles'))
+# 이 개수를 넘으면 오래된 파일부터 삭제
+PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', '500'))
+# profile_token 으로 발급한 토큰 유효 시간(초)
+PROFILING_TOKEN_MAX_AGE = int(os.getenv('PROFILING_TOKEN_MAX_AGE', '3600'))
+
 ROOT_URLCONF = 'backend.urls'
 
 TEMPLATES = [
@@ -86,6 +129,13 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+def _conn_max_age(value):
+    return None if value.lower() == 'none' else int(value)
+
+# DB 앞단 커넥션 풀러 (none / pgbouncer). pgbouncer 는 transaction 모드를 가정하며
+# DB_HOST/DB_PORT 를 pgbouncer 주소로 지정합니다 - knowledge_transfer/db_connections.md 참고
+DB_POOLER = os.getenv('DB_POOLER', 'none').lower()
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -94,9 +144,77 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST'),
         'PORT': os.getenv('DB_PORT'),
+        # 연결 재사용 시간(초). 0 이면 요청마다 새로 연결, none 이면 무기한 재사용
+        # ASGI(async 뷰)에서는 요청마다 스레드가 달라 연결이 재사용되지 않고 쌓이므로 기본값 0
+        'CONN_MAX_AGE': _conn_max_age(os.getenv('DB_CONN_MAX_AGE', '0' if ASYNC_VIEWS else '60')),
+        # 재사용하는 연결이 끊겼는지 요청 시작 시 확인 (DB 재시작/유휴 연결 정리 대비)
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True').lower() == 'true',
+        # pgbouncer transaction 모드는 트랜잭션마다 서버 연결이 바뀌므로
+        # 트랜잭션 밖에서 유지되는 서버 측 커서(.iterator())를 쓸 수 없음
+        'DISABLE_SERVER_SIDE_CURSORS': DB_POOLER == 'pgbouncer',
     }
 }
 
+# 읽기 전용 복제본 (accounts/replicas.py). DB_REPLICA_HOSTS=host:port,host:port 로 지정하면
+# replica1, replica2 ... alias 가 만들어지고 DB 이름/계정은 기본 DB 와 같은 값을 씀
+DATABASE_REPLICAS = []
+for _index, _address in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    _host, _, _port = _address.strip().partition(':')
+    DATABASES[f'replica{_index}'] = {
+        **DATABASES['default'],
+        'HOST': _host,
+        'PORT': _port or DATABASES['default']['PORT'],
+        # 테스트에서는 기본 DB 를 그대로 사용
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{_index}')
+
+# manage.py test 에서 복제본이 없으면 기본 DB 를 미러링하는 replica1 alias 를 만들어 라우팅 테스트에 씀.
+# DATABASE_REPLICAS 에는 넣지 않으므로 다른 테스트는 기본 DB 만 사용 (accounts/tests/test_replicas.py)
+if sys.argv[1:2] == ['test'] and not DATABASE_REPLICAS:
+    DATABASES['replica1'] = {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}
+
+DATABASE_ROUTERS = ['accounts.replicas.ReplicaRouter']
+# 쓰기 후 그 클라이언트의 읽기를 기본 DB 로 보내는 시간(초). 복제 지연보다 길게 설정
+REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', '5'))
+
+# 거래 내역 테이블 기간별 파티셔닝 (accounts/partitioning.py, PostgreSQL 전용)
+# partition_transactions --convert 로 변환한 뒤에만 사용되며, 관리 명령어의 기본값으로 쓰임
+# 파티션 단위(month / year), 미리 만들어 둘 미래 파티션 수, 보관 기간(개월, 0 이면 떼어내지 않음)
+TRANSACTION_PARTITION_INTERVAL = os.getenv('DB_TRANSACTION_PARTITION_INTERVAL', 'month')
+TRANSACTION_PARTITION_AHEAD = int(os.getenv('DB_TRANSACTION_PARTITION_AHEAD', '3'))
+TRANSACTION_PARTITION_RETENTION_MONTHS = int(os.getenv('DB_TRANSACTION_PARTITION_RETENTION_MONTHS', '0'))
+
+
+# Cache
+# 기본은 프로세스 내 메모리 캐시, CACHE_BACKEND 로 redis/memcached/db 선택 가능
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[os.getenv('CACHE_BACKEND', 'locmem')],
+        'LOCATION': os.getenv('CACHE_LOCATION', 'money-check'),
+    }
+}
+
+# 카테고리 목록 캐시 유지 시간(초, none 이면 무기한). 카테고리 변경 뷰에서 무효화하지만
+# 프로세스 메모리 캐시(locmem)는 다른 워커에 무효화가 전달되지 않으므로 짧게 유지
+_category_cache_timeout = os.getenv(
+    'CATEGORY_CACHE_TIMEOUT', '30' if os.getenv('CACHE_BACKEND', 'locmem') == 'locmem' else 'none'
+)
+CATEGORY_CACHE_TIMEOUT = None if _category_cache_timeout.lower() == 'none' else int(_category_cache_timeout)
+
+# 세션 인증용 사용자 캐시 유지 시간(초). 사용자 저장/삭제 시그널에서 무효화하지만
+# 프로세스 메모리 캐시(locmem)는 다른 워커에 무효화가 전달되지 않으므로 짧게 유지
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv(
+    'AUTH_USER_CACHE_TIMEOUT', '30' if os.getenv('CACHE_BACKEND', 'locmem') == 'locmem' else '600'
+))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -116,6 +234,37 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# 비밀번호 해시 (accounts/hashers.py). 첫 번째 항목이 새 비밀번호에 쓰이고 나머지는
+# 기존 비밀번호 검증용이며, 기존 비밀번호는 다음 로그인 때 PASSWORD_HASHER 로 다시 해시됨
+PASSWORD_HASHER_CLASSES = {
+    'pbkdf2': 'accounts.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'accounts.hashers.ScryptPasswordHasher',
+    'argon2': 'accounts.hashers.Argon2PasswordHasher',  # pip install argon2-cffi
+}
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv('PASSWORD_PBKDF2_ITERATIONS', '600000'))
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.getenv('PASSWORD_SCRYPT_WORK_FACTOR', str(2 ** 14)))
+PASSWORD_SCRYPT_BLOCK_SIZE = int(os.getenv('PASSWORD_SCRYPT_BLOCK_SIZE', '8'))
+PASSWORD_SCRYPT_PARALLELISM = int(os.getenv('PASSWORD_SCRYPT_PARALLELISM', '1'))
+PASSWORD_ARGON2_TIME_COST = int(os.getenv('PASSWORD_ARGON2_TIME_COST', '2'))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv('PASSWORD_ARGON2_MEMORY_COST', '102400'))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv('PASSWORD_ARGON2_PARALLELISM', '8'))
+
+# 해시 작업 스레드 수(프로세스당, 0 이면 요청 스레드에서 바로 계산)와 대기열 크기.
+# 기본값은 CPU 의 절반만 해시에 써서 로그인이 몰려도 다른 API 가 CPU 를 쓸 수 있게 함
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(max(1, (os.cpu_count() or 2) // 2))))
+PASSWORD_HASH_QUEUE = int(os.getenv('PASSWORD_HASH_QUEUE', '16'))
+# 대기열이 가득 찼을 때 자리가 나기를 기다리는 시간(초), 넘으면 503
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv('PASSWORD_HASH_QUEUE_TIMEOUT', '0.5'))
+
+# 로그인/회원가입 시도 제한 (accounts/throttle.py, 0 이면 사용 안 함)
+LOGIN_THROTTLE_WINDOW = int(os.getenv('LOGIN_THROTTLE_WINDOW', '60'))
+LOGIN_THROTTLE_PER_IP = int(os.getenv('LOGIN_THROTTLE_PER_IP', '30'))
+LOGIN_THROTTLE_PER_USERNAME = int(os.getenv('LOGIN_THROTTLE_PER_USERNAME', '10'))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -152,7 +301,22 @@ SESSION_COOKIE_SAMESITE = 'Lax'
 SESSION_COOKIE_SECURE = False  # 개발 환경에서는 False
 SESSION_COOKIE_HTTPONLY = False  # JavaScript에서 접근 가능하도록
 SESSION_COOKIE_AGE = 86400  # 24시간
-SESSION_SAVE_EVERY_REQUEST = True
+# 매 요청 저장 대신 SlidingSessionMiddleware 가 만료가 가까울 때만 연장
+SESSION_SAVE_EVERY_REQUEST = False
+# 남은 유효 시간이 이 값(초)보다 작아지면 세션 만료를 연장
+SESSION_RENEW_THRESHOLD = int(os.getenv('SESSION_RENEW_THRESHOLD', SESSION_COOKIE_AGE // 2))
+
+# 세션 저장소 (db / cached_db / cache / signed_cookies)
+# cache 는 여러 워커가 공유하는 캐시(CACHES)를 설정했을 때만 사용하세요.
+# cached_db 와 사용자 캐시(AUTH_USER_CACHE_TIMEOUT)를 함께 쓰면 로그인한 사용자의
+# 요청은 세션/사용자 조회 쿼리 없이 처리됩니다.
+SESSION_BACKENDS = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+SESSION_ENGINE = SESSION_BACKENDS[os.getenv('SESSION_BACKEND', 'db')]
 
 # CSRF 설정
 CSRF_COOKIE_SAMESITE = 'Lax'
@@ -174,5 +338,51 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10,
 }
 
+# 거래 내역 일괄 가져오기 시 bulk_create 배치 크기
+TRANSACTION_IMPORT_BATCH_SIZE = int(os.getenv('TRANSACTION_IMPORT_BATCH_SIZE', '1000'))
+
+# 사용자 일괄 등록 (accounts/provisioning.py): provision_users 명령어의 비밀번호 해시 프로세스 수,
+# bulk_create 배치 크기, users/import/ API 로 한 번에 등록할 수 있는 최대 인원과 그중 비밀번호가
+# 있는 최대 인원. API 는 로그인과 같은 해시 작업 풀에서 한 건씩 해시하므로, 요청 하나가 작업
+# 스레드를 오래 붙잡지 않도록 작게 유지 (PBKDF2 60만 회 약 0.3초 × 10 = 약 3초, 더 많으면 명령어 사용)
+PROVISIONING_PROCESSES = int(os.getenv('PROVISIONING_PROCESSES', str(os.cpu_count() or 1)))
+PROVISIONING_BATCH_SIZE = int(os.getenv('PROVISIONING_BATCH_SIZE', '1000'))
+PROVISIONING_MAX_ROWS = int(os.getenv('PROVISIONING_MAX_ROWS', '5000'))
+PROVISIONING_MAX_PASSWORDS = int(os.getenv('PROVISIONING_MAX_PASSWORDS', '10'))
+
+# Logging
+# JSON 한 줄 로그를 백그라운드 스레드에서 stderr 로 출력 (accounts/log.py)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+# 모듈별 로그 레벨, 예: LOG_LEVELS=accounts.views=DEBUG,django.db.backends=DEBUG
+LOG_LEVELS = {
+    name.strip(): level.strip().upper()
+    for name, _, level in (
+        item.partition('=') for item in os.getenv('LOG_LEVELS', '').split(',') if item.strip()
+    )
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {'()': 'accounts.log.JsonFormatter'},
+    },
+    'handlers': {
+        'background': {
+            'class': 'accounts.log.BackgroundHandler',
+            'formatter': 'json',
+        },
+    },
+    'root': {
+        'handlers': ['background'],
+        'level': LOG_LEVEL,
+    },
+    'loggers': {
+        # Django 기본 설정의 console 핸들러를 떼고 root(JSON)로 전달
+        'django': {'level': LOG_LEVELS.get('django', 'INFO')},
+        **{name: {'level': level} for name, level in LOG_LEVELS.items() if name != 'django'},
+    },
+}
+
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.User'
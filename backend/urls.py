@@ -16,9 +16,11 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from accounts import views as accounts_views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', accounts_views.prometheus_metrics, name='metrics'),  # Prometheus 수집용 (로컬 전용)
     path('api/auth/', include('accounts.urls')),
     path('api/', include('accounts.urls')),  # 카테고리 API를 위한 경로 추가
 ]
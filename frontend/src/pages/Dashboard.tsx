@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import styled from '@emotion/styled';
 import { useNavigate } from 'react-router-dom';
 import axios from 'axios';
@@ -207,6 +207,46 @@ const UserBadgeInTable = styled.span<{ isAdmin?: boolean }>`
   font-weight: bold;
 `;
 
+const UserSearchBar = styled.form`
+  display: flex;
+  gap: 0.5rem;
+  margin-top: 1rem;
+
+  input {
+    flex: 1;
+    max-width: 320px;
+    padding: 0.5rem;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    font-size: 0.9rem;
+  }
+
+  button {
+    padding: 0.5rem 1rem;
+    border: none;
+    border-radius: 4px;
+    background-color: #007bff;
+    color: white;
+    cursor: pointer;
+  }
+`;
+
+const LoadMoreButton = styled.button`
+  display: block;
+  margin: 1rem auto 0;
+  padding: 0.5rem 1.5rem;
+  border: 1px solid #007bff;
+  border-radius: 4px;
+  background: white;
+  color: #007bff;
+  cursor: pointer;
+
+  &:disabled {
+    opacity: 0.6;
+    cursor: default;
+  }
+`;
+
 const StatusBadge = styled.span<{ isActive?: boolean }>`
   background-color: ${props => props.isActive ? '#28a745' : '#6c757d'};
   color: white;
@@ -492,6 +532,8 @@ interface User {
   is_active: boolean;
   date_joined: string;
   last_login: string;
+  transaction_count?: number;
+  last_activity?: string | null;
 }
 
 interface Category {
@@ -520,12 +562,36 @@ interface Transaction {
   created_at: string;
 }
 
+// 사용자 목록 한 페이지 크기
+const USER_PAGE_SIZE = 50;
+
+// 거래 내역 한 페이지 크기
+const TRANSACTION_PAGE_SIZE = 200;
+
+// 서버 정렬 순서(거래일 내림차순, 생성일 내림차순, id 오름차순)와 동일하게 정렬
+const sortTransactions = (items: Transaction[]) =>
+  [...items].sort((a, b) =>
+    b.transaction_date.localeCompare(a.transaction_date) ||
+    b.created_at.localeCompare(a.created_at) ||
+    a.id - b.id
+  );
+
+// 새로 받은 거래 내역을 id 기준으로 합침 (같은 id 는 새 값으로 교체)
+// 페이지를 받는 사이 수정으로 다른 페이지로 옮겨간 행이 두 번 보이지 않도록 함
+const mergeTransactions = (current: Transaction[], incoming: Transaction[]) => {
+  const incomingIds = new Set(incoming.map((t) => t.id));
+  return sortTransactions([...current.filter((t) => !incomingIds.has(t.id)), ...incoming]);
+};
+
 const Dashboard: React.FC = () => {
   const [username, setUsername] = useState('');
   const [isAdmin, setIsAdmin] = useState(false);
   const [activeMenu, setActiveMenu] = useState<string>('dashboard');
   const [isSettingsHovered, setIsSettingsHovered] = useState(false);
   const [users, setUsers] = useState<User[]>([]);
+  const [userSearch, setUserSearch] = useState('');
+  const [userCursor, setUserCursor] = useState<string | null>(null);
+  const [usersLoadingMore, setUsersLoadingMore] = useState(false);
   const [categories, setCategories] = useState<Category[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -546,6 +612,10 @@ const Dashboard: React.FC = () => {
     remark: ''
   });
   const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [transactionCursor, setTransactionCursor] = useState<string | null>(null);
+  const [transactionsLoadingMore, setTransactionsLoadingMore] = useState(false);
+  // transaction_sync 의 since 로 쓸 마지막 동기화 버전
+  const syncVersionRef = useRef<number | null>(null);
   const [selectedTransactions, setSelectedTransactions] = useState<number[]>([]);
   const [isTransactionModalOpen, setIsTransactionModalOpen] = useState(false);
   const [selectedTransaction, setSelectedTransaction] = useState<Transaction | null>(null);
@@ -593,25 +663,34 @@ const Dashboard: React.FC = () => {
     navigate('/login');
   };
 
-  const fetchUsers = async () => {
-    setLoading(true);
+  // cursor 가 있으면 다음 페이지를 이어 붙이고, 없으면 첫 페이지부터 다시 조회
+  const fetchUsers = async (cursor: string | null = null, query: string = userSearch) => {
+    if (cursor) {
+      setUsersLoadingMore(true);
+    } else {
+      setLoading(true);
+    }
     setError(null);
     
     try {
       // axios 기본 설정으로 쿠키 포함
       axios.defaults.withCredentials = true;
       
+      const params: Record<string, string> = { limit: String(USER_PAGE_SIZE), stats: '1' };
+      if (cursor) params.cursor = cursor;
+      if (query.trim()) params.q = query.trim();
+      
       const response = await axios.get('http://localhost:8000/api/auth/users/', {
+        params,
         withCredentials: true,
         headers: {
           'Content-Type': 'application/json',
         }
       });
       
-      console.log('API Response:', response.data); // 디버깅용
-      
       if (response.data.status === 'success') {
-        setUsers(response.data.users);
+        setUsers(prev => cursor ? [...prev, ...response.data.users] : response.data.users);
+        setUserCursor(response.data.next_cursor);
       }
     } catch (err: any) {
       console.error('API Error:', err); // 디버깅용
@@ -627,9 +706,15 @@ const Dashboard: React.FC = () => {
       }
     } finally {
       setLoading(false);
+      setUsersLoadingMore(false);
     }
   };
 
+  const handleUserSearch = (e: React.FormEvent) => {
+    e.preventDefault();
+    fetchUsers(null, userSearch);
+  };
+
   const fetchCategories = async () => {
     setLoading(true);
     try {
@@ -655,10 +740,20 @@ const Dashboard: React.FC = () => {
     }
   };
 
-  const fetchTransactions = async () => {
-    setLoading(true);
+  // cursor 가 있으면 다음 페이지를 이어 붙이고, 없으면 첫 페이지부터 다시 조회
+  const fetchTransactions = async (cursor: string | null = null) => {
+    if (cursor) {
+      setTransactionsLoadingMore(true);
+    } else {
+      setLoading(true);
+    }
     try {
-      const response = await fetch('http://localhost:8000/api/auth/api/transactions/', {
+      const params = new URLSearchParams({ limit: String(TRANSACTION_PAGE_SIZE) });
+      if (cursor) {
+        params.set('cursor', cursor);
+      }
+
+      const response = await fetch(`http://localhost:8000/api/auth/api/transactions/?${params}`, {
         method: 'GET',
         credentials: 'include',
         headers: {
@@ -667,16 +762,61 @@ const Dashboard: React.FC = () => {
       });
 
       const data = await response.json();
-      
-      if (data.status === 'success') {
-        setTransactions(data.transactions);
-      } else {
+
+      if (data.status !== 'success') {
         setError(data.message || '거래 내역을 불러오는데 실패했습니다.');
+        return;
+      }
+
+      if (cursor) {
+        setTransactions((prev) => mergeTransactions(prev, data.transactions));
+      } else {
+        syncVersionRef.current = data.version;
+        setTransactions(data.transactions);
       }
+      setTransactionCursor(data.next_cursor);
     } catch (error) {
       setError('서버 연결에 실패했습니다.');
     } finally {
       setLoading(false);
+      setTransactionsLoadingMore(false);
+    }
+  };
+
+  // 마지막 동기화 이후 변경분만 받아 목록에 반영
+  const syncTransactions = async () => {
+    if (syncVersionRef.current === null) {
+      await fetchTransactions();
+      return;
+    }
+
+    try {
+      const response = await fetch(
+        `http://localhost:8000/api/auth/api/transactions/sync/?since=${syncVersionRef.current}`,
+        {
+          method: 'GET',
+          credentials: 'include',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+        }
+      );
+
+      const data = await response.json();
+
+      if (data.status !== 'success') {
+        setError(data.message || '거래 내역을 불러오는데 실패했습니다.');
+        return;
+      }
+
+      const deleted = new Set<number>(data.deleted_ids);
+      setTransactions((prev) => mergeTransactions(
+        prev.filter((t) => !deleted.has(t.id)),
+        data.transactions
+      ));
+      syncVersionRef.current = data.version;
+    } catch (error) {
+      setError('서버 연결에 실패했습니다.');
     }
   };
 
@@ -754,7 +894,8 @@ const Dashboard: React.FC = () => {
       if (response.data.status === 'success') {
         // 사용자 목록 업데이트
         setUsers(prev => prev.map(user => 
-          user.id === selectedUser.id ? response.data.user : user
+          // 수정 응답에는 거래 수/최근 활동이 없으므로 기존 값 유지
+          user.id === selectedUser.id ? { ...user, ...response.data.user } : user
         ));
         handleCloseModal();
         alert('사용자 정보가 수정되었습니다.');
@@ -972,7 +1113,7 @@ const Dashboard: React.FC = () => {
       
       if (data.status === 'success') {
         closeTransactionModal();
-        fetchTransactions(); // 목록 새로고침
+        syncTransactions(); // 변경분만 반영
         alert(selectedTransaction ? '거래 내역이 수정되었습니다.' : '거래 내역이 추가되었습니다.');
       } else {
         setError(data.message || '거래 내역 저장에 실패했습니다.');
@@ -999,7 +1140,7 @@ const Dashboard: React.FC = () => {
       const data = await response.json();
       
       if (data.status === 'success') {
-        fetchTransactions(); // 목록 새로고침
+        syncTransactions(); // 변경분만 반영
         alert('거래 내역이 삭제되었습니다.');
       } else {
         setError(data.message || '거래 내역 삭제에 실패했습니다.');
@@ -1033,7 +1174,7 @@ const Dashboard: React.FC = () => {
       
       if (data.status === 'success') {
         setSelectedTransactions([]);
-        fetchTransactions(); // 목록 새로고침
+        syncTransactions(); // 변경분만 반영
         alert(`${data.deleted_count}개의 거래 내역이 삭제되었습니다.`);
       } else {
         setError(data.message || '거래 내역 삭제에 실패했습니다.');
@@ -1067,6 +1208,16 @@ const Dashboard: React.FC = () => {
         <h2>👥 유저 관리</h2>
         <p>시스템에 등록된 모든 사용자를 관리할 수 있습니다. 사용자를 클릭하면 수정할 수 있습니다.</p>
         
+        <UserSearchBar onSubmit={handleUserSearch}>
+          <input
+            type="text"
+            placeholder="사용자명 또는 이메일 앞부분으로 검색"
+            value={userSearch}
+            onChange={(e) => setUserSearch(e.target.value)}
+          />
+          <button type="submit">검색</button>
+        </UserSearchBar>
+        
         {error && <ErrorMessage>{error}</ErrorMessage>}
         
         {loading ? (
@@ -1082,6 +1233,8 @@ const Dashboard: React.FC = () => {
                 <TableHeader>상태</TableHeader>
                 <TableHeader>가입일</TableHeader>
                 <TableHeader>최근 로그인</TableHeader>
+                <TableHeader>거래 수</TableHeader>
+                <TableHeader>최근 활동</TableHeader>
               </tr>
             </thead>
             <tbody>
@@ -1102,12 +1255,20 @@ const Dashboard: React.FC = () => {
                   </TableCell>
                   <TableCell>{user.date_joined}</TableCell>
                   <TableCell>{user.last_login}</TableCell>
+                  <TableCell>{user.transaction_count ?? '-'}</TableCell>
+                  <TableCell>{user.last_activity ?? '-'}</TableCell>
                 </ClickableTableRow>
               ))}
             </tbody>
           </UserTable>
         )}
         
+        {!loading && userCursor && (
+          <LoadMoreButton onClick={() => fetchUsers(userCursor)} disabled={usersLoadingMore}>
+            {usersLoadingMore ? '불러오는 중...' : '더 보기'}
+          </LoadMoreButton>
+        )}
+        
         {!loading && users.length === 0 && !error && (
           <LoadingMessage>등록된 사용자가 없습니다.</LoadingMessage>
         )}
@@ -1288,6 +1449,15 @@ const Dashboard: React.FC = () => {
             </tbody>
           </Table>
         )}
+        
+        {!loading && transactionCursor && (
+          <LoadMoreButton
+            onClick={() => fetchTransactions(transactionCursor)}
+            disabled={transactionsLoadingMore}
+          >
+            {transactionsLoadingMore ? '불러오는 중...' : '더 보기'}
+          </LoadMoreButton>
+        )}
       </ContentArea>
     );
   };
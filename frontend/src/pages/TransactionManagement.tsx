@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import styled from '@emotion/styled';
 
 const Container = styled.div`
@@ -204,6 +204,33 @@ const ErrorMessage = styled.div`
   border: 1px solid #f5c6cb;
 `;
 
+const FilterBar = styled.form`
+  display: flex;
+  flex-wrap: wrap;
+  gap: 0.5rem;
+  align-items: center;
+  background: white;
+  padding: 1rem;
+  border-radius: 8px;
+  box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+  margin-bottom: 1rem;
+
+  input, select {
+    padding: 0.5rem;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    font-size: 0.9rem;
+  }
+
+  button {
+    padding: 0.5rem 1rem;
+    border: none;
+    border-radius: 4px;
+    cursor: pointer;
+    font-weight: bold;
+  }
+`;
+
 const LoadingMessage = styled.div`
   text-align: center;
   padding: 2rem;
@@ -236,8 +263,48 @@ interface Category {
   created_at: string;
 }
 
+// 거래 내역 한 페이지 크기
+const TRANSACTION_PAGE_SIZE = 200;
+
+// 목록 조회 조건 (transaction_list 쿼리 파라미터)
+interface TransactionFilters {
+  start_date: string;
+  end_date: string;
+  category_id: string;
+  transaction_type: string;
+  q: string;
+  sort: string;
+}
+
+const EMPTY_FILTERS: TransactionFilters = {
+  start_date: '',
+  end_date: '',
+  category_id: '',
+  transaction_type: '',
+  q: '',
+  sort: 'date'
+};
+
+const hasActiveFilters = (filters: TransactionFilters) =>
+  (Object.keys(EMPTY_FILTERS) as (keyof TransactionFilters)[]).some(
+    (key) => filters[key] !== EMPTY_FILTERS[key]
+  );
+
+// 서버 정렬 순서(거래일 내림차순, 생성일 내림차순, id 오름차순)와 동일하게 정렬
+const sortTransactions = (items: Transaction[]) =>
+  [...items].sort((a, b) =>
+    b.transaction_date.localeCompare(a.transaction_date) ||
+    b.created_at.localeCompare(a.created_at) ||
+    a.id - b.id
+  );
+
 const TransactionManagement: React.FC = () => {
   const [transactions, setTransactions] = useState<Transaction[]>([]);
+  // transaction_sync 의 since 로 쓸 마지막 동기화 버전
+  const syncVersionRef = useRef<number | null>(null);
+  // 입력 중인 조회 조건과 마지막으로 적용한 조회 조건
+  const [filters, setFilters] = useState<TransactionFilters>(EMPTY_FILTERS);
+  const appliedFiltersRef = useRef<TransactionFilters>(EMPTY_FILTERS);
   const [categories, setCategories] = useState<Category[]>([]);
   const [selectedTransactions, setSelectedTransactions] = useState<number[]>([]);
   const [isModalOpen, setIsModalOpen] = useState(false);
@@ -258,31 +325,117 @@ const TransactionManagement: React.FC = () => {
     fetchCategories();
   }, []);
 
-  const fetchTransactions = async () => {
+  const fetchTransactions = async (appliedFilters: TransactionFilters = appliedFiltersRef.current) => {
     setLoading(true);
     try {
-      const response = await fetch('http://localhost:8000/api/auth/api/transactions/', {
-        method: 'GET',
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-      });
+      // 커서 페이지네이션으로 한 페이지씩 받아 누적
+      let cursor: string | null = null;
+      let loaded: Transaction[] = [];
+
+      do {
+        const params = new URLSearchParams({ limit: String(TRANSACTION_PAGE_SIZE) });
+        // 필터/정렬/검색은 서버에서 처리
+        Object.entries(appliedFilters).forEach(([key, value]) => {
+          if (value) {
+            params.set(key, value);
+          }
+        });
+        if (cursor) {
+          params.set('cursor', cursor);
+        }
+
+        const response = await fetch(`http://localhost:8000/api/auth/api/transactions/?${params}`, {
+          method: 'GET',
+          credentials: 'include',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+        });
+
+        const data = await response.json();
+
+        if (data.status !== 'success') {
+          setError(data.message || '거래 내역을 불러오는데 실패했습니다.');
+          break;
+        }
+
+        if (!cursor) {
+          syncVersionRef.current = data.version;
+        }
+        loaded = [...loaded, ...data.transactions];
+        setTransactions(loaded);
+        cursor = data.next_cursor;
+      } while (cursor);
+    } catch (error) {
+      setError('서버 연결에 실패했습니다.');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  // 마지막 동기화 이후 변경분만 받아 목록에 반영
+  const syncTransactions = async () => {
+    // 변경분은 조회 조건과 무관하게 오므로 조건이 있으면 다시 조회
+    if (syncVersionRef.current === null || hasActiveFilters(appliedFiltersRef.current)) {
+      await fetchTransactions();
+      return;
+    }
+
+    try {
+      const response = await fetch(
+        `http://localhost:8000/api/auth/api/transactions/sync/?since=${syncVersionRef.current}`,
+        {
+          method: 'GET',
+          credentials: 'include',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+        }
+      );
 
       const data = await response.json();
-      
-      if (data.status === 'success') {
-        setTransactions(data.transactions);
-      } else {
+
+      if (data.status !== 'success') {
         setError(data.message || '거래 내역을 불러오는데 실패했습니다.');
+        return;
       }
+
+      const changed: Transaction[] = data.transactions;
+      const replaced = new Set<number>([...data.deleted_ids, ...changed.map((t) => t.id)]);
+      setTransactions((prev) => sortTransactions([
+        ...prev.filter((t) => !replaced.has(t.id)),
+        ...changed,
+      ]));
+      syncVersionRef.current = data.version;
     } catch (error) {
       setError('서버 연결에 실패했습니다.');
-    } finally {
-      setLoading(false);
     }
   };
 
+  const handleFilterChange = (e: React.ChangeEvent<HTMLInputElement | HTMLSelectElement>) => {
+    const { name, value } = e.target;
+    setFilters(prev => ({
+      ...prev,
+      [name]: value
+    }));
+  };
+
+  const applyFilters = (nextFilters: TransactionFilters) => {
+    appliedFiltersRef.current = nextFilters;
+    setSelectedTransactions([]);
+    fetchTransactions(nextFilters);
+  };
+
+  const handleFilterSubmit = (e: React.FormEvent) => {
+    e.preventDefault();
+    applyFilters(filters);
+  };
+
+  const handleFilterReset = () => {
+    setFilters(EMPTY_FILTERS);
+    applyFilters(EMPTY_FILTERS);
+  };
+
   const fetchCategories = async () => {
     try {
       const response = await fetch('http://localhost:8000/api/auth/categories/', {
@@ -371,7 +524,7 @@ const TransactionManagement: React.FC = () => {
       
       if (data.status === 'success') {
         closeModal();
-        fetchTransactions();
+        syncTransactions();
         alert(selectedTransaction ? '거래 내역이 수정되었습니다.' : '거래 내역이 추가되었습니다.');
       } else {
         setError(data.message || '거래 내역 저장에 실패했습니다.');
@@ -398,7 +551,7 @@ const TransactionManagement: React.FC = () => {
       const data = await response.json();
       
       if (data.status === 'success') {
-        fetchTransactions();
+        syncTransactions();
         alert('거래 내역이 삭제되었습니다.');
       } else {
         setError(data.message || '거래 내역 삭제에 실패했습니다.');
@@ -432,7 +585,7 @@ const TransactionManagement: React.FC = () => {
       
       if (data.status === 'success') {
         setSelectedTransactions([]);
-        fetchTransactions();
+        syncTransactions();
         alert(`${data.deleted_count}개의 거래 내역이 삭제되었습니다.`);
       } else {
         setError(data.message || '거래 내역 삭제에 실패했습니다.');
@@ -477,6 +630,40 @@ const TransactionManagement: React.FC = () => {
       </Header>
       
       {error && <ErrorMessage>{error}</ErrorMessage>}
+
+      <FilterBar onSubmit={handleFilterSubmit}>
+        <input type="date" name="start_date" value={filters.start_date} onChange={handleFilterChange} />
+        ~
+        <input type="date" name="end_date" value={filters.end_date} onChange={handleFilterChange} />
+        <select name="category_id" value={filters.category_id} onChange={handleFilterChange}>
+          <option value="">전체 카테고리</option>
+          {categories.map((category) => (
+            <option key={category.id} value={category.id}>
+              {category.type_display} - {category.name}
+            </option>
+          ))}
+        </select>
+        <select name="transaction_type" value={filters.transaction_type} onChange={handleFilterChange}>
+          <option value="">전체 유형</option>
+          <option value="income">수입</option>
+          <option value="expense">지출</option>
+        </select>
+        <input
+          type="text"
+          name="q"
+          value={filters.q}
+          onChange={handleFilterChange}
+          placeholder="내용/메모 검색"
+        />
+        <select name="sort" value={filters.sort} onChange={handleFilterChange}>
+          <option value="date">최신순</option>
+          <option value="date_asc">오래된순</option>
+          <option value="amount">금액 높은순</option>
+          <option value="amount_asc">금액 낮은순</option>
+        </select>
+        <button type="submit" style={{ backgroundColor: '#007bff', color: 'white' }}>조회</button>
+        <button type="button" onClick={handleFilterReset}>초기화</button>
+      </FilterBar>
       
       {loading ? (
         <LoadingMessage>거래 내역을 불러오는 중...</LoadingMessage>
@@ -25,6 +25,11 @@ def create_env_content():
     config = load_config()
     db = config['database']
     django = config['django']
+    metrics = config.get('metrics') or {}
+    log = config.get('logging') or {}
+    profiling = config.get('profiling') or {}
+    passwords = config.get('passwords') or {}
+    cache = config.get('cache') or {}
     
     env_content = f"""DEBUG={str(django['debug']).upper()}
 DB_NAME={db['name']}
@@ -32,7 +37,50 @@ DB_USER={db['user']}
 DB_PASSWORD={db['password']}
 DB_HOST={db['host']}
 DB_PORT={db['port']}
+DB_CONN_HEALTH_CHECKS={str(db.get('conn_health_checks', True)).upper()}
+DB_POOLER={db.get('pooler') or 'none'}
+DB_REPLICA_HOSTS={','.join(db.get('replica_hosts') or [])}
+DB_REPLICA_STICKY_SECONDS={db.get('replica_sticky_seconds', 5)}
+DB_TRANSACTION_PARTITION_INTERVAL={db.get('transaction_partition_interval', 'month')}
+DB_TRANSACTION_PARTITION_AHEAD={db.get('transaction_partition_ahead', 3)}
+DB_TRANSACTION_PARTITION_RETENTION_MONTHS={db.get('transaction_partition_retention_months', 0)}
 ALLOWED_HOSTS={','.join(django['allowed_hosts'])}
 CORS_ALLOWED_ORIGINS={','.join(django['cors_origins'])}
+SESSION_BACKEND={django.get('session_backend', 'db')}
+SESSION_RENEW_THRESHOLD={django.get('session_renew_threshold', 43200)}
+ASYNC_VIEWS={str(django.get('async_views', False)).upper()}
+CACHE_BACKEND={cache.get('backend') or 'locmem'}
+CACHE_LOCATION={cache.get('location') or 'money-check'}
+METRICS_ENABLED={str(metrics.get('enabled', True)).upper()}
+METRICS_SERVER_TIMING={str(metrics.get('server_timing', False)).upper()}
+METRICS_ALLOWED_IPS={','.join(metrics.get('allowed_ips') or ['127.0.0.1', '::1'])}
+METRICS_TRUSTED_PROXIES={','.join(metrics.get('trusted_proxies') or [])}
+LOG_LEVEL={log.get('level', 'INFO')}
+LOG_LEVELS={','.join(f'{name}={level}' for name, level in (log.get('levels') or {}).items())}
+PROFILING_ENABLED={str(profiling.get('enabled', False)).upper()}
+PROFILING_SAMPLE_RATE={profiling.get('sample_rate', 0)}
+PROFILING_INTERVAL_MS={profiling.get('interval_ms', 5)}
+PROFILING_MAX_PER_MINUTE={profiling.get('max_per_minute', 6)}
+PROFILING_DIR={profiling.get('dir', 'profiles')}
+PROFILING_MAX_FILES={profiling.get('max_files', 500)}
+PASSWORD_HASHER={passwords.get('hasher', 'pbkdf2')}
+PASSWORD_PBKDF2_ITERATIONS={passwords.get('pbkdf2_iterations', 600000)}
+PASSWORD_SCRYPT_WORK_FACTOR={passwords.get('scrypt_work_factor', 16384)}
+PASSWORD_HASH_QUEUE={passwords.get('hash_queue', 16)}
+PASSWORD_HASH_QUEUE_TIMEOUT={passwords.get('hash_queue_timeout', 0.5)}
+LOGIN_THROTTLE_WINDOW={passwords.get('throttle_window', 60)}
+LOGIN_THROTTLE_PER_IP={passwords.get('throttle_per_ip', 30)}
+LOGIN_THROTTLE_PER_USERNAME={passwords.get('throttle_per_username', 10)}
 """
+    # 비워두면 settings.py 의 기본값(ASYNC_VIEWS 에 따라 60 또는 0) 사용
+    if db.get('conn_max_age') is not None:
+        env_content += f"DB_CONN_MAX_AGE={db['conn_max_age']}\n"
+    # 비워두면 settings.py 의 기본값(CPU 수의 절반) 사용
+    if passwords.get('hash_workers') is not None:
+        env_content += f"PASSWORD_HASH_WORKERS={passwords['hash_workers']}\n"
+    # 비워두면 settings.py 의 기본값(캐시 백엔드에 따라 다름) 사용
+    if cache.get('category_timeout') is not None:
+        env_content += f"CATEGORY_CACHE_TIMEOUT={cache['category_timeout']}\n"
+    if cache.get('auth_user_timeout') is not None:
+        env_content += f"AUTH_USER_CACHE_TIMEOUT={cache['auth_user_timeout']}\n"
     return env_content 
\ No newline at end of file